@@ -33,6 +33,11 @@ from .citation_manager import Citation, CitationManager
 from .claude_client import ClaudeClient, get_claude_client
 from .connection_pool import ConnectionPool, ConnectionPoolStats, create_connection_pool
 from .content_extractor import ContentExtractor, ExtractedContent
+from .context_packer import ContextPacker, PackedContext, estimate_tokens
+from .description_cache import DescriptionCache
+from .html_text import HTMLTextExtractor
+from .http_cache import CachedResponse, HTTPCache
+from .keyword_engine import CorpusKeywords, extract_corpus_keywords
 from .logging_config import LogConfig, get_logger, setup_logging
 from .metrics import (
     Counter,
@@ -41,6 +46,8 @@ from .metrics import (
     MetricsCollector,
     get_metrics_collector,
 )
+from .near_duplicates import NearDuplicateDetector, find_near_duplicates
+from .passage_index import Passage, PassageIndex
 from .progress import (
     ProgressReporter,
     SilentProgressReporter,
@@ -53,6 +60,7 @@ from .rate_limiter import (
     RateLimiter,
     get_global_rate_limiter,
 )
+from .redundancy import find_similar_groups
 from .retry import (
     APIServerException,
     APITimeoutException,
@@ -64,6 +72,7 @@ from .retry import (
     async_retry_with_backoff,
     retry_with_backoff,
 )
+from .search_cache import SearchCache, SQLiteSearchCache
 from .secure_config import (
     EnvironmentConfig,
     SecureConfigLoader,
@@ -89,6 +98,7 @@ __all__ = [
     "AsyncGeminiClient",
     # Async Workflow
     "AsyncWorkflowExecutor",
+    "CachedResponse",
     "Citation",
     # Citation Management
     "CitationManager",
@@ -99,10 +109,18 @@ __all__ = [
     "ConnectionPoolStats",
     # Content Extraction
     "ContentExtractor",
+    # Context Packing
+    "ContextPacker",
+    "CorpusKeywords",
     "Counter",
+    # Description Cache
+    "DescriptionCache",
     "EnvironmentConfig",
     "ExtractedContent",
     "Gauge",
+    "HTMLTextExtractor",
+    # HTTP Cache
+    "HTTPCache",
     "Histogram",
     # Logging
     "LogConfig",
@@ -110,7 +128,13 @@ __all__ = [
     # Metrics
     "MetricsCollector",
     "MockSearchEngine",
+    # Near-Duplicate Detection
+    "NearDuplicateDetector",
     "NetworkException",
+    "PackedContext",
+    # Passage Retrieval
+    "Passage",
+    "PassageIndex",
     # Progress
     "ProgressReporter",
     "RateLimitConfig",
@@ -121,6 +145,9 @@ __all__ = [
     "RetryConfig",
     "RetryExhaustedError",
     "RetryPresets",
+    "SQLiteSearchCache",
+    # Search Cache
+    "SearchCache",
     "SearchResult",
     # Secure Configuration
     "SecureConfigLoader",
@@ -137,6 +164,10 @@ __all__ = [
     "async_retry_with_backoff",
     "create_connection_pool",
     "create_progress_reporter",
+    "estimate_tokens",
+    "extract_corpus_keywords",
+    "find_near_duplicates",
+    "find_similar_groups",
     "get_async_claude_client",
     "get_async_gemini_client",
     "get_claude_client",
@@ -337,6 +337,68 @@ TEXT RULES:
         except (KeyError, IndexError, ValueError) as e:
             raise ValueError(f"Failed to extract image from response: {e}")
 
+    async def generate_text(
+        self,
+        parts: list[dict[str, Any]],
+        model: str | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        """
+        Generate a text response from multimodal parts (async).
+
+        Used for vision analysis (e.g., slide validation) so those calls share
+        this client's connection pool, retries and rate limiting.
+
+        Args:
+            parts: Gemini content parts, e.g. {"text": ...} or
+                   {"inlineData": {"mimeType": ..., "data": <base64>}}
+            model: Model to use (defaults to the client's model)
+            temperature: Optional sampling temperature
+
+        Returns:
+            Concatenated text of the first candidate
+
+        Raises:
+            ValueError: If the response contains no text
+            httpx.HTTPError: On API request failure
+
+        Example:
+            >>> text = await client.generate_text(
+            ...     [{"text": "Describe this slide"}],
+            ...     model="gemini-2.0-flash-exp",
+            ... )
+        """
+        generation_config: dict[str, Any] = {"responseModalities": ["TEXT"]}
+        if temperature is not None:
+            generation_config["temperature"] = temperature
+
+        payload = {
+            "contents": [{"role": "user", "parts": parts}],
+            "generationConfig": generation_config,
+        }
+
+        endpoint = f"models/{model or self.model}:generateContent"
+        params = {"key": self.api_key}
+
+        response = await self._retry_request(
+            "POST",
+            endpoint,
+            params=params,
+            json=payload,
+        )
+
+        result = response.json()
+
+        candidates = result.get("candidates", [])
+        if not candidates:
+            raise ValueError("No text generated in response")
+
+        parts_out = candidates[0].get("content", {}).get("parts", [])
+        text = "".join(part.get("text", "") for part in parts_out)
+        if not text:
+            raise ValueError("No text found in response")
+        return text
+
     async def generate_image_from_spec(self, spec: ImageSpec) -> bytes:
         """
         Generate image from an ImageSpec object.
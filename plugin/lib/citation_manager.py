@@ -2,12 +2,102 @@
 Citation management for presentation generation.
 
 Handles citation formatting, tracking, and bibliography generation.
+
+Usage is indexed per citation and per slide as it is tracked, and formatted
+strings are memoized per (citation, style), so per-slide queries and
+bibliographies for decks with hundreds of sources never rescan or reformat
+everything.
+
+Citations are also indexed by normalized URL, DOI and (per site and author)
+title fingerprint, so adding or importing a source that is already cited
+returns the existing citation instead of a duplicate.
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Any
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+
+# DOI as it appears in doi.org or publisher URLs
+DOI_RE = re.compile(r"\b10\.\d{4,9}/[^\s?#]+", re.IGNORECASE)
+
+# Query parameters that only track the referrer (dropped from URL keys)
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+
+# Shorter titles ("Home", "About us") are too generic to identify a source
+MIN_TITLE_WORDS = 3
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for citation deduplication.
+
+    Scheme, "www.", trailing slashes, fragments and tracking parameters
+    (utm_*, fbclid, ...) are ignored; remaining query parameters are sorted.
+
+    Args:
+        url: Source URL
+
+    Returns:
+        Normalized URL ("" if empty)
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    path = parts.path.rstrip("/")
+    params = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    query = f"?{urlencode(params)}" if params else ""
+    return f"{host}{path}{query}"
+
+
+def extract_doi(url: str) -> str | None:
+    """
+    Extract a DOI from a URL.
+
+    Args:
+        url: Source URL (e.g. https://doi.org/10.1000/xyz123)
+
+    Returns:
+        Lowercased DOI, or None if the URL contains none
+    """
+    match = DOI_RE.search(unquote(url))
+    return match.group(0).rstrip("/.").lower() if match else None
+
+
+def same_source_url(url_a: str, url_b: str) -> bool:
+    """
+    Check whether two URLs point at the same source.
+
+    Args:
+        url_a: First source URL
+        url_b: Second source URL
+
+    Returns:
+        True if the URLs share a DOI or normalize to the same URL
+    """
+    doi = extract_doi(url_a)
+    if doi is not None and doi == extract_doi(url_b):
+        return True
+    normalized = normalize_url(url_a)
+    return bool(normalized) and normalized == normalize_url(url_b)
+
+
+def title_fingerprint(title: str) -> str:
+    """
+    Fingerprint a title (case, punctuation and spacing ignored).
+
+    Args:
+        title: Source title
+
+    Returns:
+        Case-folded words joined by single spaces
+    """
+    return " ".join(re.findall(r"\w+", title.casefold()))
 
 
 @dataclass
@@ -44,20 +134,47 @@ class CitationManager:
     Supports APA, MLA, and Chicago citation formats.
     Tracks citation usage across slides.
     Generates formatted bibliographies.
+
+    Formatted citations are cached; edit citations through update_citation()
+    (or re-import them) so the cache is invalidated.
+
+    Duplicate sources (same normalized URL, same DOI, or same title by the
+    same author on the same site) are merged into the first citation:
+    add_citation() returns its ID and fills in any fields it was missing.
+    A shared title alone never merges sources; sites reuse generic titles
+    across distinct pages.
     """
 
-    def __init__(self, default_format: str = "APA"):
+    # Formatter method per (upper-cased) citation style
+    FORMATTERS = {
+        "APA": "_format_apa",
+        "MLA": "_format_mla",
+        "CHICAGO": "_format_chicago",
+    }
+
+    def __init__(self, default_format: str = "APA", deduplicate: bool = True):
         """
         Initialize citation manager.
 
         Args:
             default_format: Default citation format (APA, MLA, Chicago)
+            deduplicate: Merge duplicate sources into existing citations
         """
         self.default_format = default_format
+        self.deduplicate = deduplicate
         self.citations: dict[str, Citation] = {}
         self.usage: list[CitationUsage] = []
         self._id_counter = 0
 
+        # Usage indexes (kept in step with self.usage) and formatting cache
+        self._usage_by_citation: dict[str, list[CitationUsage]] = {}
+        self._citations_by_slide: dict[int, dict[str, None]] = {}
+        self._indexed_usage = 0
+        self._formatted: dict[tuple[str, str], str] = {}
+
+        # Dedup keys ("url:", "doi:", "title:") -> citation ID
+        self._dedup_index: dict[str, str] = {}
+
     def add_citation(
         self,
         title: str,
@@ -69,6 +186,10 @@ class CitationManager:
         """
         Add a citation source.
 
+        If the source is already cited (see find_duplicate()), no citation is
+        added: the existing citation's ID is returned and any of author,
+        publication_date and publisher it lacks are filled in.
+
         Args:
             title: Source title
             url: Source URL
@@ -79,6 +200,18 @@ class CitationManager:
         Returns:
             Citation ID
         """
+        existing_id = self.find_duplicate(title, url, author)
+        if existing_id is not None:
+            self._merge_into(
+                existing_id,
+                title,
+                url,
+                author=author,
+                publication_date=publication_date,
+                publisher=publisher,
+            )
+            return existing_id
+
         # Generate unique ID
         self._id_counter += 1
         citation_id = f"cite-{self._id_counter:03d}"
@@ -93,8 +226,111 @@ class CitationManager:
         )
 
         self.citations[citation_id] = citation
+        self._index_keys(citation_id, self._dedup_keys(title, url, author))
         return citation_id
 
+    def find_duplicate(
+        self, title: str, url: str, author: str | None = None
+    ) -> str | None:
+        """
+        Find an existing citation for the same source.
+
+        Sources match by DOI (in the URL), by normalized URL, or by title
+        fingerprint (at least MIN_TITLE_WORDS words) together with the same
+        author on the same site. Without an author, titles never match.
+
+        Args:
+            title: Source title
+            url: Source URL
+            author: Source author
+
+        Returns:
+            Existing citation ID, or None (always None if deduplicate is off)
+        """
+        if not self.deduplicate:
+            return None
+
+        for key in self._dedup_keys(title, url, author):
+            citation_id = self._dedup_index.get(key)
+            if citation_id is not None:
+                return citation_id
+        return None
+
+    def update_citation(self, citation_id: str, **changes: Any) -> None:
+        """
+        Edit citation fields and invalidate its formatted strings.
+
+        Args:
+            citation_id: Citation ID
+            **changes: New values for title, url, author, publication_date,
+                       access_date or publisher
+        """
+        if citation_id not in self.citations:
+            raise ValueError(f"Citation {citation_id} not found")
+
+        editable = {f.name for f in fields(Citation)} - {"citation_id"}
+        unknown = set(changes) - editable
+        if unknown:
+            raise ValueError(f"Unknown citation fields: {', '.join(sorted(unknown))}")
+
+        citation = self.citations[citation_id]
+        self._unindex_keys(citation_id, self._citation_keys(citation))
+        for name, value in changes.items():
+            setattr(citation, name, value)
+        self._index_keys(citation_id, self._citation_keys(citation))
+        self._invalidate(citation_id)
+
+    @staticmethod
+    def _dedup_keys(title: str, url: str, author: str | None = None) -> list[str]:
+        """Dedup index keys for a source, strongest first."""
+        keys = []
+        doi = extract_doi(url or "")
+        if doi:
+            keys.append(f"doi:{doi}")
+
+        normalized = normalize_url(url or "")
+        if normalized:
+            keys.append(f"url:{normalized}")
+
+        host = urlsplit((url or "").strip()).netloc.lower().removeprefix("www.")
+        fingerprint = title_fingerprint(title or "")
+        author_fingerprint = title_fingerprint(author or "")
+        if host and author_fingerprint and len(fingerprint.split()) >= MIN_TITLE_WORDS:
+            keys.append(f"title:{host}|{author_fingerprint}|{fingerprint}")
+        return keys
+
+    @classmethod
+    def _citation_keys(cls, citation: Citation) -> list[str]:
+        """Dedup index keys for a stored citation."""
+        return cls._dedup_keys(citation.title, citation.url, citation.author)
+
+    def _index_keys(self, citation_id: str, keys: list[str]) -> None:
+        """Point dedup keys not yet taken at a citation."""
+        for key in keys:
+            self._dedup_index.setdefault(key, citation_id)
+
+    def _unindex_keys(self, citation_id: str, keys: list[str]) -> None:
+        """Remove dedup keys pointing at a citation."""
+        for key in keys:
+            if self._dedup_index.get(key) == citation_id:
+                del self._dedup_index[key]
+
+    def _merge_into(
+        self, citation_id: str, title: str, url: str, **values: Any
+    ) -> None:
+        """Fill a citation's missing fields from a duplicate and index its keys."""
+        citation = self.citations[citation_id]
+        missing = {
+            name: value
+            for name, value in values.items()
+            if value and not getattr(citation, name)
+        }
+        if missing:
+            self.update_citation(citation_id, **missing)
+
+        # A duplicate found by DOI or title may arrive under another URL
+        self._index_keys(citation_id, self._dedup_keys(title, url, citation.author))
+
     def track_usage(self, citation_id: str, slide_number: int, context: str) -> None:
         """
         Track where a citation is used.
@@ -111,6 +347,7 @@ class CitationManager:
             citation_id=citation_id, slide_number=slide_number, context=context
         )
         self.usage.append(usage)
+        self._sync_usage_index()
 
     def format_citation(self, citation_id: str, style: str | None = None) -> str:
         """
@@ -126,17 +363,53 @@ class CitationManager:
         if citation_id not in self.citations:
             raise ValueError(f"Citation {citation_id} not found")
 
-        citation = self.citations[citation_id]
-        style = style or self.default_format
+        return self._format_cached(citation_id, self._style_key(style))
 
-        if style.upper() == "APA":
-            return self._format_apa(citation)
-        elif style.upper() == "MLA":
-            return self._format_mla(citation)
-        elif style.upper() == "CHICAGO":
-            return self._format_chicago(citation)
-        else:
+    def format_all(
+        self, citation_ids: list[str] | None = None, style: str | None = None
+    ) -> dict[str, str]:
+        """
+        Format many citations at once.
+
+        Args:
+            citation_ids: Citation IDs to format (all if None); unknown IDs
+                          are skipped
+            style: Citation style (APA, MLA, Chicago), uses default if None
+
+        Returns:
+            Formatted citation strings by citation ID, in the order given
+        """
+        style_key = self._style_key(style)
+        if citation_ids is None:
+            citation_ids = list(self.citations)
+
+        return {
+            cid: self._format_cached(cid, style_key)
+            for cid in citation_ids
+            if cid in self.citations
+        }
+
+    def _style_key(self, style: str | None) -> str:
+        """Resolve a style name (default if None) to a FORMATTERS key."""
+        style = style or self.default_format
+        if style.upper() not in self.FORMATTERS:
             raise ValueError(f"Unknown citation style: {style}")
+        return style.upper()
+
+    def _format_cached(self, citation_id: str, style_key: str) -> str:
+        """Format a known citation, reusing the cached string if present."""
+        key = (citation_id, style_key)
+        formatted = self._formatted.get(key)
+        if formatted is None:
+            formatter = getattr(self, self.FORMATTERS[style_key])
+            formatted = formatter(self.citations[citation_id])
+            self._formatted[key] = formatted
+        return formatted
+
+    def _invalidate(self, citation_id: str) -> None:
+        """Drop cached formatted strings for a citation."""
+        for style_key in self.FORMATTERS:
+            self._formatted.pop((citation_id, style_key), None)
 
     def _format_apa(self, citation: Citation) -> str:
         """Format citation in APA style."""
@@ -227,12 +500,10 @@ class CitationManager:
         if citation_ids is None:
             citation_ids = list(self.citations.keys())
 
-        bibliography_lines = ["## References\n"]
+        formatted = self.format_all(sorted(citation_ids), style)
 
-        for cid in sorted(citation_ids):
-            if cid in self.citations:
-                formatted = self.format_citation(cid, style)
-                bibliography_lines.append(f"- {formatted}")
+        bibliography_lines = ["## References\n"]
+        bibliography_lines.extend(f"- {entry}" for entry in formatted.values())
 
         return "\n".join(bibliography_lines)
 
@@ -246,7 +517,8 @@ class CitationManager:
         Returns:
             List of citation usages
         """
-        return [u for u in self.usage if u.citation_id == citation_id]
+        self._sync_usage_index()
+        return list(self._usage_by_citation.get(citation_id, []))
 
     def get_slide_citations(self, slide_number: int) -> list[str]:
         """
@@ -256,12 +528,24 @@ class CitationManager:
             slide_number: Slide number
 
         Returns:
-            List of citation IDs
+            List of citation IDs (unique, in order of first use)
         """
-        citation_ids = [
-            u.citation_id for u in self.usage if u.slide_number == slide_number
-        ]
-        return list(set(citation_ids))  # Remove duplicates
+        self._sync_usage_index()
+        return list(self._citations_by_slide.get(slide_number, {}))
+
+    def _sync_usage_index(self) -> None:
+        """Index usage records added since the last sync (rebuild if removed)."""
+        if len(self.usage) < self._indexed_usage:
+            self._usage_by_citation.clear()
+            self._citations_by_slide.clear()
+            self._indexed_usage = 0
+
+        for usage in self.usage[self._indexed_usage :]:
+            self._usage_by_citation.setdefault(usage.citation_id, []).append(usage)
+            self._citations_by_slide.setdefault(usage.slide_number, {})[
+                usage.citation_id
+            ] = None
+        self._indexed_usage = len(self.usage)
 
     def validate_citations(self) -> list[str]:
         """
@@ -305,15 +589,44 @@ class CitationManager:
             for cid, c in self.citations.items()
         ]
 
-    def import_citations(self, citations_data: list[dict[str, Any]]) -> None:
+    def import_citations(self, citations_data: list[dict[str, Any]]) -> dict[str, str]:
         """
-        Import citations from list of dictionaries.
+        Import citations from list of dictionaries, merging duplicates.
+
+        An entry whose ID already exists replaces that citation. Any other
+        entry duplicating a known source (including one imported earlier in
+        the same list) is merged into it like add_citation() does.
 
         Args:
             citations_data: List of citation data
+
+        Returns:
+            Mapping of each imported ID to the citation ID now holding it
+            (use it to remap usage records of merged citations)
         """
+        id_map = {}
         for data in citations_data:
             citation_id = data.get("id", f"cite-{self._id_counter + 1:03d}")
+
+            if citation_id in self.citations:
+                replaced = self.citations[citation_id]
+                self._unindex_keys(citation_id, self._citation_keys(replaced))
+            else:
+                existing_id = self.find_duplicate(
+                    data["title"], data["url"], data.get("author")
+                )
+                if existing_id is not None:
+                    self._merge_into(
+                        existing_id,
+                        data["title"],
+                        data["url"],
+                        author=data.get("author"),
+                        publication_date=data.get("publication_date"),
+                        publisher=data.get("publisher"),
+                    )
+                    id_map[citation_id] = existing_id
+                    continue
+
             self._id_counter = max(self._id_counter, int(citation_id.split("-")[1]))
 
             citation = Citation(
@@ -326,6 +639,11 @@ class CitationManager:
                 publisher=data.get("publisher"),
             )
             self.citations[citation_id] = citation
+            self._invalidate(citation_id)
+            self._index_keys(citation_id, self._citation_keys(citation))
+            id_map[citation_id] = citation_id
+
+        return id_map
 
     def __repr__(self) -> str:
         """String representation."""
@@ -15,6 +15,7 @@ Uses plain API for:
 import json
 import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from anthropic import Anthropic
@@ -210,6 +211,25 @@ Find authoritative sources, extract key information, and provide a well-cited su
 
                 break
 
+            # Run this turn's searches concurrently (agent issues 3-5 at once)
+            search_uses = [
+                tool_use for tool_use in tool_uses if tool_use.name == "web_search"
+            ]
+            search_outputs = {}
+            if search_function and search_uses:
+                with ThreadPoolExecutor(max_workers=len(search_uses)) as executor:
+                    futures = {
+                        tool_use.id: executor.submit(
+                            search_function,
+                            tool_use.input.get("query", ""),
+                            tool_use.input.get("num_results", 10),
+                        )
+                        for tool_use in search_uses
+                    }
+                    search_outputs = {
+                        tool_id: future.result() for tool_id, future in futures.items()
+                    }
+
             # Execute tool calls
             tool_results = []
 
@@ -220,11 +240,8 @@ Find authoritative sources, extract key information, and provide a well-cited su
                 result = None
 
                 if tool_name == "web_search" and search_function:
-                    # Execute search
-                    query = tool_input.get("query", "")
-                    num_results = tool_input.get("num_results", 10)
-
-                    search_results = search_function(query, num_results)
+                    # Search already executed concurrently above
+                    search_results = search_outputs[tool_use.id]
                     result = json.dumps(search_results)
 
                     # Track sources
@@ -2,12 +2,30 @@
 Content extraction from web pages.
 
 Extracts and cleans text content from URLs.
+
+Several URLs can be fetched and extracted concurrently with
+extract_many()/extract_many_async(), which share one ConnectionPool and
+bound concurrency both overall and per host. With an HTTPCache attached,
+previously fetched pages are revalidated with conditional GETs instead of
+being downloaded again. Fetched pages are parsed incrementally as they
+stream in (see html_text.HTMLTextExtractor), so the raw HTML of a large
+page is never held in memory unless it is being cached.
 """
 
+import asyncio
+import codecs
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
+import httpx
+
+from .connection_pool import ConnectionPool
+from .html_text import HTMLTextExtractor, parse_html
+from .http_cache import CachedResponse, HTTPCache
+from .keyword_engine import tokenize
+
 
 # Import real search data for content lookup
 try:
@@ -46,14 +64,42 @@ class ContentExtractor:
     use libraries like BeautifulSoup, newspaper3k, or readability.
     """
 
-    def __init__(self, min_content_length: int = 100):
+    # User-Agent sent when fetching pages
+    USER_AGENT = "Mozilla/5.0 (compatible; PresentationResearchBot/1.0)"
+
+    def __init__(
+        self,
+        min_content_length: int = 100,
+        *,
+        fetch_remote: bool = False,
+        timeout: float = 15.0,
+        max_concurrent: int = 8,
+        per_host_limit: int = 2,
+        http_cache: HTTPCache | None = None,
+        max_page_bytes: int = 5 * 1024 * 1024,
+    ):
         """
         Initialize content extractor.
 
         Args:
             min_content_length: Minimum content length in characters
+            fetch_remote: Fetch pages over HTTP in extract_many() (default:
+                          False uses cached/mock content, no network)
+            timeout: Per-page fetch timeout in seconds
+            max_concurrent: Maximum pages fetched at once
+            per_host_limit: Maximum concurrent fetches against one host
+            http_cache: Optional response cache; cached pages are served
+                        while fresh and revalidated with If-None-Match /
+                        If-Modified-Since otherwise
+            max_page_bytes: Stop reading a page after this many bytes
         """
         self.min_content_length = min_content_length
+        self.fetch_remote = fetch_remote
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        self.per_host_limit = per_host_limit
+        self.http_cache = http_cache
+        self.max_page_bytes = max_page_bytes
 
     def extract(self, url: str, html_content: str | None = None) -> ExtractedContent:
         """
@@ -73,6 +119,166 @@ class ContentExtractor:
         else:
             return self._create_mock_content(url)
 
+    def extract_many(self, urls: list[str]) -> list[ExtractedContent]:
+        """
+        Extract content from several URLs concurrently.
+
+        Synchronous wrapper around extract_many_async() for callers outside
+        an event loop (e.g., skills).
+
+        Args:
+            urls: URLs to extract from
+
+        Returns:
+            Extracted content in the same order as urls
+        """
+        return asyncio.run(self.extract_many_async(urls))
+
+    async def extract_many_async(self, urls: list[str]) -> list[ExtractedContent]:
+        """
+        Fetch and extract several URLs concurrently.
+
+        With fetch_remote enabled, pages are fetched through one shared
+        ConnectionPool; at most max_concurrent fetches run at once and at
+        most per_host_limit against any single host. Pages that fail,
+        time out or are not HTML fall back to extract(). Total time is
+        roughly that of the slowest fetch rather than the sum.
+
+        Args:
+            urls: URLs to extract from
+
+        Returns:
+            Extracted content in the same order as urls (regardless of
+            completion order)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def extract_one(
+            pool: ConnectionPool | None, url: str
+        ) -> ExtractedContent:
+            host = self._extract_domain(url)
+            host_limit = host_limits.setdefault(
+                host, asyncio.Semaphore(self.per_host_limit)
+            )
+            async with semaphore, host_limit:
+                content = await self._fetch_content(pool, url) if pool else None
+            return content or await asyncio.to_thread(self.extract, url)
+
+        if not self.fetch_remote:
+            return await asyncio.gather(*(extract_one(None, url) for url in urls))
+
+        pool = ConnectionPool(
+            pool_size=self.max_concurrent,
+            timeout=self.timeout,
+            enable_http2=False,
+            headers={"User-Agent": self.USER_AGENT},
+        )
+        async with pool:
+            return await asyncio.gather(*(extract_one(pool, url) for url in urls))
+
+    async def _fetch_content(
+        self, pool: ConnectionPool, url: str
+    ) -> ExtractedContent | None:
+        """
+        Fetch and extract a page, going through the HTTP cache when configured.
+
+        Fresh cache entries are used without a request. Stale entries are
+        revalidated with a conditional GET; a 304 reuses the cached body.
+        If the fetch fails, a stale cached copy is used when present.
+        Compressed transfer (gzip/deflate, and br when brotli is installed)
+        is negotiated and decoded by httpx; the cache stores decoded bodies.
+
+        Args:
+            pool: Initialized ConnectionPool
+            url: URL to fetch
+
+        Returns:
+            Extracted content, or None on error, timeout or non-HTML response
+        """
+        cached = self.http_cache.lookup(url) if self.http_cache else None
+        if cached and cached.is_fresh:
+            self.http_cache.record("fresh_hits")
+            return await self._parse_cached(cached)
+
+        try:
+            return await asyncio.wait_for(
+                self._stream_content(pool, url, cached), timeout=self.timeout
+            )
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            print(f"[EXTRACT] Fetch failed for {url}: {type(e).__name__}")
+            return await self._parse_cached(cached) if cached else None
+
+    async def _stream_content(
+        self, pool: ConnectionPool, url: str, cached: CachedResponse | None
+    ) -> ExtractedContent | None:
+        """
+        Stream a page into an HTMLTextExtractor chunk by chunk.
+
+        Args:
+            pool: Initialized ConnectionPool
+            url: URL to fetch
+            cached: Stale cache entry to revalidate, if any
+
+        Returns:
+            Extracted content, or None for non-HTML responses
+        """
+        headers = cached.conditional_headers() if cached else {}
+        async with pool.stream(
+            "GET", url, headers=headers, follow_redirects=True
+        ) as response:
+            if cached and response.status_code == 304:
+                self.http_cache.touch(url, response.headers)
+                self.http_cache.record("revalidated")
+                return await self._parse_cached(cached)
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            if "html" not in content_type:
+                print(f"[EXTRACT] Skipping non-HTML content for {url}: {content_type}")
+                return None
+
+            try:
+                decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+                    errors="replace"
+                )
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+            parser = HTMLTextExtractor()
+            # Raw body is only kept when it is going to be cached
+            body = bytearray() if self.http_cache else None
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if body is not None:
+                    body.extend(chunk)
+                parser.feed(decoder.decode(chunk))
+                if received >= self.max_page_bytes:
+                    parser.truncated = True
+                    break
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+
+        if self.http_cache:
+            self.http_cache.record("misses", response.num_bytes_downloaded)
+            if not parser.truncated:
+                self.http_cache.store(url, bytes(body), response.headers)
+        return self._build_content(url, parser)
+
+    async def _parse_cached(self, cached: CachedResponse) -> ExtractedContent:
+        """Extract content from a cached response body."""
+        return await asyncio.to_thread(
+            self._parse_html, cached.url, self._decode_cached(cached)
+        )
+
+    @staticmethod
+    def _decode_cached(cached: CachedResponse) -> str:
+        """Decode a cached body using the charset from its content type."""
+        return httpx.Response(
+            200, content=cached.body, headers={"content-type": cached.content_type}
+        ).text
+
     def _create_mock_content(self, url: str) -> ExtractedContent:
         """
         Create mock extracted content for development.
@@ -128,54 +334,40 @@ class ContentExtractor:
         Returns:
             Extracted content
         """
-        # Simple HTML parsing (replace with BeautifulSoup in production)
-        title = self._extract_title(html_content)
-        content = self._extract_text(html_content)
-        author = self._extract_author(html_content)
-
-        return ExtractedContent(
-            url=url, title=title or "Untitled", content=content, author=author
-        )
-
-    def _extract_title(self, html: str) -> str | None:
-        """Extract title from HTML."""
-        match = re.search(r"<title>(.*?)</title>", html, re.IGNORECASE)
-        if match:
-            return self._clean_text(match.group(1))
-        return None
-
-    def _extract_text(self, html: str) -> str:
-        """Extract text from HTML."""
-        # Remove script and style tags
-        text = re.sub(
-            r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-        text = re.sub(
-            r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE
-        )
-
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", text)
+        return self._build_content(url, parse_html(html_content))
 
-        # Clean up whitespace
-        text = self._clean_text(text)
-
-        return text
+    def _build_content(self, url: str, parser: HTMLTextExtractor) -> ExtractedContent:
+        """
+        Build extracted content from a closed HTMLTextExtractor.
 
-    def _extract_author(self, html: str) -> str | None:
-        """Extract author from HTML."""
-        # Simple pattern matching (improve in production)
-        patterns = [
-            r'<meta\s+name=["\']author["\']\s+content=["\'](.*?)["\']',
-            r"by\s+([A-Z][a-z]+\s+[A-Z][a-z]+)",
-        ]
+        Args:
+            url: URL
+            parser: Parser that has consumed the page
 
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        Returns:
+            Extracted content
+        """
+        content = parser.text
+        author = parser.author
+        if author is None:
+            # Fall back to a "By First Last" byline in the text
+            match = re.search(r"(?i:\bby)\s+([A-Z][a-z]+\s+[A-Z][a-z]+)", content)
+            author = match.group(1) if match else None
+
+        metadata: dict[str, Any] = {}
+        if parser.meta:
+            metadata["meta"] = parser.meta
+        if parser.truncated:
+            metadata["truncated"] = True
 
-        return None
+        return ExtractedContent(
+            url=url,
+            title=parser.title or "Untitled",
+            content=content,
+            author=author,
+            publication_date=parser.meta.get("article:published_time"),
+            metadata=metadata,
+        )
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -184,21 +376,6 @@ class ContentExtractor:
             return match.group(1)
         return "unknown"
 
-    def _clean_text(self, text: str) -> str:
-        """Clean extracted text."""
-        # Decode HTML entities
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
-        text = text.replace("&#39;", "'")
-
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-
-        return text
-
     def summarize(self, content: str, max_sentences: int = 3) -> str:
         """
         Create simple summary of content.
@@ -227,6 +404,9 @@ class ContentExtractor:
         """
         Extract keywords from content.
 
+        Ranks by raw frequency within this one text; use
+        keyword_engine.extract_corpus_keywords() to rank across sources.
+
         Args:
             content: Content text
             top_n: Number of top keywords
@@ -234,70 +414,8 @@ class ContentExtractor:
         Returns:
             List of keywords
         """
-        # Simple keyword extraction (improve with NLP in production)
-        # Remove common words
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "as",
-            "is",
-            "was",
-            "are",
-            "were",
-            "been",
-            "be",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-            "it",
-            "its",
-            "they",
-            "their",
-            "them",
-        }
-
-        # Extract words
-        words = re.findall(r"\b[a-z]{3,}\b", content.lower())
-
-        # Count word frequency
-        word_freq: dict[str, int] = {}
-        for word in words:
-            if word not in stop_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-
-        # Sort by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-
-        # Return top N
-        return [word for word, _ in sorted_words[:top_n]]
+        # Most frequent non-stop words (ties keep first-seen order)
+        return [word for word, _ in Counter(tokenize(content)).most_common(top_n)]
 
     def validate_content(self, content: ExtractedContent) -> list[str]:
         """
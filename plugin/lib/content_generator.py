@@ -8,11 +8,16 @@ Uses Claude API to generate:
 - Graphics descriptions for image generation
 
 All output follows pres-template.md format.
+
+Research context is retrieved per slide: a PassageIndex is built once per
+research run and each slide's prompts receive only the passages most
+relevant to that slide.
 """
 
 from typing import Any
 
 from plugin.lib.claude_client import get_claude_client
+from plugin.lib.passage_index import Passage, PassageIndex
 
 
 class ContentGenerator:
@@ -22,6 +27,10 @@ class ContentGenerator:
     Produces markdown-formatted slides following pres-template.md structure.
     """
 
+    # Research passages retrieved per prompt
+    BULLET_PASSAGES = 4
+    NOTES_PASSAGES = 2
+
     def __init__(self, style_guide: dict[str, Any] | None = None):
         """
         Initialize content generator.
@@ -31,6 +40,52 @@ class ContentGenerator:
         """
         self.client = get_claude_client()
         self.style_guide = style_guide or self._default_style_guide()
+        self._passage_index: PassageIndex | None = None
+
+    def get_passage_index(self, research_context: dict[str, Any]) -> PassageIndex:
+        """
+        Get the passage index for research, building it on first use.
+
+        The index is rebuilt only when a different sources list is passed,
+        so all slides of a run share one index.
+
+        Args:
+            research_context: Research data with sources
+
+        Returns:
+            PassageIndex over the research sources
+        """
+        sources = research_context.get("sources", [])
+        if self._passage_index is None or self._passage_index.sources is not sources:
+            self._passage_index = PassageIndex(sources)
+        return self._passage_index
+
+    def _retrieve_passages(
+        self,
+        research_context: dict[str, Any],
+        query: str,
+        k: int,
+        source_indices: set[int] | None = None,
+    ) -> list[Passage]:
+        """
+        Retrieve the passages most relevant to a slide.
+
+        Falls back to the opening passages of the candidate sources when the
+        query matches nothing.
+
+        Args:
+            research_context: Research data with sources
+            query: Slide text to match
+            k: Maximum passages
+            source_indices: Restrict to these sources
+
+        Returns:
+            Retrieved passages
+        """
+        index = self.get_passage_index(research_context)
+        return index.search(query, k, source_indices) or index.leading(
+            k, source_indices
+        )
 
     def _default_style_guide(self) -> dict[str, Any]:
         """Default style guide if none provided."""
@@ -123,35 +178,42 @@ Audience: {self.style_guide["audience"]}"""
         key_points = slide.get("key_points", [])
         supporting_sources = slide.get("supporting_sources", [])
 
-        # Build research context with more detail
+        # Retrieve research passages relevant to this slide, preferring the
+        # slide's supporting sources
         source_context = ""
-        if research_context and supporting_sources:
+        if research_context:
             sources = research_context.get("sources", [])
-            relevant_sources = [
-                s
-                for s in sources
+            query = " ".join([slide.get("title", ""), purpose, *key_points])
+
+            supporting = {
+                index
+                for index, s in enumerate(sources)
                 if any(
                     src_id in s.get("citation_id", "") for src_id in supporting_sources
                 )
-            ]
-            if relevant_sources:
+            }
+            passages = []
+            if supporting:
+                passages = self._retrieve_passages(
+                    research_context, query, self.BULLET_PASSAGES, supporting
+                )
+            if passages:
                 source_context = "\n\nDetailed research content to base bullets on:\n"
-                for src in relevant_sources[:3]:
-                    source_context += f"\nSource: {src.get('title', 'Untitled')}\n"
+                for src_index, text in self._group_passages(passages):
                     source_context += (
-                        f"Content: {src.get('content', src.get('snippet', ''))[:600]}\n"
-                    )
-
-        # If no supporting sources but we have research, use general context
-        if not source_context and research_context:
-            all_sources = research_context.get("sources", [])
-            if all_sources:
-                source_context = "\n\nGeneral research context:\n"
-                for src in all_sources[:3]:
-                    source_context += f"\n{src.get('title', '')}\n"
-                    source_context += (
-                        f"{src.get('content', src.get('snippet', ''))[:400]}\n"
+                        f"\nSource: {sources[src_index].get('title', 'Untitled')}\n"
                     )
+                    source_context += f"Content: {text}\n"
+            else:
+                # No supporting sources, use the best matches from all research
+                passages = self._retrieve_passages(
+                    research_context, query, self.BULLET_PASSAGES
+                )
+                if passages:
+                    source_context = "\n\nGeneral research context:\n"
+                    for src_index, text in self._group_passages(passages):
+                        source_context += f"\n{sources[src_index].get('title', '')}\n"
+                        source_context += f"{text}\n"
 
         max_bullets = self.style_guide["max_bullets_per_slide"]
         max_words = self.style_guide["max_words_per_bullet"]
@@ -225,11 +287,21 @@ Reading level: {self.style_guide["reading_level"]}"""
         purpose = slide.get("purpose", "")
         slide_type = slide.get("slide_type", "CONTENT")
 
-        # Build research context for depth
+        # Retrieve research relevant to this slide for depth
         research_depth = ""
         if research_context:
             sources = research_context.get("sources", [])
-            if sources:
+            query = " ".join([title, purpose, *bullets])
+            passages = self._retrieve_passages(
+                research_context, query, self.NOTES_PASSAGES
+            )
+            if passages:
+                research_depth = "\n\nResearch available for additional depth:\n"
+                for src_index, text in self._group_passages(passages):
+                    research_depth += (
+                        f"- {sources[src_index].get('title', 'Untitled')}: {text}\n"
+                    )
+            elif sources:
                 research_depth = "\n\nResearch available for additional depth:\n"
                 for src in sources[:2]:
                     research_depth += f"- {src.get('title', 'Untitled')}\n"
@@ -269,6 +341,22 @@ Help the speaker deliver confidently and engagingly."""
 
         return notes.strip()
 
+    @staticmethod
+    def _group_passages(passages: list[Passage]) -> list[tuple[int, str]]:
+        """
+        Group passages by source, in source then position order.
+
+        Args:
+            passages: Retrieved passages
+
+        Returns:
+            (source_index, joined passage text) pairs
+        """
+        grouped: dict[int, list[str]] = {}
+        for passage in sorted(passages, key=lambda p: (p.source_index, p.position)):
+            grouped.setdefault(passage.source_index, []).append(passage.text)
+        return [(index, " ... ".join(texts)) for index, texts in grouped.items()]
+
     def generate_graphics_description(
         self,
         slide: dict[str, Any],
@@ -0,0 +1,282 @@
+"""
+Token-budgeted research context packing for prompts.
+
+Instead of pasting the first N sources (truncated to a fixed number of
+characters) into a prompt, ContextPacker:
+
+1. Splits each source's content into sentence-aligned chunks
+2. Counts tokens per chunk (cached, so repeated packing of the same
+   research is cheap even with an expensive counter)
+3. Ranks chunks by BM25 relevance to the request (topic, objectives, slide
+   title, ...)
+4. Greedily packs the best chunks into a fixed token budget and renders
+   them grouped by source, in source order
+
+Prompt size is then bounded by the budget regardless of how much research
+was gathered.
+
+Usage:
+    packer = ContextPacker(token_budget=2500)
+    context = packer.pack(research["sources"], query="menu pricing trends")
+    prompt = f"Key source content:\\n{context.render()}"
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .keyword_engine import tokenize
+
+
+# Sentence boundary used to align chunk edges
+SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def split_passages(text: str, max_chars: int) -> list[str]:
+    """
+    Split text into sentence-aligned passages of about max_chars.
+
+    Sentences are grouped until a passage would exceed max_chars; a single
+    longer sentence becomes its own passage.
+
+    Args:
+        text: Text to split
+        max_chars: Target passage length in characters
+
+    Returns:
+        Non-empty passages in text order
+    """
+    passages = []
+    pieces: list[str] = []
+    size = 0
+    for sentence in SENTENCE_BOUNDARY_RE.split(text.strip()):
+        if pieces and size + len(sentence) > max_chars:
+            passages.append(" ".join(pieces))
+            pieces, size = [], 0
+        pieces.append(sentence)
+        size += len(sentence) + 1
+    if pieces and any(pieces):
+        passages.append(" ".join(pieces))
+    return passages
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text (~4 characters per token).
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated tokens (at least 1 for non-empty text)
+    """
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+@dataclass
+class ContextChunk:
+    """A piece of one source's content."""
+
+    source_index: int
+    position: int
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+@dataclass
+class PackedContext:
+    """Chunks selected for a prompt."""
+
+    sources: list[dict[str, Any]]
+    chunks: list[ContextChunk]
+    token_budget: int
+    total_tokens: int = 0
+    dropped_chunks: int = 0
+    source_tokens: dict[int, int] = field(default_factory=dict)
+
+    def render(self) -> str:
+        """
+        Render chunks grouped by source (in source order).
+
+        Returns:
+            Prompt-ready text with a title and citation line per source
+        """
+        by_source: dict[int, list[ContextChunk]] = {}
+        for chunk in sorted(self.chunks, key=lambda c: (c.source_index, c.position)):
+            by_source.setdefault(chunk.source_index, []).append(chunk)
+
+        lines = []
+        for number, (index, chunks) in enumerate(by_source.items(), 1):
+            source = self.sources[index]
+            lines.append(f"\n{number}. {source.get('title', 'Untitled')}")
+            lines.append(f"   Citation: {source.get('citation_id', 'N/A')}")
+            lines.append(f"   Content: {' ... '.join(chunk.text for chunk in chunks)}")
+        return "\n".join(lines)
+
+
+class ContextPacker:
+    """
+    Packs the most relevant research chunks into a token budget.
+
+    Args:
+        token_budget: Maximum tokens of packed content (headers included)
+        chunk_tokens: Target chunk size in tokens
+        token_counter: Token counting function (default: estimate_tokens);
+                       results are cached per chunk text
+        cache_size: Maximum cached token counts
+    """
+
+    # Tokens reserved per source for its title/citation header
+    HEADER_TOKENS = 20
+
+    def __init__(
+        self,
+        token_budget: int = 2500,
+        chunk_tokens: int = 200,
+        token_counter: Callable[[str], int] | None = None,
+        cache_size: int = 10000,
+    ):
+        """Initialize context packer."""
+        self.token_budget = token_budget
+        self.chunk_tokens = chunk_tokens
+        self.token_counter = token_counter or estimate_tokens
+        self.cache_size = cache_size
+        self._token_cache: OrderedDict[str, int] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens with an LRU cache keyed by text hash.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Token count
+        """
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._token_cache.move_to_end(key)
+            return cached
+
+        self.cache_misses += 1
+        count = self.token_counter(text)
+        self._token_cache[key] = count
+        if len(self._token_cache) > self.cache_size:
+            self._token_cache.popitem(last=False)
+        return count
+
+    def chunk_sources(self, sources: list[dict[str, Any]]) -> list[ContextChunk]:
+        """
+        Split source contents into sentence-aligned chunks.
+
+        Chunks are about chunk_tokens long (estimated at 4 characters per
+        token); see split_passages().
+
+        Args:
+            sources: Research sources with "content" (or "snippet")
+
+        Returns:
+            Chunks in source, then position order
+        """
+        max_chars = self.chunk_tokens * 4
+        chunks = []
+        for index, source in enumerate(sources):
+            content = source.get("content") or source.get("snippet") or ""
+            for position, text in enumerate(split_passages(content, max_chars)):
+                chunks.append(
+                    ContextChunk(index, position, text, self.count_tokens(text))
+                )
+        return chunks
+
+    def score_chunks(self, chunks: list[ContextChunk], query: str) -> None:
+        """
+        Score chunks in place with BM25 against the query.
+
+        Args:
+            chunks: Chunks to score
+            query: Request text (topic, objectives, slide title, ...)
+        """
+        query_terms = set(tokenize(query))
+        if not chunks or not query_terms:
+            return
+
+        term_counts = [Counter(tokenize(chunk.text)) for chunk in chunks]
+        lengths = [sum(counts.values()) for counts in term_counts]
+        average_length = sum(lengths) / len(lengths) or 1.0
+
+        total = len(chunks)
+        idf = {}
+        for term in query_terms:
+            df = sum(1 for counts in term_counts if term in counts)
+            idf[term] = math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+        for chunk, counts, length in zip(chunks, term_counts, lengths, strict=True):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            chunk.score = sum(
+                idf[term] * counts[term] * (BM25_K1 + 1) / (counts[term] + norm)
+                for term in query_terms
+                if counts[term]
+            )
+
+    def pack(self, sources: list[dict[str, Any]], query: str = "") -> PackedContext:
+        """
+        Select the most relevant chunks that fit the token budget.
+
+        Chunks are taken by descending relevance; ties (including an empty
+        query) fall back to source order, then position within the source,
+        so unranked packing degrades to "leading content of the top sources".
+
+        Args:
+            sources: Research sources (in relevance order)
+            query: Request text to rank chunks against
+
+        Returns:
+            PackedContext with the selected chunks
+        """
+        chunks = self.chunk_sources(sources)
+        self.score_chunks(chunks, query)
+        ranked = sorted(chunks, key=lambda c: (-c.score, c.source_index, c.position))
+
+        packed = PackedContext(
+            sources=sources, chunks=[], token_budget=self.token_budget
+        )
+        for chunk in ranked:
+            cost = chunk.tokens
+            if chunk.source_index not in packed.source_tokens:
+                cost += self.HEADER_TOKENS
+            if packed.total_tokens + cost > self.token_budget:
+                packed.dropped_chunks += 1
+                continue
+
+            packed.chunks.append(chunk)
+            packed.total_tokens += cost
+            packed.source_tokens[chunk.source_index] = (
+                packed.source_tokens.get(chunk.source_index, 0) + cost
+            )
+        return packed
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get token cache statistics.
+
+        Returns:
+            Dict with cached entries, hits and misses
+        """
+        return {
+            "cached_counts": len(self._token_cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
@@ -0,0 +1,213 @@
+"""
+Graphics Description Fix-up Cache
+
+Caches Claude-improved graphics descriptions so weak descriptions that recur
+across generated decks (templated decks repeat the same placeholder visuals)
+are only rewritten once.
+
+Entries are keyed by:
+- The normalized description (case-folded, punctuation and whitespace
+  runs collapsed), so near-identical spellings share an entry
+- A scope naming the prompt that produced the fix-up (the validator and the
+  optimization skill ask for different rewrites)
+- A fingerprint of the style config (brand colors change the rewrite)
+
+The slide title is deliberately not part of the key: a fix-up describes the
+visual, and reusing it across slides with the same description is the point.
+
+Usage:
+    cache = DescriptionCache(cache_path="output/description_cache.json")
+    key = cache.make_key(description, "graphics_validator", style_config)
+    improved = cache.get(key)
+    if improved is None:
+        improved = call_claude(...)
+        cache.set(key, improved)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# Words, hex colors and hyphenated terms survive normalization
+NORMALIZE_TOKEN_RE = re.compile(r"[\w#-]+")
+
+
+def normalize_description(description: str) -> str:
+    """
+    Normalize a description for cache lookups.
+
+    Args:
+        description: Graphics description
+
+    Returns:
+        Case-folded words joined by single spaces (punctuation dropped)
+    """
+    return " ".join(NORMALIZE_TOKEN_RE.findall(description.casefold()))
+
+
+def style_fingerprint(style_config: dict[str, Any] | None) -> str:
+    """
+    Build a stable fingerprint of a style config.
+
+    Args:
+        style_config: Brand style configuration (None or empty = no style)
+
+    Returns:
+        Hex digest identifying the style config
+    """
+    raw = json.dumps(style_config or {}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class DescriptionCache:
+    """
+    LRU cache of improved graphics descriptions.
+
+    Thread-safe (batch validation and slide optimization request fix-ups
+    concurrently). Optionally persisted to a JSON file so fix-ups survive
+    across runs.
+
+    Args:
+        cache_path: Optional JSON file for persistence (None = in-memory only)
+        max_entries: Maximum cached fix-ups (least recently used evicted)
+    """
+
+    def __init__(self, cache_path: str | Path | None = None, max_entries: int = 2000):
+        """Initialize description cache."""
+        self.cache_path = Path(cache_path).expanduser() if cache_path else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.cache_path and self.cache_path.exists():
+            self._load()
+
+    @staticmethod
+    def make_key(
+        description: str, scope: str, style_config: dict[str, Any] | None = None
+    ) -> str:
+        """
+        Build a cache key for a description fix-up.
+
+        Args:
+            description: Original graphics description
+            scope: Name of the prompt producing the fix-up
+            style_config: Style config the fix-up was generated for
+
+        Returns:
+            Hex digest cache key
+        """
+        raw = "\x00".join(
+            [scope, style_fingerprint(style_config), normalize_description(description)]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up an improved description, refreshing its recency on hit.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Improved description, or None on miss
+        """
+        with self._lock:
+            improved = self._entries.get(key)
+            if improved is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return improved
+
+    def set(self, key: str, improved: str) -> None:
+        """
+        Store an improved description, evicting least recently used entries.
+
+        Args:
+            key: Cache key from make_key()
+            improved: Improved description
+        """
+        with self._lock:
+            self._entries[key] = improved
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+            if self.cache_path:
+                self._save()
+
+    def clear(self) -> None:
+        """Remove all cached fix-ups and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            if self.cache_path:
+                self._save()
+
+    def __len__(self) -> int:
+        """Number of cached fix-ups."""
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _load(self) -> None:
+        """Load persisted entries, ignoring unreadable cache files."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            for entry in data.get("entries", []):
+                self._entries[entry["key"]] = entry["improved"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Ignoring unreadable description cache %s: %s", self.cache_path, e
+            )
+            self._entries.clear()
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        """Persist entries (oldest first) to the cache file."""
+        entries = [
+            {"key": key, "improved": improved}
+            for key, improved in self._entries.items()
+        ]
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(
+                json.dumps({"entries": entries}), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(
+                "Failed to write description cache %s: %s", self.cache_path, e
+            )
@@ -10,20 +10,34 @@ Validates graphics descriptions for:
 - Adequate length (2-4 sentences minimum)
 
 Uses hybrid approach: rule-based validation + Claude API for improvements.
+Improvements are cached by normalized description and style config (see
+DescriptionCache), so recurring weak descriptions are only rewritten once.
+
+Rules score from a single precompiled pass over each description (see
+KeywordScanner): the text is lowercased once, sentences are counted once and
+every distinct keyword is tested once, with scans memoized by description.
 """
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from anthropic import APIError, APIConnectionError, RateLimitError
 
 from plugin.lib.claude_client import get_claude_client
+from plugin.lib.description_cache import DescriptionCache
 
 
 logger = logging.getLogger(__name__)
 
+# Descriptions whose scans are kept for re-validation
+SCAN_CACHE_SIZE = 4096
+
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
 
 @dataclass
 class ValidationResult:
@@ -36,6 +50,59 @@ class ValidationResult:
     description_improved: str | None = None
 
 
+@dataclass(frozen=True)
+class DescriptionScan:
+    """Facts about one description that every validation rule scores from."""
+
+    text: str  # Lowercased description
+    sentence_count: int
+    keywords: frozenset[str]  # Known keywords occurring anywhere in text
+
+    def matches(self, keywords: set[str]) -> list[str]:
+        """Keywords from a rule's set that occur, in that set's order."""
+        return [word for word in keywords if word in self.keywords]
+
+
+class KeywordScanner:
+    """
+    Precompiled single-pass scanner shared by all validation rules.
+
+    Keywords appearing in several rule sets (e.g. "centered" is both a visual
+    and a layout keyword) are tested once per description instead of once per
+    rule. Keywords match as substrings, exactly like the per-rule checks
+    ("angle" matches "rectangle").
+    """
+
+    def __init__(self, keywords: frozenset[str], cache_size: int = SCAN_CACHE_SIZE):
+        """
+        Initialize scanner.
+
+        Args:
+            keywords: Union of all rule keyword sets (lowercase)
+            cache_size: Maximum number of memoized description scans
+        """
+        self.keywords = tuple(sorted(keywords))
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+
+    def _scan(self, description: str) -> DescriptionScan:
+        """Scan a description (memoized through self.scan)."""
+        text = description.lower()
+        sentence_count = sum(
+            1 for sentence in SENTENCE_SPLIT_RE.split(description) if sentence.strip()
+        )
+        return DescriptionScan(
+            text=text,
+            sentence_count=sentence_count,
+            keywords=frozenset(word for word in self.keywords if word in text),
+        )
+
+
+@lru_cache(maxsize=32)
+def get_keyword_scanner(keywords: frozenset[str]) -> KeywordScanner:
+    """Get the shared scanner for a keyword set (compiled once per set)."""
+    return KeywordScanner(keywords)
+
+
 class GraphicsValidator:
     """
     Validate and improve graphics descriptions.
@@ -124,9 +191,36 @@ class GraphicsValidator:
         "written",
     }
 
-    def __init__(self):
-        """Initialize graphics validator."""
+    # Color names accepted for well-known brand hex colors
+    BRAND_COLOR_NAMES = {
+        "#DD0033": "red",
+        "#004F71": "blue",
+        "#000000": "black",
+        "#FFFFFF": "white",
+    }
+
+    # Cache scope of this validator's improvement prompt
+    CACHE_SCOPE = "graphics_validator"
+
+    def __init__(self, cache: DescriptionCache | None = None):
+        """
+        Initialize graphics validator.
+
+        Args:
+            cache: Optional DescriptionCache for improved descriptions
+                   (e.g. persistent across runs). Defaults to an in-memory cache.
+        """
         self.client = get_claude_client()
+        self.cache = cache if cache is not None else DescriptionCache()
+        self.scanner = get_keyword_scanner(
+            frozenset(
+                self.VAGUE_WORDS
+                | self.VISUAL_KEYWORDS
+                | self.LAYOUT_KEYWORDS
+                | self.TEXT_INDICATORS
+                | set(self.BRAND_COLOR_NAMES.values())
+            )
+        )
 
     def validate_description(
         self,
@@ -147,33 +241,36 @@ class GraphicsValidator:
         """
         issues = []
         score = 100.0
+        scan = self.scanner.scan(description)
 
         # Rule 1: Length check (2-4 sentences minimum)
-        length_issue, length_penalty = self._check_length(description)
+        length_issue, length_penalty = self._check_length(description, scan)
         if length_issue:
             issues.append(length_issue)
             score -= length_penalty
 
         # Rule 2: Specificity check (avoid vague words)
-        specificity_issue, specificity_penalty = self._check_specificity(description)
+        specificity_issue, specificity_penalty = self._check_specificity(
+            description, scan
+        )
         if specificity_issue:
             issues.append(specificity_issue)
             score -= specificity_penalty
 
         # Rule 3: Visual elements check
-        visual_issue, visual_penalty = self._check_visual_elements(description)
+        visual_issue, visual_penalty = self._check_visual_elements(description, scan)
         if visual_issue:
             issues.append(visual_issue)
             score -= visual_penalty
 
         # Rule 4: Layout hints check
-        layout_issue, layout_penalty = self._check_layout_hints(description)
+        layout_issue, layout_penalty = self._check_layout_hints(description, scan)
         if layout_issue:
             issues.append(layout_issue)
             score -= layout_penalty
 
         # Rule 5: Text avoidance check
-        text_issue, text_penalty = self._check_text_avoidance(description)
+        text_issue, text_penalty = self._check_text_avoidance(description, scan)
         if text_issue:
             issues.append(text_issue)
             score -= text_penalty
@@ -181,7 +278,7 @@ class GraphicsValidator:
         # Rule 6: Brand alignment check (if style config provided)
         if style_config:
             brand_issue, brand_penalty = self._check_brand_alignment(
-                description, style_config
+                description, style_config, scan
             )
             if brand_issue:
                 issues.append(brand_issue)
@@ -208,7 +305,9 @@ class GraphicsValidator:
             description_improved=improved_description,
         )
 
-    def _check_length(self, description: str) -> tuple[dict | None, float]:
+    def _check_length(
+        self, description: str, scan: DescriptionScan | None = None
+    ) -> tuple[dict | None, float]:
         """
         Check description length (minimum 2-4 sentences).
 
@@ -216,8 +315,7 @@ class GraphicsValidator:
             (issue_dict or None, penalty_score)
         """
         # Count sentences (approximate)
-        sentences = [s.strip() for s in re.split(r"[.!?]+", description) if s.strip()]
-        sentence_count = len(sentences)
+        sentence_count = (scan or self.scanner.scan(description)).sentence_count
 
         if sentence_count < 2:
             return {
@@ -236,15 +334,17 @@ class GraphicsValidator:
 
         return None, 0
 
-    def _check_specificity(self, description: str) -> tuple[dict | None, float]:
+    def _check_specificity(
+        self, description: str, scan: DescriptionScan | None = None
+    ) -> tuple[dict | None, float]:
         """
         Check for vague/abstract language.
 
         Returns:
             (issue_dict or None, penalty_score)
         """
-        description_lower = description.lower()
-        vague_found = [word for word in self.VAGUE_WORDS if word in description_lower]
+        scan = scan or self.scanner.scan(description)
+        vague_found = scan.matches(self.VAGUE_WORDS)
 
         if len(vague_found) >= 3:
             return {
@@ -263,17 +363,17 @@ class GraphicsValidator:
 
         return None, 0
 
-    def _check_visual_elements(self, description: str) -> tuple[dict | None, float]:
+    def _check_visual_elements(
+        self, description: str, scan: DescriptionScan | None = None
+    ) -> tuple[dict | None, float]:
         """
         Check for concrete visual elements.
 
         Returns:
             (issue_dict or None, penalty_score)
         """
-        description_lower = description.lower()
-        visual_found = [
-            word for word in self.VISUAL_KEYWORDS if word in description_lower
-        ]
+        scan = scan or self.scanner.scan(description)
+        visual_found = scan.matches(self.VISUAL_KEYWORDS)
 
         if len(visual_found) == 0:
             return {
@@ -292,17 +392,17 @@ class GraphicsValidator:
 
         return None, 0
 
-    def _check_layout_hints(self, description: str) -> tuple[dict | None, float]:
+    def _check_layout_hints(
+        self, description: str, scan: DescriptionScan | None = None
+    ) -> tuple[dict | None, float]:
         """
         Check for composition/layout guidance.
 
         Returns:
             (issue_dict or None, penalty_score)
         """
-        description_lower = description.lower()
-        layout_found = [
-            word for word in self.LAYOUT_KEYWORDS if word in description_lower
-        ]
+        scan = scan or self.scanner.scan(description)
+        layout_found = scan.matches(self.LAYOUT_KEYWORDS)
 
         if len(layout_found) == 0:
             return {
@@ -314,17 +414,17 @@ class GraphicsValidator:
 
         return None, 0
 
-    def _check_text_avoidance(self, description: str) -> tuple[dict | None, float]:
+    def _check_text_avoidance(
+        self, description: str, scan: DescriptionScan | None = None
+    ) -> tuple[dict | None, float]:
         """
         Check that description doesn't request text in image.
 
         Returns:
             (issue_dict or None, penalty_score)
         """
-        description_lower = description.lower()
-        text_found = [
-            word for word in self.TEXT_INDICATORS if word in description_lower
-        ]
+        scan = scan or self.scanner.scan(description)
+        text_found = scan.matches(self.TEXT_INDICATORS)
 
         if len(text_found) > 0:
             return {
@@ -337,7 +437,10 @@ class GraphicsValidator:
         return None, 0
 
     def _check_brand_alignment(
-        self, description: str, style_config: dict[str, Any]
+        self,
+        description: str,
+        style_config: dict[str, Any],
+        scan: DescriptionScan | None = None,
     ) -> tuple[dict | None, float]:
         """
         Check for brand color/style mentions.
@@ -350,24 +453,16 @@ class GraphicsValidator:
         if not brand_colors:
             return None, 0  # Can't check without brand colors
 
-        description_lower = description.lower()
+        scan = scan or self.scanner.scan(description)
 
         # Check if any brand colors are mentioned
         colors_mentioned = any(
-            color.lower().replace("#", "") in description_lower
-            for color in brand_colors
+            color.lower().replace("#", "") in scan.text for color in brand_colors
         )
 
         # Also check for color names (red, blue, etc.)
-        color_names = {
-            "#DD0033": "red",
-            "#004F71": "blue",
-            "#000000": "black",
-            "#FFFFFF": "white",
-        }
-
-        for hex_color, color_name in color_names.items():
-            if hex_color in brand_colors and color_name in description_lower:
+        for hex_color, color_name in self.BRAND_COLOR_NAMES.items():
+            if hex_color in brand_colors and color_name in scan.keywords:
                 colors_mentioned = True
                 break
 
@@ -405,6 +500,9 @@ class GraphicsValidator:
         """
         Generate improved description using Claude API.
 
+        Cached by normalized description and style config; failures are not
+        cached.
+
         Args:
             description: Original description
             issues: Validation issues found
@@ -414,6 +512,11 @@ class GraphicsValidator:
         Returns:
             Improved description or None if generation fails
         """
+        cache_key = self.cache.make_key(description, self.CACHE_SCOPE, style_config)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         title = slide_context.get("title", "")
         bullets = slide_context.get("bullets", [])
 
@@ -461,7 +564,9 @@ Focus on concrete, specific elements that can be drawn."""
                 max_tokens=500,
             )
 
-            return improved.strip()
+            improved = improved.strip()
+            self.cache.set(cache_key, improved)
+            return improved
 
         except (APIError, APIConnectionError, RateLimitError) as e:
             logger.warning("Failed to improve graphics description: %s", e)
@@ -510,28 +615,41 @@ Focus on concrete, specific elements that can be drawn."""
 
 
 # Convenience function
-def get_graphics_validator() -> GraphicsValidator:
+def get_graphics_validator(cache: DescriptionCache | None = None) -> GraphicsValidator:
     """Get configured graphics validator instance."""
-    return GraphicsValidator()
+    return GraphicsValidator(cache=cache)
 
 
 # Validation helper function
 def validate_graphics_batch(
-    slides: list[dict[str, Any]], style_config: dict[str, Any] | None = None
+    slides: list[dict[str, Any]],
+    style_config: dict[str, Any] | None = None,
+    max_concurrent: int = 5,
+    cache: DescriptionCache | None = None,
 ) -> dict[str, Any]:
     """
     Validate graphics descriptions for multiple slides.
 
+    All rule checks run first (no API calls); Claude improvements for the
+    failing descriptions are then requested concurrently on a bounded thread
+    pool. Each request still goes through the client's shared rate limiter,
+    so a deck with many failures finishes in a few API latencies instead of
+    one per failing slide. Failing descriptions that normalize to the same
+    text share one request.
+
     Args:
         slides: List of slides with graphics_description
         style_config: Brand style config
+        max_concurrent: Maximum in-flight improvement requests
+        cache: Optional DescriptionCache for improved descriptions
 
     Returns:
-        Batch validation results with pass rate and issues
+        Batch validation results with pass rate and issues, in slide order
     """
-    validator = GraphicsValidator()
+    validator = GraphicsValidator(cache=cache)
 
     results = []
+    failed = []
     total_passed = 0
 
     for slide_idx, slide in enumerate(slides, 1):
@@ -545,15 +663,42 @@ def validate_graphics_batch(
             "bullets": slide.get("bullets", []),
         }
 
+        # Rules only - improvements are requested together below
         validation = validator.validate_description(
-            description, slide_context, style_config
+            description, style_config=style_config
         )
 
         if validation.passed:
             total_passed += 1
+        else:
+            failed.append((validation, description, slide_context))
 
         results.append({"slide_number": slide_idx, "validation": validation})
 
+    def improve(item: tuple[ValidationResult, str, dict[str, Any]]) -> str | None:
+        validation, description, slide_context = item
+        return validator._generate_improved_description(
+            description, validation.issues, slide_context, style_config
+        )
+
+    # One request per distinct description (the first slide's context is used)
+    requests: dict[str, tuple[ValidationResult, str, dict[str, Any]]] = {}
+    for item in failed:
+        key = validator.cache.make_key(item[1], validator.CACHE_SCOPE, style_config)
+        requests.setdefault(key, item)
+
+    if requests:
+        workers = max(1, min(max_concurrent, len(requests)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            improved_by_key = dict(
+                zip(requests, executor.map(improve, requests.values()), strict=True)
+            )
+        for validation, description, _ in failed:
+            key = validator.cache.make_key(
+                description, validator.CACHE_SCOPE, style_config
+            )
+            validation.description_improved = improved_by_key[key]
+
     pass_rate = (total_passed / len(results) * 100) if results else 100
 
     return {
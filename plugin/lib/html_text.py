@@ -0,0 +1,282 @@
+"""
+Streaming HTML-to-text extraction.
+
+HTMLTextExtractor turns HTML into normalized plain text in a single pass over
+chunked input:
+
+- script/style/noscript/template/svg subtrees and comments are skipped
+- all named and numeric character references are decoded
+- whitespace is collapsed as text arrives (every tag separates words)
+- title, <meta> fields and author are captured in the same pass
+
+Only a small carry-over between chunks (an unfinished tag or entity) and
+the extracted text (optionally capped by max_chars) are retained, so pages
+can be fed straight from a network stream without holding the raw HTML or
+building intermediate copies of it.
+
+The tokenizer only steps through the few tags it acts on in Python; runs
+of ordinary markup between them are stripped with one compiled regex, which
+keeps it several times faster than html.parser.HTMLParser on large pages.
+
+Usage:
+    parser = HTMLTextExtractor()
+    async for chunk in response.aiter_text():
+        parser.feed(chunk)
+    parser.close()
+    print(parser.title, parser.author, parser.text)
+"""
+
+import html
+import re
+from collections.abc import Iterable, Iterator
+
+
+# Feed size used when parsing an in-memory document
+CHUNK_SIZE = 64 * 1024
+
+# Subtrees whose text is never page content
+SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "svg"})
+
+# <meta> keys (name/property/itemprop) that carry the author
+AUTHOR_META_KEYS = ("author", "article:author", "dc.creator", "twitter:creator")
+
+# Longest unfinished tag/entity carried over to the next chunk before it
+# is treated as plain text
+MAX_CARRY = 256 * 1024
+
+# Tags the tokenizer acts on, plus comment openers
+SPECIAL_RE = re.compile(
+    r"<(?:(!--)|(script|style|noscript|template|svg|title|meta)\b([^>]*)>)",
+    re.IGNORECASE,
+)
+# Any other markup (replaced by a word separator)
+TAG_RE = re.compile(r"<[a-zA-Z/!?][^>]*>")
+ATTR_RE = re.compile(r"""([^\s=/>]+)\s*=\s*("[^"]*"|'[^']*'|[^\s>]+)""")
+
+_CLOSE_RES: dict[str, re.Pattern[str]] = {"!--": re.compile(r"-->")}
+
+
+def _close_re(tag: str) -> re.Pattern[str]:
+    """Compiled pattern for a raw-text element's closing tag."""
+    pattern = _CLOSE_RES.get(tag)
+    if pattern is None:
+        pattern = _CLOSE_RES[tag] = re.compile(rf"</{tag}\s*>", re.IGNORECASE)
+    return pattern
+
+
+class HTMLTextExtractor:
+    """
+    Incremental HTML text extractor with an HTMLParser-style feed/close API.
+
+    Args:
+        max_chars: Stop collecting body text after this many characters
+                   (None = unbounded); title and meta are still captured
+    """
+
+    def __init__(self, max_chars: int | None = None):
+        """Initialize extractor."""
+        self.max_chars = max_chars
+        self.title: str | None = None
+        self.meta: dict[str, str] = {}
+        self.truncated = False
+
+        self._parts: list[str] = []
+        self._drained = 0
+        self._length = 0
+        self._pending_space = False
+        self._carry = ""
+        # Raw-text element being consumed ("!--" for comments) and, for
+        # <title>, the captured text
+        self._raw_tag: str | None = None
+        self._title_parts: list[str] | None = None
+
+    @property
+    def text(self) -> str:
+        """All body text extracted so far."""
+        return "".join(self._parts)
+
+    @property
+    def author(self) -> str | None:
+        """Author from <meta> tags, if present."""
+        for key in AUTHOR_META_KEYS:
+            if self.meta.get(key):
+                return self.meta[key]
+        return None
+
+    def drain(self) -> str:
+        """Return body text extracted since the previous drain()."""
+        fresh = "".join(self._parts[self._drained :])
+        self._drained = len(self._parts)
+        return fresh
+
+    def feed(self, chunk: str) -> None:
+        """
+        Consume the next chunk of HTML.
+
+        Args:
+            chunk: HTML text (may split tags or entities anywhere)
+        """
+        buf = self._carry + chunk if self._carry else chunk
+        self._carry = ""
+        pos = 0
+        end = len(buf)
+
+        while pos < end:
+            if self._raw_tag is not None:
+                match = _close_re(self._raw_tag).search(buf, pos)
+                if match is None:
+                    # Keep enough of the tail to catch a split closing tag
+                    keep = max(pos, end - len(self._raw_tag) - 16)
+                    if self._title_parts is not None:
+                        self._title_parts.append(buf[pos:keep])
+                    self._carry = buf[keep:]
+                    return
+                if self._title_parts is not None:
+                    self._title_parts.append(buf[pos : match.start()])
+                    self._finish_title()
+                self._raw_tag = None
+                self._pending_space = True
+                pos = match.end()
+                continue
+
+            match = SPECIAL_RE.search(buf, pos)
+            if match is None:
+                self._emit_tail(buf, pos)
+                return
+
+            self._emit(buf[pos : match.start()])
+            self._pending_space = True
+            pos = match.end()
+            self._handle_special(match)
+
+    def close(self) -> None:
+        """Flush any carried-over input."""
+        carry, self._carry = self._carry, ""
+        if carry and self._raw_tag is None:
+            self._emit(carry)
+        elif carry and self._title_parts is not None:
+            self._title_parts.append(carry)
+        if self._title_parts is not None:
+            self._finish_title()
+        self._raw_tag = None
+
+    def _finish_title(self) -> None:
+        """Set the title from captured text."""
+        title = " ".join(html.unescape("".join(self._title_parts)).split())
+        self.title = title or None
+        self._title_parts = None
+
+    def _handle_special(self, match: re.Match[str]) -> None:
+        """Act on a comment opener, skipped subtree, <title> or <meta>."""
+        if match.group(1):
+            self._raw_tag = "!--"
+            return
+
+        tag = match.group(2).lower()
+        attrs = match.group(3)
+        if tag == "meta":
+            self._handle_meta(attrs)
+        elif attrs.rstrip().endswith("/"):
+            # Self-closing <svg .../> and similar have no subtree
+            return
+        else:
+            self._raw_tag = tag
+            if tag == "title" and self.title is None:
+                self._title_parts = []
+
+    def _handle_meta(self, attrs: str) -> None:
+        """Record the first value seen for each <meta> key."""
+        values = {
+            name.lower(): html.unescape(value.strip("\"'"))
+            for name, value in ATTR_RE.findall(attrs)
+        }
+        key = values.get("name") or values.get("property") or values.get("itemprop")
+        content = values.get("content")
+        if key and content:
+            self.meta.setdefault(key.strip().lower(), " ".join(content.split()))
+
+    def _emit_tail(self, buf: str, pos: int) -> None:
+        """Emit text up to a possibly unfinished tag or entity at the end."""
+        cut = len(buf)
+        lt = buf.rfind("<", pos)
+        if lt != -1 and buf.find(">", lt) == -1:
+            cut = lt
+        amp = buf.rfind("&", pos, cut)
+        if amp != -1 and cut - amp < 12 and ";" not in buf[amp:cut]:
+            cut = amp
+
+        if len(buf) - cut > MAX_CARRY:
+            cut = len(buf)
+        self._emit(buf[pos:cut])
+        self._carry = buf[cut:]
+
+    def _emit(self, segment: str) -> None:
+        """Strip markup from a segment and append its normalized text."""
+        if not segment or self.truncated:
+            return
+
+        if "<" in segment:
+            segment = TAG_RE.sub(" ", segment)
+        if "&" in segment:
+            segment = html.unescape(segment)
+
+        words = segment.split()
+        if not words:
+            self._pending_space = True
+            return
+
+        piece = " ".join(words)
+        if self._parts and (self._pending_space or segment[0].isspace()):
+            piece = " " + piece
+        self._pending_space = segment[-1].isspace()
+
+        if self.max_chars is not None and self._length + len(piece) > self.max_chars:
+            piece = piece[: max(0, self.max_chars - self._length)]
+            self.truncated = True
+        self._parts.append(piece)
+        self._length += len(piece)
+
+
+def iter_html_text(
+    chunks: Iterable[str], max_chars: int | None = None
+) -> Iterator[str]:
+    """
+    Yield normalized text fragments from HTML chunks as they are parsed.
+
+    Args:
+        chunks: HTML text chunks (e.g., from a streaming response)
+        max_chars: Optional cap on total text characters
+
+    Yields:
+        Text fragments; concatenated they form the page text
+    """
+    parser = HTMLTextExtractor(max_chars=max_chars)
+    for chunk in chunks:
+        parser.feed(chunk)
+        fresh = parser.drain()
+        if fresh:
+            yield fresh
+        if parser.truncated:
+            break
+    parser.close()
+    fresh = parser.drain()
+    if fresh:
+        yield fresh
+
+
+def parse_html(document: str, max_chars: int | None = None) -> HTMLTextExtractor:
+    """
+    Parse an in-memory HTML document in CHUNK_SIZE pieces.
+
+    Args:
+        document: HTML document
+        max_chars: Optional cap on body text characters
+
+    Returns:
+        Closed HTMLTextExtractor with title, meta, author and text
+    """
+    parser = HTMLTextExtractor(max_chars=max_chars)
+    for start in range(0, len(document), CHUNK_SIZE):
+        parser.feed(document[start : start + CHUNK_SIZE])
+    parser.close()
+    return parser
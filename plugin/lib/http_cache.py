@@ -0,0 +1,276 @@
+"""
+HTTP response cache for fetched web pages.
+
+Stores page bodies with their validators (ETag / Last-Modified) so repeat
+fetches can be revalidated with a conditional GET: an unchanged page costs a
+304 response instead of a full download. Pages whose Cache-Control max-age
+has not elapsed are served without any request.
+
+Storage (SQLite):
+- responses: one row per URL with validators and the body's content hash
+- bodies: zlib-compressed bodies keyed by SHA-256, shared by URLs that
+  serve identical content (mirrors, tracking-parameter variants)
+
+Total stored body bytes are capped; least recently used URLs are evicted
+first and unreferenced bodies are dropped.
+
+Usage:
+    cache = HTTPCache("~/.cache/presentation/http.db")
+    extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class CachedResponse:
+    """A cached HTTP response body and its validators."""
+
+    url: str
+    body: bytes
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+    max_age: float | None = None
+    stored_at: float = 0.0
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether Cache-Control max-age still allows use without revalidation."""
+        return self.max_age is not None and time.time() - self.stored_at < self.max_age
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parse_max_age(cache_control: str | None) -> float | None:
+    """
+    Extract max-age seconds from a Cache-Control header.
+
+    Args:
+        cache_control: Cache-Control header value
+
+    Returns:
+        max-age in seconds, 0 for no-cache/no-store, or None if absent
+    """
+    if not cache_control:
+        return None
+    directives = cache_control.lower()
+    if "no-cache" in directives or "no-store" in directives:
+        return 0.0
+    match = re.search(r"max-age=(\d+)", directives)
+    return float(match.group(1)) if match else None
+
+
+class HTTPCache:
+    """
+    Persistent HTTP response cache with conditional revalidation support.
+
+    Args:
+        path: SQLite database path (parent directories are created)
+        max_bytes: Cap on total stored (compressed) body bytes
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS bodies (
+            sha256 TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS responses (
+            url TEXT PRIMARY KEY,
+            sha256 TEXT NOT NULL,
+            content_type TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            max_age REAL,
+            stored_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_accessed
+            ON responses (accessed_at);
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 200 * 1024 * 1024):
+        """Initialize HTTP cache."""
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+        self.stats = {
+            "fresh_hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "stored": 0,
+            "bytes_downloaded": 0,
+        }
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        """
+        Find the cached response for a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            CachedResponse, or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT r.content_type, r.etag, r.last_modified, r.max_age, "
+                "r.stored_at, b.body FROM responses r "
+                "JOIN bodies b ON b.sha256 = r.sha256 WHERE r.url = ?",
+                (url,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        content_type, etag, last_modified, max_age, stored_at, body = row
+        return CachedResponse(
+            url=url,
+            body=zlib.decompress(body),
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+            max_age=max_age,
+            stored_at=stored_at,
+        )
+
+    def store(self, url: str, body: bytes, headers: Any) -> None:
+        """
+        Store a 200 response.
+
+        Args:
+            url: Page URL
+            body: Decoded (uncompressed) response body
+            headers: Response headers mapping (case-insensitive lookup)
+        """
+        max_age = parse_max_age(headers.get("cache-control"))
+        if "no-store" in (headers.get("cache-control") or "").lower():
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO bodies VALUES (?, ?, ?)",
+                (digest, compressed, len(compressed)),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    digest,
+                    headers.get("content-type", ""),
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    max_age,
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+            self.stats["stored"] += 1
+
+    def touch(self, url: str, headers: Any | None = None) -> None:
+        """
+        Mark a cached response as revalidated (after a 304).
+
+        Args:
+            url: Page URL
+            headers: Optional 304 response headers with refreshed validators
+        """
+        headers = headers or {}
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified), "
+                "max_age = COALESCE(?, max_age) WHERE url = ?",
+                (
+                    now,
+                    now,
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    parse_max_age(headers.get("cache-control")),
+                    url,
+                ),
+            )
+
+    def record(self, event: str, downloaded: int = 0) -> None:
+        """
+        Count a cache outcome.
+
+        Args:
+            event: "fresh_hits", "revalidated" or "misses"
+            downloaded: Body bytes transferred for this fetch
+        """
+        with self._lock:
+            self.stats[event] += 1
+            self.stats["bytes_downloaded"] += downloaded
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM bodies")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, bodies, bytes and fetch outcome counters
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            bodies, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM bodies"
+            ).fetchone()
+        return {"entries": entries, "bodies": bodies, "bytes": size, **self.stats}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """Evict least recently used responses until bodies fit max_bytes."""
+        while True:
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM bodies"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            oldest = self._conn.execute(
+                "SELECT url FROM responses ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if oldest is None:
+                return
+            self._conn.execute("DELETE FROM responses WHERE url = ?", oldest)
+            self._conn.execute(
+                "DELETE FROM bodies WHERE sha256 NOT IN (SELECT sha256 FROM responses)"
+            )
@@ -0,0 +1,120 @@
+"""
+Corpus-level keyword and theme extraction.
+
+Tokenizes every source once, weights terms by TF-IDF across the research
+corpus and returns per-source keywords and global themes in one pass:
+
+- keywords: a source's highest-weighted terms (frequent in that source,
+  rare elsewhere), so boilerplate shared by every source drops out
+- themes: terms with the largest summed (L2-normalized) weight across all
+  sources, i.e. the centroid of the corpus - terms that matter to many
+  sources, not just one long one
+
+Term counts are sparse (one Counter per source), so the cost is linear in
+corpus size.
+
+Usage:
+    corpus = extract_corpus_keywords([s["content"] for s in sources])
+    corpus.themes          # ["menu", "pricing", ...]
+    corpus.keywords[0]     # keywords of the first source
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import itemgetter
+
+
+# Common English words excluded from keywords
+STOP_WORDS = frozenset(
+    {
+        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+        "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+        "be", "have", "has", "had", "do", "does", "did", "will", "would",
+        "could", "should", "may", "might", "must", "can", "this", "that",
+        "these", "those", "it", "its", "they", "their", "them",
+    }
+)  # fmt: skip
+
+# Lowercase words of three or more letters
+WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase keyword candidates.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Words of three or more letters that are not stop words
+    """
+    return [word for word in WORD_RE.findall(text.lower()) if word not in STOP_WORDS]
+
+
+@dataclass
+class CorpusKeywords:
+    """Keywords per document and themes for a whole corpus."""
+
+    keywords: list[list[str]]
+    themes: list[str]
+    theme_scores: dict[str, float] = field(default_factory=dict)
+
+
+def extract_corpus_keywords(
+    documents: list[str], top_n: int = 5, theme_count: int = 10
+) -> CorpusKeywords:
+    """
+    Extract per-document keywords and corpus themes with TF-IDF.
+
+    Term frequency is sublinear (1 + log count) and inverse document
+    frequency is smoothed (log((1 + N) / (1 + df)) + 1), so terms found in
+    every document still carry some weight. Ties keep first-seen order.
+
+    Args:
+        documents: Document texts
+        top_n: Keywords returned per document
+        theme_count: Themes returned for the corpus
+
+    Returns:
+        CorpusKeywords with keywords aligned to documents
+    """
+    counts = [Counter(tokenize(document)) for document in documents]
+
+    document_frequency: Counter[str] = Counter()
+    for term_counts in counts:
+        document_frequency.update(term_counts.keys())
+
+    total = len(documents)
+    idf = {
+        term: math.log((1 + total) / (1 + df)) + 1
+        for term, df in document_frequency.items()
+    }
+
+    keywords = []
+    theme_scores: dict[str, float] = {}
+    for term_counts in counts:
+        weights = {
+            term: (1 + math.log(count)) * idf[term]
+            for term, count in term_counts.items()
+        }
+        keywords.append(
+            [
+                term
+                for term, _ in heapq.nlargest(top_n, weights.items(), key=itemgetter(1))
+            ]
+        )
+
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        for term, weight in weights.items():
+            theme_scores[term] = theme_scores.get(term, 0.0) + weight / norm
+
+    top_themes = heapq.nlargest(theme_count, theme_scores.items(), key=itemgetter(1))
+    return CorpusKeywords(
+        keywords=keywords,
+        themes=[term for term, _ in top_themes],
+        theme_scores=dict(top_themes),
+    )
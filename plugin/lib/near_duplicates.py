@@ -0,0 +1,208 @@
+"""
+Near-duplicate text detection with MinHash and locality-sensitive hashing.
+
+Syndicated copies of one article (press releases, wire stories, scraped
+mirrors) have different URLs but almost the same text. NearDuplicateDetector
+finds them in near-linear time:
+
+- Each text becomes a set of word shingles (overlapping word n-grams)
+- A MinHash signature (num_perm minimum hashes) estimates the Jaccard
+  similarity of two shingle sets by the fraction of agreeing positions
+- LSH splits signatures into bands; only texts sharing a whole band are
+  compared, so most pairs are never looked at
+
+Usage:
+    detector = NearDuplicateDetector(threshold=0.8)
+    for source in sources:                       # best-ranked first
+        original = detector.add(source["url"], source["content"])
+        if original is not None:
+            print(f"{source['url']} duplicates {original}")
+"""
+
+import hashlib
+import random
+import re
+from collections.abc import Hashable
+from typing import Any
+
+
+# Word tokens used for shingles
+TOKEN_RE = re.compile(r"\w+")
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    Choose (bands, rows) for a similarity threshold.
+
+    Picks the strictest banding whose candidate threshold (1/b)^(1/r) stays
+    at or below 90% of the target, so pairs at the target similarity are
+    almost always compared (signatures are verified afterwards).
+
+    Args:
+        threshold: Target Jaccard similarity
+        num_perm: Signature length
+
+    Returns:
+        (bands, rows_per_band)
+    """
+    best = (num_perm, 1)
+    best_threshold = 0.0
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        candidate = (1 / bands) ** (1 / rows)
+        if best_threshold < candidate <= threshold * 0.9:
+            best, best_threshold = (bands, rows), candidate
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    Streaming MinHash/LSH near-duplicate detector.
+
+    Texts are added in priority order; add() reports the earlier text a new
+    one duplicates, or indexes it as an original.
+
+    Args:
+        threshold: Estimated Jaccard similarity at or above which two texts
+                   are near-duplicates (0-1)
+        num_perm: MinHash signature length (accuracy vs. speed)
+        shingle_size: Words per shingle
+        seed: Seed for the hash permutations (fixed for reproducibility)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        """Initialize detector."""
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _lsh_params(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[Hashable]] = {}
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+
+    def signature(self, text: str) -> tuple[int, ...] | None:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            Signature, or None if the text has fewer words than a shingle
+        """
+        words = TOKEN_RE.findall(text.lower())
+        size = self.shingle_size
+        if len(words) < size:
+            return None
+
+        hashes = {
+            int.from_bytes(
+                hashlib.blake2b(
+                    " ".join(words[i : i + size]).encode("utf-8"), digest_size=8
+                ).digest(),
+                "big",
+            )
+            for i in range(len(words) - size + 1)
+        }
+        # XOR with a random mask permutes the (uniform) 64-bit hash space
+        return tuple(min(h ^ mask for h in hashes) for mask in self._masks)
+
+    @staticmethod
+    def similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+        """
+        Estimate Jaccard similarity from two signatures.
+
+        Args:
+            sig_a: First signature
+            sig_b: Second signature
+
+        Returns:
+            Fraction of agreeing signature positions
+        """
+        return sum(a == b for a, b in zip(sig_a, sig_b, strict=True)) / len(sig_a)
+
+    def add(self, key: Hashable, text: str) -> Hashable | None:
+        """
+        Check a text against those already added, indexing it if original.
+
+        Args:
+            key: Identifier for the text (e.g., URL)
+            text: Text content
+
+        Returns:
+            Key of the most similar earlier text if this one is a
+            near-duplicate of it, otherwise None
+        """
+        sig = self.signature(text)
+        if sig is None:
+            return None
+
+        band_keys = [
+            (band, sig[band * self.rows : (band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+        candidates: set[Hashable] = set()
+        for band_key in band_keys:
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best_key, best_score = None, 0.0
+        for candidate in candidates:
+            score = self.similarity(sig, self._signatures[candidate])
+            if score > best_score:
+                best_key, best_score = candidate, score
+        if best_score >= self.threshold:
+            return best_key
+
+        self._signatures[key] = sig
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, []).append(key)
+        return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get detector statistics.
+
+        Returns:
+            Dict with indexed texts, buckets and LSH parameters
+        """
+        return {
+            "indexed": len(self._signatures),
+            "buckets": len(self._buckets),
+            "bands": self.bands,
+            "rows": self.rows,
+            "threshold": self.threshold,
+        }
+
+
+def find_near_duplicates(texts: list[str], threshold: float = 0.8) -> dict[int, int]:
+    """
+    Find near-duplicates in a list of texts (earlier texts win).
+
+    Args:
+        texts: Texts in priority order
+        threshold: Jaccard similarity threshold
+
+    Returns:
+        Mapping of duplicate index -> index of the earlier text it copies
+    """
+    detector = NearDuplicateDetector(threshold=threshold)
+    duplicates = {}
+    for index, text in enumerate(texts):
+        original = detector.add(index, text)
+        if original is not None:
+            duplicates[index] = original
+    return duplicates
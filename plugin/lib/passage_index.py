@@ -0,0 +1,171 @@
+"""
+Local retrieval index over research passages.
+
+Sending every slide the same leading research content wastes prompt tokens
+on material unrelated to that slide. PassageIndex is built once per
+research run and returns the passages most relevant to each slide:
+
+- Source content is split into sentence-aligned passages
+- Each passage becomes a hashed bag-of-words vector (sublinear TF x IDF,
+  L2-normalized); terms are hashed into a fixed number of buckets so memory
+  does not grow with vocabulary
+- Queries are scored by cosine similarity through an inverted index, so only
+  passages sharing a term with the query are touched
+
+Everything runs locally on CPU; no embedding service is called.
+
+Usage:
+    index = PassageIndex(research["sources"])
+    for passage in index.search("menu pricing strategy", k=4):
+        print(passage.score, passage.text)
+"""
+
+import math
+import zlib
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Any
+
+from .context_packer import split_passages
+from .keyword_engine import tokenize
+
+
+@dataclass
+class Passage:
+    """A retrievable piece of one source's content."""
+
+    source_index: int
+    position: int
+    text: str
+    score: float = 0.0
+
+
+class PassageIndex:
+    """
+    Hashed bag-of-words cosine index over research passages.
+
+    Args:
+        sources: Research sources with "content" (or "snippet")
+        passage_chars: Target passage length in characters
+        n_features: Number of hash buckets for terms
+    """
+
+    def __init__(
+        self,
+        sources: list[dict[str, Any]],
+        passage_chars: int = 500,
+        n_features: int = 2**18,
+    ):
+        """Build the index."""
+        self.sources = sources
+        self.n_features = n_features
+        self.passages: list[Passage] = []
+
+        vectors = []
+        document_frequency: Counter[int] = Counter()
+        for index, source in enumerate(sources):
+            content = source.get("content") or source.get("snippet") or ""
+            for position, text in enumerate(split_passages(content, passage_chars)):
+                counts = self._hash_counts(text)
+                if not counts:
+                    continue
+                self.passages.append(Passage(index, position, text))
+                vectors.append(counts)
+                document_frequency.update(counts.keys())
+
+        total = len(self.passages)
+        self._idf = {
+            bucket: math.log((1 + total) / (1 + df)) + 1
+            for bucket, df in document_frequency.items()
+        }
+
+        self._postings: dict[int, list[tuple[int, float]]] = {}
+        for passage_id, counts in enumerate(vectors):
+            for bucket, weight in self._weigh(counts).items():
+                self._postings.setdefault(bucket, []).append((passage_id, weight))
+
+    def _hash_counts(self, text: str) -> Counter[int]:
+        """Count hashed terms in text."""
+        return Counter(
+            zlib.crc32(term.encode("utf-8")) % self.n_features
+            for term in tokenize(text)
+        )
+
+    def _weigh(self, counts: Counter[int]) -> dict[int, float]:
+        """Turn bucket counts into an L2-normalized TF-IDF vector."""
+        weights = {
+            bucket: (1 + math.log(count)) * self._idf[bucket]
+            for bucket, count in counts.items()
+            if bucket in self._idf
+        }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        return {bucket: weight / norm for bucket, weight in weights.items()}
+
+    def search(
+        self, query: str, k: int = 4, source_indices: set[int] | None = None
+    ) -> list[Passage]:
+        """
+        Find the passages most similar to a query.
+
+        Args:
+            query: Query text (slide title, purpose, key points, ...)
+            k: Maximum passages returned
+            source_indices: Only consider passages of these sources
+
+        Returns:
+            Up to k passages with a positive score, best first (ties in
+            source, then position order)
+        """
+        scores: dict[int, float] = {}
+        for bucket, query_weight in self._weigh(self._hash_counts(query)).items():
+            for passage_id, weight in self._postings[bucket]:
+                scores[passage_id] = scores.get(passage_id, 0.0) + query_weight * weight
+
+        if source_indices is not None:
+            scores = {
+                passage_id: score
+                for passage_id, score in scores.items()
+                if self.passages[passage_id].source_index in source_indices
+            }
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [
+            replace(self.passages[passage_id], score=score)
+            for passage_id, score in ranked
+        ]
+
+    def leading(
+        self, k: int = 4, source_indices: set[int] | None = None
+    ) -> list[Passage]:
+        """
+        Get the first passage of each source, in source order.
+
+        Used when a query matches nothing, so callers still get some context.
+
+        Args:
+            k: Maximum passages returned
+            source_indices: Only consider these sources
+
+        Returns:
+            Up to k opening passages
+        """
+        leading = [
+            passage
+            for passage in self.passages
+            if passage.position == 0
+            and (source_indices is None or passage.source_index in source_indices)
+        ]
+        return leading[:k]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with source, passage and term bucket counts
+        """
+        return {
+            "sources": len(self.sources),
+            "passages": len(self.passages),
+            "buckets": len(self._postings),
+        }
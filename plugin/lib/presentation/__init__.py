@@ -10,6 +10,7 @@ This module contains the core presentation generation functionality:
 - visual_validator: Visual validation (experimental)
 - refinement_engine: Iterative refinement
 - slide_exporter: Slide export utilities
+- slide_preview: Approximate slide preview rendering
 """
 
 from .assembler import assemble_presentation
@@ -22,6 +23,7 @@ from .parser import (
     TextItem,
     parse_presentation,
 )
+from .slide_preview import SlidePreview, SlidePreviewRenderer
 from .template_base import PresentationTemplate as TemplateBase
 from .type_classifier import SlideTypeClassifier, TypeClassification
 
@@ -30,6 +32,9 @@ __all__ = [
     "BulletItem",
     "CodeBlockItem",
     "Slide",
+    # Slide preview
+    "SlidePreview",
+    "SlidePreviewRenderer",
     # Type classifier
     "SlideTypeClassifier",
     "TableItem",
@@ -38,7 +38,9 @@ from .parser import (
 )
 from .refinement_engine import RefinementEngine
 from .slide_exporter import SlideExporter
+from .slide_preview import SlidePreviewRenderer
 from .type_classifier import SlideTypeClassifier, TypeClassification
+from .validation_cache import ValidationCache
 from .visual_validator import VisualValidator
 
 
@@ -56,6 +58,8 @@ def assemble_presentation(
     max_refinement_attempts: int = 3,
     validation_dpi: int = 150,
     progress_callback: Callable[[str, int, int], None] | None = None,
+    *,
+    stop_on_preview_issues: bool = False,
 ) -> str:
     """
     Main workflow to assemble a presentation from markdown.
@@ -74,6 +78,8 @@ def assemble_presentation(
         max_refinement_attempts: Maximum refinement attempts per slide (default: 3)
         validation_dpi: DPI for slide export during validation (default: 150)
         progress_callback: Optional callback(stage, current, total) for progress
+        stop_on_preview_issues: If True, skip export and vision validation for
+            slides whose approximate preview shows layout issues (default: False)
 
     Returns:
         Path to the generated PowerPoint file
@@ -172,15 +178,21 @@ def assemble_presentation(
     validator = None
     refiner = None
     exporter = None
+    previewer = None
     validation_dir = None
 
     if enable_validation:
         try:
-            validator = VisualValidator()
-            refiner = RefinementEngine()
-            exporter = SlideExporter(resolution=validation_dpi)
             validation_dir = output_dir / "validation"
             validation_dir.mkdir(parents=True, exist_ok=True)
+            validator = VisualValidator(
+                cache=ValidationCache(
+                    cache_path=str(validation_dir / "validation_cache.json")
+                )
+            )
+            refiner = RefinementEngine()
+            exporter = SlideExporter(resolution=validation_dpi)
+            previewer = SlidePreviewRenderer.for_template(template_id)
             print(
                 f"[*] Validation enabled (max {max_refinement_attempts} refinements per slide)"
             )
@@ -210,6 +222,8 @@ def assemble_presentation(
                 max_attempts=max_refinement_attempts,
                 fast_mode=fast_mode,
                 notext=notext,
+                previewer=previewer,
+                stop_on_preview_issues=stop_on_preview_issues,
             )
         else:
             # Standard build without validation
@@ -341,16 +355,22 @@ def _build_slide_with_validation(
     max_attempts: int,
     fast_mode: bool,
     notext: bool,
+    previewer: SlidePreviewRenderer | None = None,
+    *,
+    stop_on_preview_issues: bool = False,
 ) -> None:
     """
     Build slide with validation and refinement loop.
 
     Workflow per slide:
     1. Build slide in presentation
-    2. Save temporary presentation
-    3. Export slide to image
-    4. Validate slide image
-    5. If validation fails and attempts remain:
+    2. Render approximate preview (if previewer given) and log layout issues;
+       with stop_on_preview_issues, those issues (which image refinement
+       cannot fix) skip export and vision validation
+    3. Save temporary presentation
+    4. Export slide to image
+    5. Validate slide image
+    6. If validation fails and attempts remain:
        - Generate refinement strategy
        - Regenerate image with refined prompt
        - Remove last slide from presentation
@@ -371,6 +391,9 @@ def _build_slide_with_validation(
         max_attempts: Maximum refinement attempts
         fast_mode: Whether to use fast mode for images
         notext: Whether to generate text-free images
+        previewer: Optional SlidePreviewRenderer for the first-pass layout check
+        stop_on_preview_issues: If True, stop after a failed preview check
+            instead of continuing to export and vision validation
     """
     attempt = 0
     previous_score = None
@@ -384,6 +407,26 @@ def _build_slide_with_validation(
             template, slide, classification, image_paths, images_dir
         )
 
+        # Cheap first-pass check on an approximate preview before rasterizing
+        if previewer is not None:
+            preview_image = image_paths.get(slide.number)
+            preview = previewer.render(
+                slide,
+                classification.template_method,
+                str(preview_image) if preview_image else None,
+            )
+            if preview.has_issues:
+                preview.save(str(validation_dir / f"slide-{slide.number}-preview.png"))
+                result = validator.validate_preview(preview, slide)
+                print(f"   [WARN] Slide {slide.number} preview check failed")
+                for issue in result.issues:
+                    print(f"      - {issue}")
+                if stop_on_preview_issues:
+                    print(
+                        "   [WARN] Skipping visual validation (stop_on_preview_issues)"
+                    )
+                    break
+
         # Save temporary presentation for export
         template.save(str(temp_pptx))
 
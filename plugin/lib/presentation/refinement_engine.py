@@ -17,6 +17,7 @@ Refinement Approach:
 """
 
 import re
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 # Import from local modules
@@ -350,6 +351,52 @@ class RefinementEngine:
         # Failed validation - definitely retry if attempts remain
         return True
 
+    async def refine_async(
+        self,
+        slide: Slide,
+        validate: Callable[[int], Awaitable[ValidationResult]],
+        regenerate: Callable[[RefinementStrategy, int], Awaitable[None]],
+        max_attempts: int = 3,
+    ) -> tuple[ValidationResult, int]:
+        """
+        Run the validate -> refine -> regenerate loop for one slide (async).
+
+        The caller supplies the I/O steps as coroutines (e.g., export and
+        VisualValidator.validate_slide_async for validate, async image
+        generation for regenerate), so many slides can be refined
+        concurrently with asyncio.gather while sharing one AsyncGeminiClient
+        and its rate limiting.
+
+        Args:
+            slide: Original Slide object
+            validate: Coroutine function(attempt_number) returning the
+                      ValidationResult for the slide's current render
+            regenerate: Coroutine function(strategy, attempt_number) that
+                        applies a RefinementStrategy before the next attempt
+            max_attempts: Maximum validation attempts (default: 3)
+
+        Returns:
+            Tuple of (final ValidationResult, attempts used)
+
+        Example:
+            >>> result, attempts = await engine.refine_async(
+            ...     slide, validate=validate_render, regenerate=regenerate_image
+            ... )
+        """
+        previous_score = None
+        attempt = 0
+
+        while True:
+            attempt += 1
+            result = await validate(attempt)
+
+            if not self.should_retry(result, attempt, max_attempts, previous_score):
+                return result, attempt
+
+            strategy = self.generate_refinement(slide, result, attempt, previous_score)
+            await regenerate(strategy, attempt)
+            previous_score = result.score
+
     def _calculate_confidence(
         self,
         pattern_matches: int,
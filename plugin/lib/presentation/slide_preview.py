@@ -0,0 +1,335 @@
+"""
+Approximate Slide Preview Renderer
+
+Draws a lightweight preview of a slide directly from a template's layout
+specifications (text boxes, image boxes, panels and background colors) into
+a PIL image, without building or exporting a PowerPoint file.
+
+The preview is intentionally approximate:
+- Fonts are rendered with Pillow's built-in font scaled to the spec point size
+- Images are drawn as placeholders (or thumbnails when the file exists)
+- Text is word-wrapped to the box width to estimate overflow
+
+Because it needs no PowerPoint/LibreOffice installation and touches no API,
+it is cheap enough to run for every slide (in parallel via render_many) and
+is used as a first-pass layout check before true rasterization and Gemini
+vision validation.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = None
+    ImageDraw = None
+    ImageFont = None
+
+from .parser import Slide
+
+
+# Template method -> layout key used in template LAYOUTS dicts
+LAYOUT_FOR_METHOD = {
+    "add_title_slide": "title_slide",
+    "add_section_break": "section_break",
+    "add_content_slide": "content_text_only",
+    "add_image_slide": "content_full_image",
+    "add_text_and_image_slide": "content_text_and_image",
+}
+
+# Layouts that require an image to be meaningful
+IMAGE_LAYOUTS = {"content_full_image", "content_text_and_image"}
+
+# Default bullet point sizes by level when a body spec has no "levels" entry
+DEFAULT_BULLET_SIZES = {0: 15, 1: 13, 2: 11}
+
+# Indent per bullet level (inches)
+BULLET_INDENT = 0.3
+
+# Line height as a multiple of font size
+LINE_SPACING = 1.2
+
+# Text taller than this multiple of its box is reported as overflow
+OVERFLOW_TOLERANCE = 1.25
+
+POINTS_PER_INCH = 72
+
+
+@dataclass
+class SlidePreview:
+    """
+    Approximate rendering of a single slide.
+
+    Attributes:
+        slide_number: Slide number from the parser
+        layout: Layout key used for rendering (e.g., "content_text_only")
+        image: Rendered PIL image (None if Pillow is unavailable)
+        issues: Layout problems detected while rendering
+        overflow_ratios: Dict of element name -> rendered text height / box height
+    """
+
+    slide_number: int
+    layout: str
+    image: object | None
+    issues: list[str] = field(default_factory=list)
+    overflow_ratios: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def has_issues(self) -> bool:
+        """Whether the preview found layout problems."""
+        return bool(self.issues)
+
+    def save(self, path: str) -> None:
+        """
+        Save the preview image to disk.
+
+        Args:
+            path: Output file path (format inferred from extension)
+        """
+        if self.image is not None:
+            self.image.convert("RGB").save(path)
+
+
+class SlidePreviewRenderer:
+    """
+    Renders approximate slide previews from template layout specifications.
+
+    Example:
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        preview = renderer.render(slide, "add_content_slide")
+        if preview.has_issues:
+            print(preview.issues)
+    """
+
+    def __init__(
+        self,
+        layouts: dict,
+        slide_width: float,
+        slide_height: float,
+        pixels_per_inch: int = 48,
+    ):
+        """
+        Initialize renderer.
+
+        Args:
+            layouts: Template LAYOUTS dict (layout key -> element specs)
+            slide_width: Slide width in inches
+            slide_height: Slide height in inches
+            pixels_per_inch: Preview resolution (default: 48, ~640px wide for 16:9)
+        """
+        self.layouts = layouts
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self.pixels_per_inch = pixels_per_inch
+        self._font_cache: dict[int, object] = {}
+
+    @classmethod
+    def for_template(
+        cls, template_id: str, pixels_per_inch: int = 48
+    ) -> "SlidePreviewRenderer":
+        """
+        Create a renderer from a registered template's layout specs.
+
+        Args:
+            template_id: Template identifier (e.g., 'cfa', 'stratfield')
+            pixels_per_inch: Preview resolution
+
+        Returns:
+            SlidePreviewRenderer configured for the template
+
+        Raises:
+            ValueError: If template_id is not registered
+        """
+        from plugin.templates import get_template_class
+
+        template_class = get_template_class(template_id)
+        width, height = template_class.SLIDE_SIZE
+        return cls(template_class.LAYOUT_SPECS, width, height, pixels_per_inch)
+
+    def render(
+        self,
+        slide: Slide,
+        template_method: str,
+        image_path: str | None = None,
+    ) -> SlidePreview:
+        """
+        Render an approximate preview of a slide.
+
+        Args:
+            slide: Slide object from parser
+            template_method: Template method the assembler will call
+                             (e.g., "add_content_slide")
+            image_path: Optional path to the slide's generated image
+
+        Returns:
+            SlidePreview with image and any detected layout issues
+        """
+        layout_key = LAYOUT_FOR_METHOD.get(template_method, "content_text_only")
+        if layout_key in IMAGE_LAYOUTS and not image_path:
+            # Assembler falls back to a content slide when no image exists
+            layout_key = "content_text_only"
+
+        layout = self.layouts.get(layout_key, {})
+        preview = SlidePreview(slide_number=slide.number, layout=layout_key, image=None)
+
+        if not PIL_AVAILABLE:
+            # No preview possible - report no issues so validation proceeds
+            return preview
+
+        size = (self._px(self.slide_width), self._px(self.slide_height))
+        background = layout.get("background_color") or "#808080"
+        image = Image.new("RGB", size, background)
+        draw = ImageDraw.Draw(image)
+
+        # Filled panels first so text/images draw on top
+        for spec in layout.values():
+            if isinstance(spec, dict) and "fill" in spec:
+                draw.rectangle(self._box(spec), fill=spec["fill"])
+
+        # Image and asset placeholders
+        for name, spec in layout.items():
+            if not isinstance(spec, dict) or "font" in spec or "fill" in spec:
+                continue
+            if name == "image":
+                self._draw_image(image, draw, spec, image_path, preview)
+            else:
+                draw.rectangle(self._box(spec), outline="#B0B0B0")
+
+        # Text elements
+        texts = {
+            "title": slide.title,
+            "subtitle": slide.subtitle or "",
+            "slide_number": str(slide.number),
+        }
+        for name, text in texts.items():
+            spec = layout.get(name)
+            if spec and text:
+                self._draw_text_block(draw, name, spec, [(text, 0)], preview)
+
+        body = layout.get("body")
+        if body and slide.content_bullets:
+            self._draw_text_block(draw, "body", body, slide.content_bullets, preview)
+
+        preview.image = image
+        return preview
+
+    def render_many(
+        self,
+        jobs: list[tuple[Slide, str, str | None]],
+        max_workers: int = 4,
+    ) -> list[SlidePreview]:
+        """
+        Render several slides in parallel.
+
+        Args:
+            jobs: List of (slide, template_method, image_path) tuples
+            max_workers: Maximum concurrent renders
+
+        Returns:
+            List of SlidePreview objects in the same order as jobs
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda job: self.render(*job), jobs))
+
+    def _px(self, inches: float) -> int:
+        """Convert inches to preview pixels."""
+        return round(inches * self.pixels_per_inch)
+
+    def _box(self, spec: dict) -> tuple[int, int, int, int]:
+        """Convert an x/y/w/h spec (inches) to a pixel bounding box."""
+        x0, y0 = self._px(spec["x"]), self._px(spec["y"])
+        return (x0, y0, x0 + self._px(spec["w"]), y0 + self._px(spec["h"]))
+
+    def _font(self, size_pt: float):
+        """Get a (cached) Pillow font scaled from points to preview pixels."""
+        size_px = max(6, round(size_pt * self.pixels_per_inch / POINTS_PER_INCH))
+        if size_px not in self._font_cache:
+            try:
+                font = ImageFont.load_default(size=size_px)
+            except TypeError:
+                # Pillow < 10.1 has no scalable default font
+                font = ImageFont.load_default()
+            self._font_cache[size_px] = font
+        return self._font_cache[size_px]
+
+    def _draw_image(self, image, draw, spec: dict, image_path, preview) -> None:
+        """Draw a generated image thumbnail, or a placeholder if unreadable."""
+        box = self._box(spec)
+        if image_path and Path(image_path).exists():
+            try:
+                with Image.open(image_path) as source:
+                    thumb = source.convert("RGB")
+                    thumb.thumbnail((box[2] - box[0], box[3] - box[1]))
+                    image.paste(thumb, (box[0], box[1]))
+                return
+            except OSError:
+                preview.issues.append(f"Image could not be read: {image_path}")
+        elif image_path:
+            preview.issues.append(f"Image file missing: {image_path}")
+        draw.rectangle(box, fill="#CCCCCC")
+
+    def _draw_text_block(
+        self,
+        draw,
+        name: str,
+        spec: dict,
+        lines: list[tuple[str, int]],
+        preview: SlidePreview,
+    ) -> None:
+        """
+        Draw word-wrapped text into a spec box and record overflow.
+
+        Args:
+            draw: ImageDraw for the preview
+            name: Element name (for issue reporting)
+            spec: Element spec with x/y/w/h and font settings
+            lines: List of (text, level) tuples
+            preview: SlidePreview to record issues on
+        """
+        x0, y0, x1, y1 = self._box(spec)
+        color = spec.get("color", "#000000")
+        levels = spec.get("levels", {})
+        y = y0
+
+        for text, level in lines:
+            size = spec.get("size") or levels.get(level, {}).get(
+                "size", DEFAULT_BULLET_SIZES.get(level, 11)
+            )
+            font = self._font(size)
+            indent = self._px(BULLET_INDENT * level) if name == "body" else 0
+            line_height = round(
+                size * LINE_SPACING * self.pixels_per_inch / POINTS_PER_INCH
+            )
+            for wrapped in self._wrap(text, font, max(1, x1 - x0 - indent)):
+                if y + line_height <= y1:
+                    draw.text((x0 + indent, y), wrapped, fill=color, font=font)
+                y += line_height
+
+        box_height = max(1, y1 - y0)
+        ratio = (y - y0) / box_height
+        preview.overflow_ratios[name] = ratio
+        if ratio > OVERFLOW_TOLERANCE:
+            preview.issues.append(
+                f"Text in {name} overflows its box (~{int(ratio * 100)}% of available height)"
+            )
+
+    @staticmethod
+    def _wrap(text: str, font, max_width: int) -> list[str]:
+        """Greedy word wrap using font advance widths."""
+        lines = []
+        current = ""
+        for word in text.split():
+            candidate = f"{current} {word}" if current else word
+            if current and font.getlength(candidate) > max_width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        lines.append(current)
+        return lines
@@ -37,6 +37,13 @@ class PresentationTemplate(ABC):
             # ... implement other methods
     """
 
+    # Layout specifications (layout key -> element specs in inches), used by
+    # SlidePreviewRenderer to draw approximate previews without python-pptx
+    LAYOUT_SPECS: dict = {}
+
+    # Slide (width, height) in inches
+    SLIDE_SIZE: tuple[float, float] = (13.333, 7.5)
+
     @property
     @abstractmethod
     def name(self) -> str:
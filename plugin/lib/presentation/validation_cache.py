@@ -0,0 +1,243 @@
+"""
+Perceptual-Hash Validation Cache
+
+Caches visual validation results keyed by a perceptual hash (dHash) of the
+exported slide image, so near-identical renders (e.g., a refinement attempt
+that barely changed the slide) reuse the previous result instead of making
+another Gemini vision call.
+
+dHash:
+- Image is converted to grayscale and resized to 9x8 pixels
+- Each bit records whether a pixel is brighter than its right neighbour
+- Near-duplicate images differ in only a few of the 64 bits (Hamming distance)
+
+Entries are scoped by a context key (hash of the validation prompt) so the
+same image validated against a different slide intent or style is never
+served from cache.
+"""
+
+import hashlib
+import io
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = None
+
+
+# dHash grid size (produces HASH_SIZE * HASH_SIZE bits)
+HASH_SIZE = 8
+
+
+def compute_dhash(image_source: str | bytes) -> int | None:
+    """
+    Compute a 64-bit difference hash for an image.
+
+    Args:
+        image_source: Image file path or raw encoded image bytes
+
+    Returns:
+        Hash as an integer, or None if the image cannot be decoded
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    try:
+        source = (
+            io.BytesIO(image_source)
+            if isinstance(image_source, bytes)
+            else image_source
+        )
+        with Image.open(source) as img:
+            small = img.convert("L").resize(
+                (HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BILINEAR
+            )
+            pixels = small.tobytes()
+    except Exception:
+        # Undecodable or unsupported image - treat as uncacheable
+        return None
+
+    value = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(hash_a: int, hash_b: int) -> int:
+    """
+    Count differing bits between two hashes.
+
+    Args:
+        hash_a: First hash
+        hash_b: Second hash
+
+    Returns:
+        Number of differing bits
+    """
+    return bin(hash_a ^ hash_b).count("1")
+
+
+def context_key(text: str) -> str:
+    """
+    Build a stable cache scope key from validation context (e.g., the prompt).
+
+    Args:
+        text: Context text
+
+    Returns:
+        Hex digest identifying the context
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class ValidationCache:
+    """
+    Local cache of validation results keyed by perceptual image hash.
+
+    Lookups match any stored hash within max_distance bits for the same
+    context key. Optionally persisted to a JSON file so results survive
+    across runs.
+
+    Example:
+        cache = ValidationCache(cache_path="validation/validation_cache.json")
+        image_hash = compute_dhash("slide-3-attempt-2.jpg")
+        cached = cache.lookup(image_hash, context_key(prompt))
+        if cached is None:
+            result = call_vision_api(...)
+            cache.store(image_hash, context_key(prompt), asdict(result))
+    """
+
+    def __init__(
+        self,
+        cache_path: str | None = None,
+        max_distance: int = 4,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize validation cache.
+
+        Args:
+            cache_path: Optional JSON file for persistence (None = in-memory only)
+            max_distance: Maximum Hamming distance treated as a near-duplicate
+            max_entries: Maximum cached results (oldest evicted first)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_path and self.cache_path.exists():
+            self._load()
+
+    def lookup(self, image_hash: int | None, key: str) -> dict[str, Any] | None:
+        """
+        Find a cached result for a near-duplicate image.
+
+        Args:
+            image_hash: dHash of the image (None always misses)
+            key: Context key the result must belong to
+
+        Returns:
+            Cached result payload, or None on miss
+        """
+        if image_hash is None:
+            self.misses += 1
+            return None
+
+        best = None
+        best_distance = self.max_distance + 1
+        for entry_key, entry_hash in self._entries:
+            if entry_key != key:
+                continue
+            distance = hamming_distance(entry_hash, image_hash)
+            if distance < best_distance:
+                best, best_distance = (entry_key, entry_hash), distance
+                if distance == 0:
+                    break
+
+        if best is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(best)
+        return self._entries[best]
+
+    def store(self, image_hash: int | None, key: str, payload: dict[str, Any]) -> None:
+        """
+        Store a validation result payload.
+
+        Args:
+            image_hash: dHash of the image (None is ignored)
+            key: Context key
+            payload: JSON-serializable result (e.g., dataclasses.asdict(result))
+        """
+        if image_hash is None:
+            return
+
+        self._entries[(key, image_hash)] = payload
+        self._entries.move_to_end((key, image_hash))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        if self.cache_path:
+            self._save()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        if self.cache_path:
+            self._save()
+
+    def _load(self) -> None:
+        """Load persisted entries, ignoring unreadable cache files."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            for entry in data.get("entries", []):
+                self._entries[(entry["key"], int(entry["hash"], 16))] = entry["result"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[WARN] Ignoring unreadable validation cache {self.cache_path}: {e}")
+            self._entries.clear()
+
+    def _save(self) -> None:
+        """Persist entries to the cache file."""
+        entries = [
+            {"key": key, "hash": f"{image_hash:016x}", "result": payload}
+            for (key, image_hash), payload in self._entries.items()
+        ]
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(
+                json.dumps({"entries": entries}), encoding="utf-8"
+            )
+        except OSError as e:
+            print(f"[WARN] Failed to write validation cache {self.cache_path}: {e}")
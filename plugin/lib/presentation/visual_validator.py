@@ -22,16 +22,35 @@ PRODUCTION NOTES (v2.0 Enhancement):
 - Graceful Degradation: Returns passing score if validation fails (prevents blocking workflow)
 - Retry Logic: Automatically retries transient API failures (max 3 attempts)
 - Error Recovery: Comprehensive error handling for API, network, and image issues
+- Perceptual Cache: Near-identical slide renders (dHash) reuse prior results
+  instead of repeating the vision call
+- Upload Downsampling: Images are downscaled to a max edge (default 1280px) and
+  re-encoded once per slide; the bytes are reused across retries
+- Async Validation: validate_slide_async/validate_slides_async send requests
+  through a shared AsyncGeminiClient (pooled HTTP connections, global
+  APIRateLimiter) so many slides can be validated concurrently
 """
 
+import asyncio
+import base64
+import io
 import json
 import os
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = None
+
 try:
     from google import genai
     from google.genai import types
@@ -44,6 +63,46 @@ except ImportError:
 
 # Import Slide from parser
 from .parser import Slide
+from .slide_preview import SlidePreview
+from .validation_cache import ValidationCache, compute_dhash, context_key
+
+
+if TYPE_CHECKING:
+    from plugin.lib.async_gemini_client import AsyncGeminiClient
+
+
+# Scoring rubric shared by single-slide and batched validation prompts
+VALIDATION_RUBRIC = """VALIDATION RUBRIC (100 points total):
+
+1. **CONTENT ACCURACY** (30 points)
+   - Title matches intent and is clearly visible
+   - All bullet points present and accurate
+   - No missing or incorrect content
+   - Speaker notes context preserved in visible elements
+
+2. **VISUAL HIERARCHY** (20 points)
+   - Title stands out prominently
+   - Bullet points are readable and well-sized
+   - Proper use of font sizes and weights
+   - Clear information flow and structure
+
+3. **BRAND ALIGNMENT** (20 points)
+   - Colors match brand palette
+   - Fonts match brand guidelines
+   - Overall style is consistent with brand identity
+   - Professional appearance appropriate for brand
+
+4. **IMAGE QUALITY** (15 points, if applicable)
+   - Image is relevant to content
+   - Image is properly sized and positioned
+   - Image is clear and high-quality
+   - Image doesn't obscure text
+
+5. **LAYOUT EFFECTIVENESS** (15 points)
+   - Good use of whitespace
+   - Balanced composition
+   - Professional polish
+   - No visual clutter or awkward spacing"""
 
 
 @dataclass
@@ -97,12 +156,36 @@ class VisualValidator:
         "layout_effectiveness": 0.15,
     }
 
-    def __init__(self, api_key: str | None = None):
+    # Longest image edge sent to Gemini (layout judgment doesn't need 300 DPI)
+    DEFAULT_MAX_IMAGE_EDGE = 1280
+
+    # JPEG quality for re-encoded upload images
+    UPLOAD_JPEG_QUALITY = 85
+
+    # Slides per batched vision request (validate_slides_batch)
+    DEFAULT_BATCH_SIZE = 4
+
+    # Gemini model used for vision validation
+    VISION_MODEL = "gemini-2.0-flash-exp"
+
+    # Concurrent requests for validate_slides_async
+    DEFAULT_MAX_CONCURRENT = 3
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache: ValidationCache | None = None,
+        max_image_edge: int | None = DEFAULT_MAX_IMAGE_EDGE,
+    ):
         """
         Initialize visual validator.
 
         Args:
             api_key: Optional Google API key. If not provided, uses GOOGLE_API_KEY env var.
+            cache: Optional ValidationCache for near-duplicate images.
+                   Defaults to an in-memory cache.
+            max_image_edge: Longest edge (pixels) of images sent to Gemini.
+                            None disables downsampling.
 
         Raises:
             EnvironmentError: If API key not provided and not in environment
@@ -120,6 +203,19 @@ class VisualValidator:
         except Exception as e:
             raise OSError(f"Failed to initialize Gemini client: {e}")
 
+        self.cache = cache if cache is not None else ValidationCache()
+        self.max_image_edge = max_image_edge
+        self.upload_stats = {
+            "images": 0,
+            "downscaled": 0,
+            "original_bytes": 0,
+            "prepared_bytes": 0,
+            "bytes_sent": 0,
+            "api_calls": 0,
+        }
+        # Gemini requests made by the last validate_slides_batch() call
+        self.last_batch_api_calls = 0
+
     def validate_slide(
         self,
         slide_image_path: str,
@@ -151,23 +247,63 @@ class VisualValidator:
         # Build validation prompt
         prompt = self._build_validation_prompt(original_slide, style_config, slide_type)
 
+        # Read and downscale once - the same bytes are reused across retries
+        try:
+            image_bytes = self._prepare_image(image_path)
+        except FileNotFoundError:
+            print(f"[ERROR] Slide image not found: {slide_image_path}")
+            raise
+        except OSError as e:
+            print(
+                f"[ERROR] Failed to read image for slide {original_slide.number}: {e}"
+            )
+            return self._unavailable_result(f"image unreadable: {e}")
+
+        # Validate image size (warn if > 10MB)
+        image_size_mb = len(image_bytes) / (1024 * 1024)
+        if image_size_mb > 10:
+            print(
+                f"[WARNING] Large image size: {image_size_mb:.1f}MB for slide {original_slide.number}"
+            )
+
+        # Reuse the result of a near-identical render of the same slide intent
+        image_hash = compute_dhash(image_bytes)
+        cache_key = context_key(prompt)
+        cached = self.cache.lookup(image_hash, cache_key)
+        if cached is not None:
+            print(
+                f"[CACHE] Reusing validation for near-identical render of slide {original_slide.number}"
+            )
+            return ValidationResult(**cached)
+
+        result = self._request_validation(image_bytes, prompt, original_slide.number)
+
+        # Only cache real scores, not parse-error/unavailable fallbacks
+        if result.rubric_scores:
+            self.cache.store(image_hash, cache_key, asdict(result))
+
+        return result
+
+    def _request_validation(
+        self, image_bytes: bytes, prompt: str, slide_number: int
+    ) -> ValidationResult:
+        """
+        Send one slide image to Gemini Vision with retry logic.
+
+        Args:
+            image_bytes: Prepared image bytes
+            prompt: Single-slide validation prompt
+            slide_number: Slide number (for logging)
+
+        Returns:
+            ValidationResult (graceful pass-by-default fallback on failure)
+        """
         # Upload image and get validation feedback with retry logic
         max_retries = 3
         retry_delay = 2.0  # seconds
 
         for attempt in range(1, max_retries + 1):
             try:
-                # Read image file
-                with open(image_path, "rb") as f:
-                    image_bytes = f.read()
-
-                # Validate image size (warn if > 10MB)
-                image_size_mb = len(image_bytes) / (1024 * 1024)
-                if image_size_mb > 10:
-                    print(
-                        f"[WARNING] Large image size: {image_size_mb:.1f}MB for slide {original_slide.number}"
-                    )
-
                 # Configure for text response analyzing the image
                 config = types.GenerateContentConfig(
                     response_modalities=["TEXT"],
@@ -175,8 +311,10 @@ class VisualValidator:
                 )
 
                 # Call Gemini Vision with inline image
+                self.upload_stats["api_calls"] += 1
+                self.upload_stats["bytes_sent"] += len(image_bytes)
                 response = self.client.models.generate_content(
-                    model="gemini-2.0-flash-exp",
+                    model=self.VISION_MODEL,
                     contents=[
                         types.Part.from_bytes(data=image_bytes, mime_type="image/jpeg"),
                         prompt,
@@ -185,21 +323,12 @@ class VisualValidator:
                 )
 
                 # Parse validation response
-                result = self._parse_validation_response(
-                    response.text, original_slide.number
-                )
-
-                return result
-
-            except FileNotFoundError:
-                # File errors are not transient - don't retry
-                print(f"[ERROR] Slide image not found: {slide_image_path}")
-                raise
+                return self._parse_validation_response(response.text, slide_number)
 
             except ValueError as e:
                 # Validation parsing errors are not transient - don't retry
                 print(
-                    f"[ERROR] Invalid validation response for slide {original_slide.number}: {e}"
+                    f"[ERROR] Invalid validation response for slide {slide_number}: {e}"
                 )
                 break
 
@@ -210,44 +339,522 @@ class VisualValidator:
 
                 if attempt < max_retries:
                     print(
-                        f"[WARNING] Validation attempt {attempt} failed for slide {original_slide.number}: {error_type} - {error_msg}"
+                        f"[WARNING] Validation attempt {attempt} failed for slide {slide_number}: {error_type} - {error_msg}"
                     )
                     print(f"          Retrying in {retry_delay}s...")
                     time.sleep(retry_delay)
                     retry_delay *= 1.5  # Exponential backoff
                 else:
                     print(
-                        f"[ERROR] Validation failed for slide {original_slide.number} after {max_retries} attempts: {error_type} - {error_msg}"
+                        f"[ERROR] Validation failed for slide {slide_number} after {max_retries} attempts: {error_type} - {error_msg}"
                     )
 
         # All retries exhausted or non-retryable error - graceful degradation
+        return self._unavailable_result(f"error after {max_retries} attempts")
+
+    def _unavailable_result(self, reason: str) -> ValidationResult:
+        """
+        Build the pass-by-default result used when validation cannot run.
+
+        Args:
+            reason: Why validation was unavailable
+
+        Returns:
+            Passing ValidationResult at the threshold score with no rubric scores
+        """
         return ValidationResult(
             passed=True,  # Pass by default to avoid blocking workflow
             score=self.VALIDATION_THRESHOLD,
             issues=[],
             suggestions=[],
-            raw_feedback=f"Validation unavailable (error after {max_retries} attempts)",
+            raw_feedback=f"Validation unavailable ({reason})",
             rubric_scores={},
         )
 
-    def _build_validation_prompt(
-        self, slide: Slide, style_config: dict, slide_type: str
+    async def validate_slide_async(
+        self,
+        slide_image_path: str,
+        original_slide: Slide,
+        style_config: dict,
+        slide_type: str,
+        client: "AsyncGeminiClient",
+    ) -> ValidationResult:
+        """
+        Validate a slide without blocking the event loop.
+
+        Same prompt, caching and graceful degradation as validate_slide(), but
+        the request goes through an AsyncGeminiClient, so it shares that
+        client's connection pool and the global APIRateLimiter, and retries
+        back off with asyncio.sleep instead of time.sleep.
+
+        Args:
+            slide_image_path: Path to exported slide image (JPG)
+            original_slide: Original Slide object from parser
+            style_config: Style configuration dict (brand colors, fonts, etc.)
+            slide_type: Classified slide type ("title", "section", "content", etc.)
+            client: Initialized AsyncGeminiClient (inside 'async with')
+
+        Returns:
+            ValidationResult with pass/fail, score, issues, and suggestions
+
+        Raises:
+            FileNotFoundError: If slide image doesn't exist
+        """
+        image_path = Path(slide_image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Slide image not found: {slide_image_path}")
+
+        prompt = self._build_validation_prompt(original_slide, style_config, slide_type)
+
+        # Decoding/resizing is CPU-bound - keep it off the event loop
+        try:
+            image_bytes = await asyncio.to_thread(self._prepare_image, image_path)
+        except FileNotFoundError:
+            print(f"[ERROR] Slide image not found: {slide_image_path}")
+            raise
+        except OSError as e:
+            print(
+                f"[ERROR] Failed to read image for slide {original_slide.number}: {e}"
+            )
+            return self._unavailable_result(f"image unreadable: {e}")
+
+        image_hash = compute_dhash(image_bytes)
+        cache_key = context_key(prompt)
+        cached = self.cache.lookup(image_hash, cache_key)
+        if cached is not None:
+            print(
+                f"[CACHE] Reusing validation for near-identical render of slide {original_slide.number}"
+            )
+            return ValidationResult(**cached)
+
+        parts = [
+            {
+                "inlineData": {
+                    "mimeType": "image/jpeg",
+                    "data": base64.b64encode(image_bytes).decode("ascii"),
+                }
+            },
+            {"text": prompt},
+        ]
+
+        try:
+            self.upload_stats["api_calls"] += 1
+            self.upload_stats["bytes_sent"] += len(image_bytes)
+            response_text = await client.generate_text(
+                parts, model=self.VISION_MODEL, temperature=0.3
+            )
+        except Exception as e:
+            # Client already retried transient failures - degrade gracefully
+            print(
+                f"[ERROR] Validation failed for slide {original_slide.number}: {type(e).__name__} - {e}"
+            )
+            return self._unavailable_result(f"error: {type(e).__name__}")
+
+        result = self._parse_validation_response(response_text, original_slide.number)
+        if result.rubric_scores:
+            self.cache.store(image_hash, cache_key, asdict(result))
+        return result
+
+    async def validate_slides_async(
+        self,
+        items: list[tuple[str, Slide, str]],
+        style_config: dict,
+        client: "AsyncGeminiClient",
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    ) -> list[ValidationResult]:
+        """
+        Validate several slides concurrently.
+
+        Concurrency is bounded by max_concurrent; request pacing is further
+        governed by the client's rate limiting.
+
+        Args:
+            items: List of (slide_image_path, original_slide, slide_type) tuples
+            style_config: Style configuration dict (shared by all slides)
+            client: Initialized AsyncGeminiClient (inside 'async with')
+            max_concurrent: Maximum in-flight validations
+
+        Returns:
+            List of ValidationResult objects in the same order as items
+
+        Example:
+            >>> async with AsyncGeminiClient() as client:
+            ...     results = await validator.validate_slides_async(
+            ...         items, style_config, client, max_concurrent=5
+            ...     )
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def validate_with_semaphore(item: tuple[str, Slide, str]):
+            slide_image_path, slide, slide_type = item
+            async with semaphore:
+                return await self.validate_slide_async(
+                    slide_image_path, slide, style_config, slide_type, client
+                )
+
+        tasks = [validate_with_semaphore(item) for item in items]
+        return await asyncio.gather(*tasks)
+
+    def validate_slides_batch(
+        self,
+        items: list[tuple[str, Slide, str]],
+        style_config: dict,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[ValidationResult]:
+        """
+        Validate several slides with one Gemini Vision request per batch.
+
+        Each request carries up to batch_size labelled slide images plus a
+        per-slide intent block, and asks for one rubric score object per
+        slide. Cached near-duplicates are served without an API call. If a
+        batch request fails or its response cannot be parsed, the affected
+        slides fall back to single-slide validation. The number of requests
+        actually sent (batches, fallbacks and retries) is recorded in
+        last_batch_api_calls.
+
+        Args:
+            items: List of (slide_image_path, original_slide, slide_type) tuples
+            style_config: Style configuration dict (shared by all slides)
+            batch_size: Maximum slides per request
+
+        Returns:
+            List of ValidationResult objects in the same order as items
+
+        Raises:
+            FileNotFoundError: If a slide image doesn't exist
+        """
+        results: list[ValidationResult | None] = [None] * len(items)
+        pending = []
+        api_calls_before = self.upload_stats["api_calls"]
+        self.last_batch_api_calls = 0
+
+        for index, (slide_image_path, slide, slide_type) in enumerate(items):
+            image_path = Path(slide_image_path)
+            if not image_path.exists():
+                raise FileNotFoundError(f"Slide image not found: {slide_image_path}")
+
+            prompt = self._build_validation_prompt(slide, style_config, slide_type)
+            try:
+                image_bytes = self._prepare_image(image_path)
+            except FileNotFoundError:
+                print(f"[ERROR] Slide image not found: {slide_image_path}")
+                raise
+            except OSError as e:
+                print(f"[ERROR] Failed to read image for slide {slide.number}: {e}")
+                results[index] = self._unavailable_result(f"image unreadable: {e}")
+                continue
+
+            image_hash = compute_dhash(image_bytes)
+            cache_key = context_key(prompt)
+            cached = self.cache.lookup(image_hash, cache_key)
+            if cached is not None:
+                print(
+                    f"[CACHE] Reusing validation for near-identical render of slide {slide.number}"
+                )
+                results[index] = ValidationResult(**cached)
+                continue
+
+            pending.append(
+                (index, slide, slide_type, prompt, image_bytes, image_hash, cache_key)
+            )
+
+        for start in range(0, len(pending), max(1, batch_size)):
+            chunk = pending[start : start + max(1, batch_size)]
+            batch_results = self._request_batch_validation(chunk, style_config)
+
+            for position, entry in enumerate(chunk):
+                index, slide, _, prompt, image_bytes, image_hash, cache_key = entry
+                result = batch_results.get(position)
+                if result is None:
+                    result = self._request_validation(image_bytes, prompt, slide.number)
+                if result.rubric_scores:
+                    self.cache.store(image_hash, cache_key, asdict(result))
+                results[index] = result
+
+        self.last_batch_api_calls = self.upload_stats["api_calls"] - api_calls_before
+        return results
+
+    def _request_batch_validation(
+        self, chunk: list[tuple], style_config: dict
+    ) -> dict[int, ValidationResult]:
+        """
+        Send one batched Gemini Vision request for several slides.
+
+        Args:
+            chunk: Pending entries (index, slide, slide_type, prompt,
+                   image_bytes, image_hash, cache_key)
+            style_config: Style configuration dict
+
+        Returns:
+            Dict of chunk position -> ValidationResult for slides that were
+            scored; missing positions need single-slide fallback
+        """
+        if len(chunk) == 1:
+            return {}
+
+        slide_numbers = ", ".join(str(entry[1].number) for entry in chunk)
+        contents = []
+        for position, entry in enumerate(chunk, start=1):
+            contents.append(f"SLIDE {position}:")
+            contents.append(
+                types.Part.from_bytes(data=entry[4], mime_type="image/jpeg")
+            )
+        contents.append(
+            self._build_batch_validation_prompt(
+                [(entry[1], entry[2]) for entry in chunk], style_config
+            )
+        )
+
+        try:
+            config = types.GenerateContentConfig(
+                response_modalities=["TEXT"],
+                temperature=0.3,  # Lower temp for consistent evaluation
+            )
+            self.upload_stats["api_calls"] += 1
+            self.upload_stats["bytes_sent"] += sum(len(entry[4]) for entry in chunk)
+            response = self.client.models.generate_content(
+                model=self.VISION_MODEL,
+                contents=contents,
+                config=config,
+            )
+            scored = self._parse_batch_response(response.text, len(chunk))
+        except Exception as e:
+            print(
+                f"[WARNING] Batched validation failed for slides {slide_numbers}: {type(e).__name__} - {e}"
+            )
+            print("          Falling back to single-slide validation")
+            return {}
+
+        results = {}
+        for position, data in scored.items():
+            try:
+                results[position - 1] = self._result_from_scores(data, json.dumps(data))
+            except (TypeError, ValueError) as e:
+                print(
+                    f"[WARN] Invalid batched scores for slide {chunk[position - 1][1].number}: {e}"
+                )
+
+        missing = len(chunk) - len(results)
+        if missing:
+            print(
+                f"[WARNING] Batched response missing {missing} of {len(chunk)} slides - validating individually"
+            )
+        return results
+
+    def _build_batch_validation_prompt(
+        self, slides: list[tuple[Slide, str]], style_config: dict
     ) -> str:
         """
-        Build validation prompt for Gemini Vision.
+        Build a multi-slide validation prompt for Gemini Vision.
 
         Args:
-            slide: Original Slide object
+            slides: List of (Slide, slide_type) in the same order as the
+                    attached "SLIDE n" images
             style_config: Style configuration
-            slide_type: Classified slide type
 
         Returns:
             Formatted prompt string
         """
-        # Extract key style requirements
-        brand_colors = style_config.get("brand_colors", [])
-        style_desc = style_config.get("style", "professional")
+        intents = "\n\n".join(
+            f"### SLIDE {position}\n{self._format_slide_intent(slide, slide_type)}"
+            for position, (slide, slide_type) in enumerate(slides, start=1)
+        )
+
+        return f"""You are a presentation quality validator analyzing {len(slides)} PowerPoint slides.
+
+SLIDE IMAGES: (Attached above, each preceded by its "SLIDE n" label)
+
+ORIGINAL INTENT PER SLIDE (from markdown):
+
+{intents}
+
+{self._format_style_requirements(style_config)}
+
+---
+
+{VALIDATION_RUBRIC}
+
+---
+
+TASK:
+
+Analyze each slide image independently against its own original intent and the style requirements.
+Score each rubric category out of its maximum points for every slide.
+Identify specific issues and suggest improvements per slide.
+
+Return ONLY a JSON array with one object per slide, using "slide_index" to
+identify the SLIDE n label (no markdown code blocks):
+
+[
+  {{
+    "slide_index": 1,
+    "content_accuracy": 28,
+    "visual_hierarchy": 18,
+    "brand_alignment": 19,
+    "image_quality": 14,
+    "layout_effectiveness": 13,
+    "total_score": 92,
+    "issues": ["Title font size slightly small"],
+    "suggestions": ["Increase title font to 44pt"]
+  }}
+]
+
+Provide your validation for all {len(slides)} slides now:"""
+
+    def _parse_batch_response(
+        self, response_text: str, slide_count: int
+    ) -> dict[int, dict]:
+        """
+        Parse a batched validation response into per-slide score dicts.
+
+        Args:
+            response_text: Raw Gemini response
+            slide_count: Number of slides in the batch
+
+        Returns:
+            Dict of slide_index (1-based) -> score dict
+
+        Raises:
+            ValueError: If the response is not a JSON array of score objects
+        """
+        # Strip markdown code blocks if present
+        json_match = re.search(r"```(?:json)?\s*\n(.+?)\n```", response_text, re.DOTALL)
+        if json_match:
+            response_text = json_match.group(1)
+
+        start = response_text.find("[")
+        end = response_text.rfind("]")
+        if start == -1 or end <= start:
+            raise ValueError("No JSON array in batched validation response")
+
+        data = json.loads(response_text[start : end + 1])
+        if not isinstance(data, list):
+            raise ValueError("Batched validation response is not a list")
+
+        scored = {}
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            slide_index = item.get("slide_index")
+            if isinstance(slide_index, int) and 1 <= slide_index <= slide_count:
+                scored[slide_index] = item
+        return scored
+
+    def get_upload_stats(self) -> dict:
+        """
+        Get image upload statistics.
+
+        Returns:
+            Dict with images prepared, bytes before/after downsampling,
+            total bytes sent (including retries) and the size reduction ratio
+        """
+        stats = dict(self.upload_stats)
+        original = stats["original_bytes"]
+        stats["reduction"] = (
+            1.0 - stats["prepared_bytes"] / original if original else 0.0
+        )
+        return stats
+
+    def _prepare_image(self, image_path: Path) -> bytes:
+        """
+        Read a slide image and downscale it for upload.
+
+        Images whose longest edge exceeds max_image_edge are resized and
+        re-encoded as JPEG. Undecodable images (or images that would not get
+        smaller) are sent unchanged.
+
+        Args:
+            image_path: Path to exported slide image
+
+        Returns:
+            Encoded image bytes to send to Gemini
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(image_path, "rb") as f:
+            original = f.read()
+
+        prepared = original
+        if self.max_image_edge and PIL_AVAILABLE:
+            try:
+                with Image.open(io.BytesIO(original)) as img:
+                    if max(img.size) > self.max_image_edge:
+                        img.thumbnail(
+                            (self.max_image_edge, self.max_image_edge),
+                            Image.Resampling.LANCZOS,
+                        )
+                        buffer = io.BytesIO()
+                        img.convert("RGB").save(
+                            buffer,
+                            "JPEG",
+                            quality=self.UPLOAD_JPEG_QUALITY,
+                            optimize=True,
+                        )
+                        if buffer.tell() < len(original):
+                            prepared = buffer.getvalue()
+                            self.upload_stats["downscaled"] += 1
+            except Exception:
+                # Not decodable by Pillow - send as-is and let Gemini judge
+                prepared = original
+
+        self.upload_stats["images"] += 1
+        self.upload_stats["original_bytes"] += len(original)
+        self.upload_stats["prepared_bytes"] += len(prepared)
+        return prepared
+
+    def validate_preview(
+        self, preview: SlidePreview, original_slide: Slide
+    ) -> ValidationResult:
+        """
+        Score an approximate slide preview locally (no API call).
+
+        Used as a cheap first-pass check before exporting the real slide and
+        paying for Gemini vision validation. A preview with layout issues
+        (e.g., text overflowing its box) fails immediately.
+
+        Args:
+            preview: SlidePreview from SlidePreviewRenderer
+            original_slide: Original Slide object from parser
+
+        Returns:
+            ValidationResult (passed=True if no layout issues were found)
+        """
+        if not preview.has_issues:
+            return ValidationResult(
+                passed=True,
+                score=self.VALIDATION_THRESHOLD,
+                issues=[],
+                suggestions=[],
+                raw_feedback=f"Preview check passed for slide {original_slide.number}",
+                rubric_scores={},
+            )
+
+        suggestions = []
+        if any("overflows" in issue for issue in preview.issues):
+            suggestions.append("Shorten text or split content across two slides")
+
+        return ValidationResult(
+            passed=False,
+            score=max(0.0, self.VALIDATION_THRESHOLD - 0.1 * len(preview.issues)),
+            issues=list(preview.issues),
+            suggestions=suggestions,
+            raw_feedback=f"Preview check failed for slide {original_slide.number}: "
+            + "; ".join(preview.issues),
+            rubric_scores={},
+        )
+
+    def _format_slide_intent(self, slide: Slide, slide_type: str) -> str:
+        """
+        Format a slide's original intent for a validation prompt.
+
+        Args:
+            slide: Original Slide object
+            slide_type: Classified slide type
 
+        Returns:
+            Markdown-formatted intent block
+        """
         # Format bullet points preview
         bullets_preview = ""
         if slide.content_bullets:
@@ -264,55 +871,56 @@ class VisualValidator:
             if len(slide.graphic) > 200:
                 graphic_preview += "..."
 
-        prompt = f"""You are a presentation quality validator analyzing a PowerPoint slide.
-
-SLIDE IMAGE: (Attached above)
-
-ORIGINAL INTENT (from markdown):
-**Slide Number:** {slide.number}
+        return f"""**Slide Number:** {slide.number}
 **Type:** {slide_type}
 **Title:** {slide.title}
 **Subtitle:** {slide.subtitle or "None"}
 **Bullet Points:** {len(slide.content_bullets)} total{bullets_preview}
-**Graphic Intent:** {graphic_preview}
+**Graphic Intent:** {graphic_preview}"""
+
+    def _format_style_requirements(self, style_config: dict) -> str:
+        """
+        Format brand style requirements for a validation prompt.
 
-STYLE REQUIREMENTS:
+        Args:
+            style_config: Style configuration
+
+        Returns:
+            Markdown-formatted style block
+        """
+        brand_colors = style_config.get("brand_colors", [])
+        style_desc = style_config.get("style", "professional")
+
+        return f"""STYLE REQUIREMENTS:
 **Brand Colors:** {", ".join(brand_colors) if brand_colors else "Not specified"}
-**Style:** {style_desc}
+**Style:** {style_desc}"""
 
----
+    def _build_validation_prompt(
+        self, slide: Slide, style_config: dict, slide_type: str
+    ) -> str:
+        """
+        Build validation prompt for Gemini Vision.
 
-VALIDATION RUBRIC (100 points total):
+        Args:
+            slide: Original Slide object
+            style_config: Style configuration
+            slide_type: Classified slide type
 
-1. **CONTENT ACCURACY** (30 points)
-   - Title matches intent and is clearly visible
-   - All bullet points present and accurate
-   - No missing or incorrect content
-   - Speaker notes context preserved in visible elements
+        Returns:
+            Formatted prompt string
+        """
+        prompt = f"""You are a presentation quality validator analyzing a PowerPoint slide.
 
-2. **VISUAL HIERARCHY** (20 points)
-   - Title stands out prominently
-   - Bullet points are readable and well-sized
-   - Proper use of font sizes and weights
-   - Clear information flow and structure
+SLIDE IMAGE: (Attached above)
 
-3. **BRAND ALIGNMENT** (20 points)
-   - Colors match brand palette
-   - Fonts match brand guidelines
-   - Overall style is consistent with brand identity
-   - Professional appearance appropriate for brand
+ORIGINAL INTENT (from markdown):
+{self._format_slide_intent(slide, slide_type)}
 
-4. **IMAGE QUALITY** (15 points, if applicable)
-   - Image is relevant to content
-   - Image is properly sized and positioned
-   - Image is clear and high-quality
-   - Image doesn't obscure text
+{self._format_style_requirements(style_config)}
 
-5. **LAYOUT EFFECTIVENESS** (15 points)
-   - Good use of whitespace
-   - Balanced composition
-   - Professional polish
-   - No visual clutter or awkward spacing
+---
+
+{VALIDATION_RUBRIC}
 
 ---
 
@@ -345,6 +953,50 @@ Provide your validation now:"""
 
         return prompt
 
+    def _result_from_scores(self, data: dict, raw_feedback: str) -> ValidationResult:
+        """
+        Convert a rubric score dict from Gemini into a ValidationResult.
+
+        Args:
+            data: Parsed JSON object with rubric category points
+            raw_feedback: Raw response text to keep on the result
+
+        Returns:
+            ValidationResult object
+
+        Raises:
+            ValueError/TypeError: If scores are not numeric
+        """
+        # Extract scores
+        rubric_scores = {
+            "content_accuracy": float(data.get("content_accuracy", 0)) / 30.0,
+            "visual_hierarchy": float(data.get("visual_hierarchy", 0)) / 20.0,
+            "brand_alignment": float(data.get("brand_alignment", 0)) / 20.0,
+            "image_quality": float(data.get("image_quality", 0)) / 15.0,
+            "layout_effectiveness": float(data.get("layout_effectiveness", 0)) / 15.0,
+        }
+
+        # Calculate weighted total score (0.0 to 1.0)
+        total_score = sum(
+            rubric_scores[key] * weight for key, weight in self.RUBRIC_WEIGHTS.items()
+        )
+
+        # Extract issues and suggestions
+        issues = data.get("issues", [])
+        suggestions = data.get("suggestions", [])
+
+        # Determine pass/fail
+        passed = total_score >= self.VALIDATION_THRESHOLD
+
+        return ValidationResult(
+            passed=passed,
+            score=total_score,
+            issues=issues,
+            suggestions=suggestions,
+            raw_feedback=raw_feedback,
+            rubric_scores=rubric_scores,
+        )
+
     def _parse_validation_response(
         self, response_text: str, slide_number: int
     ) -> ValidationResult:
@@ -374,37 +1026,7 @@ Provide your validation now:"""
             # Parse JSON
             data = json.loads(response_text)
 
-            # Extract scores
-            rubric_scores = {
-                "content_accuracy": float(data.get("content_accuracy", 0)) / 30.0,
-                "visual_hierarchy": float(data.get("visual_hierarchy", 0)) / 20.0,
-                "brand_alignment": float(data.get("brand_alignment", 0)) / 20.0,
-                "image_quality": float(data.get("image_quality", 0)) / 15.0,
-                "layout_effectiveness": float(data.get("layout_effectiveness", 0))
-                / 15.0,
-            }
-
-            # Calculate weighted total score (0.0 to 1.0)
-            total_score = sum(
-                rubric_scores[key] * weight
-                for key, weight in self.RUBRIC_WEIGHTS.items()
-            )
-
-            # Extract issues and suggestions
-            issues = data.get("issues", [])
-            suggestions = data.get("suggestions", [])
-
-            # Determine pass/fail
-            passed = total_score >= self.VALIDATION_THRESHOLD
-
-            return ValidationResult(
-                passed=passed,
-                score=total_score,
-                issues=issues,
-                suggestions=suggestions,
-                raw_feedback=response_text,
-                rubric_scores=rubric_scores,
-            )
+            return self._result_from_scores(data, response_text)
 
         except json.JSONDecodeError as e:
             print(
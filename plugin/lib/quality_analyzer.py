@@ -9,21 +9,139 @@ Provides metrics and analysis for:
 - Citation completeness
 
 Uses textstat for readability metrics and Claude API for linguistic analysis.
+
+IncrementalQualityAnalyzer caches per-slide contributions by slide content
+hash, so re-analyzing an edited deck only re-measures the changed slides.
 """
 
+import asyncio
+import copy
+import hashlib
 import json
 import logging
 import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import pairwise
 from typing import Any
 
+import httpx
 from anthropic import APIError, APIConnectionError, RateLimitError
 
+from plugin.lib.async_claude_client import AsyncClaudeClient
 from plugin.lib.claude_client import get_claude_client
-from plugin.lib.json_utils import extract_json_from_response
+from plugin.lib.context_packer import estimate_tokens
+from plugin.lib.json_utils import JSONExtractionError, extract_json_from_response
+from plugin.lib.redundancy import find_similar_groups
 
 
 logger = logging.getLogger(__name__)
 
+# Sentence terminators used by the approximate Flesch score
+SENTENCE_END_RE = re.compile(r"[.!?]+")
+
+# Tone consistency ratings, best to worst
+CONSISTENCY_RATINGS = ("high", "medium", "low")
+
+# Maximum distinct words with memoized syllable counts
+SYLLABLE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """
+    Approximate the syllable count of a word (memoized per word).
+
+    Args:
+        word: Word to count
+
+    Returns:
+        Vowel groups, minus a silent trailing e (at least 1)
+    """
+    word = word.lower()
+    vowels = "aeiouy"
+    syllable_count = 0
+    previous_was_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not previous_was_vowel:
+            syllable_count += 1
+        previous_was_vowel = is_vowel
+
+    # Adjust for silent e
+    if word.endswith("e"):
+        syllable_count -= 1
+
+    return max(1, syllable_count)
+
+
+@dataclass(frozen=True)
+class TextCounts:
+    """
+    Word, syllable and sentence counts of a text, measured in one pass.
+
+    Sentence fragments (text split on terminators) are kept as flags for
+    the first and last fragment plus a count of the non-empty ones in
+    between, so the sentence count of several texts joined with spaces can
+    be derived without re-reading them (see joined_sentence_count()).
+    """
+
+    words: int
+    syllables: int
+    has_terminator: bool
+    first_fragment: bool
+    inner_sentences: int
+    last_fragment: bool
+    blank: bool
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextCounts":
+        """Measure a text."""
+        words = text.split()
+        fragments = SENTENCE_END_RE.split(text)
+        return cls(
+            words=len(words),
+            syllables=sum(map(count_syllables, words)),
+            has_terminator=len(fragments) > 1,
+            first_fragment=bool(fragments[0].strip()),
+            inner_sentences=sum(1 for f in fragments[1:-1] if f.strip()),
+            last_fragment=bool(fragments[-1].strip()),
+            blank=not text.strip(),
+        )
+
+    @property
+    def sentences(self) -> int:
+        """Non-empty sentence fragments of this text alone."""
+        if not self.has_terminator:
+            return int(self.first_fragment)
+        return self.first_fragment + self.inner_sentences + self.last_fragment
+
+
+def joined_sentence_count(counts: list[TextCounts]) -> int:
+    """
+    Count sentences of texts joined with spaces.
+
+    A text's unterminated last fragment continues into the next text's
+    first fragment, so the two form one sentence.
+
+    Args:
+        counts: Counts of the texts in join order
+
+    Returns:
+        Non-empty sentence fragments of the joined text
+    """
+    sentences = 0
+    pending = False
+    for text in counts:
+        if not text.has_terminator:
+            pending = pending or text.first_fragment
+            continue
+        sentences += (pending or text.first_fragment) + text.inner_sentences
+        pending = text.last_fragment
+    return sentences + pending
+
 
 class QualityAnalyzer:
     """
@@ -37,7 +155,10 @@ class QualityAnalyzer:
         self.client = get_claude_client()
 
     def analyze_presentation(
-        self, slides: list[dict[str, Any]], style_guide: dict[str, Any] | None = None
+        self,
+        slides: list[dict[str, Any]],
+        style_guide: dict[str, Any] | None = None,
+        chunked_tone: bool = False,
     ) -> dict[str, Any]:
         """
         Perform comprehensive quality analysis on presentation.
@@ -45,6 +166,9 @@ class QualityAnalyzer:
         Args:
             slides: List of slide content
             style_guide: Optional style parameters for comparison
+            chunked_tone: Analyze the tone of every slide in concurrent
+                          windows (see analyze_presentation_async()) instead
+                          of the first 10 slides in one call
 
         Returns:
             Dictionary with quality metrics and issues:
@@ -60,6 +184,9 @@ class QualityAnalyzer:
         """
         style_guide = style_guide or {}
 
+        if chunked_tone:
+            return asyncio.run(self.analyze_presentation_async(slides, style_guide))
+
         # Calculate individual metrics
         readability = self.calculate_readability(slides)
         tone_consistency = self.check_tone_consistency(
@@ -69,6 +196,67 @@ class QualityAnalyzer:
         redundancy = self.detect_redundancy(slides)
         citations = self.validate_citations(slides)
 
+        return self._combine_analysis(
+            readability, tone_consistency, parallelism, redundancy, citations
+        )
+
+    async def analyze_presentation_async(
+        self,
+        slides: list[dict[str, Any]],
+        style_guide: dict[str, Any] | None = None,
+        client: AsyncClaudeClient | None = None,
+    ) -> dict[str, Any]:
+        """
+        Analyze the whole deck with chunked, concurrent tone analysis.
+
+        Tone windows are sent to Claude concurrently while the local metrics
+        run in a worker thread, so covering every slide costs about the
+        wall time of one tone call.
+
+        Args:
+            slides: List of slide content
+            style_guide: Optional style parameters for comparison
+            client: Optional open AsyncClaudeClient (one is created if omitted)
+
+        Returns:
+            Same structure as analyze_presentation()
+        """
+        style_guide = style_guide or {}
+
+        tone_task = asyncio.create_task(
+            self.check_tone_consistency_async(
+                slides, style_guide.get("tone", "professional"), client=client
+            )
+        )
+        readability, parallelism, redundancy, citations = await asyncio.to_thread(
+            self._local_metrics, slides
+        )
+        tone_consistency = await tone_task
+
+        return self._combine_analysis(
+            readability, tone_consistency, parallelism, redundancy, citations
+        )
+
+    def _local_metrics(
+        self, slides: list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """Compute the metrics that need no API call."""
+        return (
+            self.calculate_readability(slides),
+            self.check_bullet_parallelism(slides),
+            self.detect_redundancy(slides),
+            self.validate_citations(slides),
+        )
+
+    def _combine_analysis(
+        self,
+        readability: dict[str, Any],
+        tone_consistency: dict[str, Any],
+        parallelism: dict[str, Any],
+        redundancy: dict[str, Any],
+        citations: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Combine individual metrics into the presentation analysis."""
         # Collect issues
         issues = []
         issues.extend(readability.get("issues", []))
@@ -150,6 +338,29 @@ class QualityAnalyzer:
             grade_level = self._approximate_grade_level(flesch_score)
             has_textstat = False
 
+        return self._readability_report(
+            flesch_score, grade_level, has_textstat, len(combined_text.split())
+        )
+
+    def _readability_report(
+        self,
+        flesch_score: float,
+        grade_level: Any,
+        has_textstat: bool,
+        total_words: int,
+    ) -> dict[str, Any]:
+        """
+        Build the readability result from deck-level measurements.
+
+        Args:
+            flesch_score: Flesch Reading Ease of the combined text
+            grade_level: Grade level (textstat) or approximation
+            has_textstat: Whether textstat produced the measurements
+            total_words: Word count of the combined text
+
+        Returns:
+            Readability analysis with score and issues
+        """
         # Interpret score (Flesch Reading Ease scale)
         # 90-100: Very Easy (5th grade)
         # 80-89: Easy (6th grade)
@@ -200,10 +411,83 @@ class QualityAnalyzer:
             "issues": issues,
             "metrics": {
                 "using_textstat": has_textstat,
-                "total_words": len(combined_text.split()),
+                "total_words": total_words,
             },
         }
 
+    def calculate_slide_readability(
+        self, slides: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Calculate approximate Flesch readability per slide and for the deck.
+
+        Each slide's bullets and speaker notes are counted once (with
+        memoized syllable counts); the deck score is aggregated from the
+        per-slide counts rather than by re-reading the combined text.
+
+        Args:
+            slides: List of slide content
+
+        Returns:
+            Deck Flesch score, per-slide scores (non-blank slides) and
+            issues for slides that are too complex
+        """
+        counts = [self._slide_text_counts(slide) for slide in slides]
+
+        per_slide = []
+        issues = []
+        for slide_idx, text in enumerate(counts, 1):
+            if text.blank:
+                continue
+
+            flesch_score = self._flesch_from_counts(
+                text.words, text.sentences, text.syllables
+            )
+            per_slide.append(
+                {
+                    "slide_number": slide_idx,
+                    "flesch_reading_ease": round(flesch_score, 1),
+                    "grade_level": f"~{self._approximate_grade_level(flesch_score)}",
+                    "interpretation": self._interpret_flesch_score(flesch_score),
+                    "words": text.words,
+                    "sentences": text.sentences,
+                    "syllables": text.syllables,
+                }
+            )
+            if flesch_score < 50:
+                issues.append(
+                    {
+                        "type": "readability",
+                        "severity": "low",
+                        "slide_number": slide_idx,
+                        "message": f"Slide {slide_idx}: Text is too complex (Flesch score: {flesch_score:.1f}).",
+                        "suggestion": "Use shorter sentences and simpler words for better comprehension.",
+                    }
+                )
+
+        if not per_slide:
+            return {
+                "flesch_reading_ease": None,
+                "grade_level": "N/A",
+                "slides": [],
+                "issues": [],
+            }
+
+        words = sum(text.words for text in counts)
+        flesch_score = self._flesch_from_counts(
+            words,
+            joined_sentence_count(counts),
+            sum(text.syllables for text in counts),
+        )
+        return {
+            "flesch_reading_ease": round(flesch_score, 1),
+            "grade_level": f"~{self._approximate_grade_level(flesch_score)}",
+            "interpretation": self._interpret_flesch_score(flesch_score),
+            "total_words": words,
+            "slides": per_slide,
+            "issues": issues,
+        }
+
     def check_tone_consistency(
         self, slides: list[dict[str, Any]], target_tone: str = "professional"
     ) -> dict[str, Any]:
@@ -217,15 +501,7 @@ class QualityAnalyzer:
         Returns:
             Tone analysis with consistency score and issues
         """
-        # Extract slide content for analysis
-        slide_texts = []
-        for i, slide in enumerate(slides, 1):
-            title = slide.get("title", "")
-            bullets = slide.get("bullets", [])
-            text = f"Slide {i} - {title}: " + " ".join(bullets)
-            slide_texts.append(text)
-
-        combined_text = "\n\n".join(slide_texts[:10])  # Analyze first 10 slides
+        combined_text = self._tone_text(slides)
 
         if not combined_text.strip():
             return {
@@ -326,6 +602,243 @@ Return valid JSON with your analysis."""
             "analysis": analysis,
         }
 
+    async def check_tone_consistency_async(
+        self,
+        slides: list[dict[str, Any]],
+        target_tone: str = "professional",
+        client: AsyncClaudeClient | None = None,
+        window_tokens: int = 1500,
+        max_concurrent: int = 5,
+    ) -> dict[str, Any]:
+        """
+        Check tone consistency of every slide in concurrent windows.
+
+        The deck is split into consecutive, token-bounded windows of slides;
+        each window is analyzed by Claude concurrently and per-slide tone
+        findings are merged. Windows that fail are skipped; if all fail the
+        same fallback as check_tone_consistency() is returned.
+
+        Args:
+            slides: List of slide content
+            target_tone: Target tone (professional, conversational, academic, etc.)
+            client: Optional open AsyncClaudeClient (one is created if omitted)
+            window_tokens: Approximate slide text tokens per window
+            max_concurrent: Maximum concurrent window requests
+
+        Returns:
+            Tone analysis with consistency score, per-slide issues and
+            window details
+        """
+        windows = self._tone_windows(slides, window_tokens)
+        if not windows:
+            return {
+                "score": 100,
+                "detected_tone": target_tone,
+                "consistency": "high",
+                "issues": [],
+            }
+
+        if client is None:
+            async with AsyncClaudeClient() as owned_client:
+                return await self._analyze_tone_windows(
+                    windows, target_tone, owned_client, max_concurrent
+                )
+        return await self._analyze_tone_windows(
+            windows, target_tone, client, max_concurrent
+        )
+
+    def _tone_windows(
+        self, slides: list[dict[str, Any]], window_tokens: int
+    ) -> list[tuple[int, int, str]]:
+        """
+        Split slides into consecutive windows of about window_tokens.
+
+        Returns:
+            (first_slide, last_slide, text) per window (1-based slide numbers)
+        """
+        windows = []
+        texts: list[str] = []
+        first = 1
+        tokens = 0
+        for i, slide in enumerate(slides, 1):
+            title = slide.get("title", "")
+            bullets = slide.get("bullets", [])
+            text = f"Slide {i} - {title}: " + " ".join(bullets)
+            text_tokens = estimate_tokens(text)
+            if texts and tokens + text_tokens > window_tokens:
+                windows.append((first, i - 1, "\n\n".join(texts)))
+                texts, first, tokens = [], i, 0
+            texts.append(text)
+            tokens += text_tokens
+        if texts:
+            windows.append((first, len(slides), "\n\n".join(texts)))
+        return windows
+
+    async def _analyze_tone_windows(
+        self,
+        windows: list[tuple[int, int, str]],
+        target_tone: str,
+        client: AsyncClaudeClient,
+        max_concurrent: int,
+    ) -> dict[str, Any]:
+        """Analyze windows concurrently and merge their findings."""
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def analyze(window: tuple[int, int, str]) -> dict[str, Any] | None:
+            first, last, text = window
+            async with semaphore:
+                try:
+                    analysis = await self._analyze_tone_window(
+                        text, target_tone, client
+                    )
+                except (
+                    httpx.HTTPError,
+                    JSONExtractionError,
+                    json.JSONDecodeError,
+                    KeyError,
+                ) as e:
+                    logger.warning(
+                        "Tone analysis failed for slides %d-%d: %s", first, last, e
+                    )
+                    return None
+            return {**analysis, "slides": [first, last]}
+
+        results = await asyncio.gather(*(analyze(window) for window in windows))
+        analyses = [analysis for analysis in results if analysis is not None]
+        if not analyses:
+            return {
+                "score": 75,
+                "detected_tone": "unknown",
+                "consistency": "unknown",
+                "issues": [],
+                "error": "All tone analysis windows failed",
+            }
+        return self._merge_tone_windows(analyses, len(windows))
+
+    async def _analyze_tone_window(
+        self, text: str, target_tone: str, client: AsyncClaudeClient
+    ) -> dict[str, Any]:
+        """
+        Analyze the tone of one window of slides.
+
+        Returns:
+            Parsed analysis with per-slide tone_shifts
+        """
+        prompt = f"""Analyze the tone of this section of a presentation.
+
+Target tone: {target_tone}
+
+Content:
+{text}
+
+Evaluate:
+1. Is the tone consistent throughout?
+2. Does it match the target tone ({target_tone})?
+3. Which slides shift away from the section's tone?
+
+Return JSON:
+{{
+  "detected_tone": "primary tone observed",
+  "matches_target": true/false,
+  "consistency_rating": "high/medium/low",
+  "tone_shifts": [{{"slide": <slide number>, "issue": "tone inconsistency"}}],
+  "suggestions": ["how to improve tone consistency"]
+}}"""
+
+        system_prompt = """You are an expert editor analyzing presentation tone.
+Return valid JSON with your analysis."""
+
+        response = await client.generate_text(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=0.3,
+            max_tokens=1000,
+        )
+        return extract_json_from_response(response, strict=True)
+
+    def _merge_tone_windows(
+        self, analyses: list[dict[str, Any]], window_count: int
+    ) -> dict[str, Any]:
+        """
+        Merge window analyses into one deck-level tone result.
+
+        The deck matches the target only if every window does, consistency
+        is the worst window rating (at most "medium" when windows detect
+        different tones), and the score uses check_tone_consistency() rules.
+        """
+        tones = [str(a.get("detected_tone", "unknown")).lower() for a in analyses]
+        matches_target = all(a.get("matches_target", True) for a in analyses)
+
+        ratings = [a.get("consistency_rating", "medium") for a in analyses]
+        if len(set(tones)) > 1:
+            ratings.append("medium")
+        consistency = max(
+            ratings,
+            key=lambda r: (
+                CONSISTENCY_RATINGS.index(r) if r in CONSISTENCY_RATINGS else 1
+            ),
+        )
+
+        score = 100
+        if not matches_target:
+            score -= 30
+        if consistency == "low":
+            score -= 30
+        elif consistency == "medium":
+            score -= 15
+
+        issues = []
+        for analysis in analyses:
+            suggestion = (analysis.get("suggestions") or [""])[0] or (
+                "Maintain consistent tone throughout"
+            )
+            severity = "medium" if not analysis.get("matches_target", True) else "low"
+            for shift in analysis.get("tone_shifts", []):
+                issue = {
+                    "type": "tone",
+                    "severity": severity,
+                    "message": str(shift),
+                    "suggestion": suggestion,
+                }
+                if isinstance(shift, dict):
+                    slide = shift.get("slide")
+                    message = shift.get("issue", "")
+                    if isinstance(slide, int):
+                        issue["slide_number"] = slide
+                        message = f"Slide {slide}: {message}"
+                    issue["message"] = message
+                issues.append(issue)
+
+        # Tone changing between sections is only visible after merging
+        for previous, current in pairwise(analyses):
+            before = str(previous.get("detected_tone", "unknown")).lower()
+            after = str(current.get("detected_tone", "unknown")).lower()
+            if before != after:
+                issues.append(
+                    {
+                        "type": "tone",
+                        "severity": "low",
+                        "message": (
+                            f"Tone shifts from {before} (slides "
+                            f"{previous['slides'][0]}-{previous['slides'][1]}) to "
+                            f"{after} (slides {current['slides'][0]}-"
+                            f"{current['slides'][1]})"
+                        ),
+                        "suggestion": "Maintain consistent tone throughout",
+                    }
+                )
+
+        return {
+            "score": max(0, score),
+            "detected_tone": Counter(tones).most_common(1)[0][0],
+            "matches_target": matches_target,
+            "consistency": consistency,
+            "issues": issues,
+            "analysis": {"windows": analyses},
+            "windows_analyzed": len(analyses),
+            "windows_total": window_count,
+        }
+
     def check_bullet_parallelism(self, slides: list[dict[str, Any]]) -> dict[str, Any]:
         """
         Check bullet point grammatical parallelism.
@@ -333,6 +846,30 @@ Return valid JSON with your analysis."""
         Args:
             slides: List of slide content
 
+        Returns:
+            Parallelism analysis with score and issues
+        """
+        results = []
+        for slide in slides:
+            bullets = slide.get("bullets", [])
+
+            if len(bullets) < 2:
+                results.append(None)  # Need at least 2 bullets to check parallelism
+            else:
+                results.append(self._check_parallel_structure(bullets))
+
+        return self._parallelism_report(results)
+
+    def _parallelism_report(
+        self, results: list[tuple[bool, str] | None]
+    ) -> dict[str, Any]:
+        """
+        Build the parallelism result from per-slide checks.
+
+        Args:
+            results: (is_parallel, issue) per slide, None for slides with
+                     fewer than 2 bullets
+
         Returns:
             Parallelism analysis with score and issues
         """
@@ -340,16 +877,14 @@ Return valid JSON with your analysis."""
         total_slides_with_bullets = 0
         parallel_slides = 0
 
-        for slide_idx, slide in enumerate(slides, 1):
-            bullets = slide.get("bullets", [])
-
-            if len(bullets) < 2:
-                continue  # Need at least 2 bullets to check parallelism
+        for slide_idx, result in enumerate(results, 1):
+            if result is None:
+                continue
 
             total_slides_with_bullets += 1
 
             # Check if bullets follow parallel structure
-            is_parallel, issue = self._check_parallel_structure(bullets)
+            is_parallel, issue = result
 
             if is_parallel:
                 parallel_slides += 1
@@ -397,42 +932,39 @@ Return valid JSON with your analysis."""
                 all_bullets.append(bullet.lower().strip())
                 bullet_sources.append(slide_idx)
 
-        if not all_bullets:
-            return {"redundancy_percentage": 0, "duplicates_found": 0, "issues": []}
+        return self._redundancy_report(all_bullets, bullet_sources)
 
-        # Simple similarity detection (exact matches and very similar)
-        duplicates = []
-        checked = set()
-
-        for i in range(len(all_bullets)):
-            if i in checked:
-                continue
-
-            similar_bullets = [i]
+    def _redundancy_report(
+        self, all_bullets: list[str], bullet_sources: list[int]
+    ) -> dict[str, Any]:
+        """
+        Build the redundancy result from normalized bullets.
 
-            for j in range(i + 1, len(all_bullets)):
-                if j in checked:
-                    continue
+        Args:
+            all_bullets: Lowercased, stripped bullets in deck order
+            bullet_sources: Slide number of each bullet
 
-                # Check exact match
-                if (
-                    all_bullets[i] == all_bullets[j]
-                    or self._similarity_score(all_bullets[i], all_bullets[j]) > 0.8
-                ):
-                    similar_bullets.append(j)
-                    checked.add(j)
+        Returns:
+            Redundancy analysis with percentage and duplicate concepts
+        """
+        if not all_bullets:
+            return {"redundancy_percentage": 0, "duplicates_found": 0, "issues": []}
 
-            if len(similar_bullets) > 1:
-                duplicates.append(
-                    {
-                        "text": all_bullets[i],
-                        "slides": [bullet_sources[idx] for idx in similar_bullets],
-                        "count": len(similar_bullets),
-                    }
-                )
+        # Exact matches and very similar bullets (word-set Jaccard > 0.8);
+        # candidate pairs come from an index, so large decks stay near-linear
+        groups = find_similar_groups(all_bullets, threshold=0.8)
+        duplicates = [
+            {
+                "text": all_bullets[group[0]],
+                "slides": [bullet_sources[idx] for idx in group],
+                "count": len(group),
+            }
+            for group in groups
+        ]
+        repeated = sum(len(group) - 1 for group in groups)
 
         redundancy_percentage = (
-            (len(checked) / len(all_bullets) * 100) if all_bullets else 0
+            (repeated / len(all_bullets) * 100) if all_bullets else 0
         )
 
         # Create issues
@@ -464,36 +996,53 @@ Return valid JSON with your analysis."""
         Returns:
             Citation analysis with score and issues
         """
-        total_slides = len(slides)
-        slides_with_citations = 0
-        missing_citations = []
+        return self._citation_report([self._citation_status(slide) for slide in slides])
 
-        for slide_idx, slide in enumerate(slides, 1):
-            slide_type = slide.get("outline", {}).get("slide_type", "CONTENT")
+    def _citation_status(self, slide: dict[str, Any]) -> str:
+        """
+        Classify a slide's citations.
 
-            # Skip title slides and section dividers
-            if slide_type in ["TITLE SLIDE", "SECTION DIVIDER"]:
-                continue
+        Returns:
+            "skipped" (title/divider), "cited", "missing" (uncited bullets)
+            or "uncited" (no citations and no bullets)
+        """
+        slide_type = slide.get("outline", {}).get("slide_type", "CONTENT")
 
-            citations = slide.get("citations", [])
+        # Skip title slides and section dividers
+        if slide_type in ["TITLE SLIDE", "SECTION DIVIDER"]:
+            return "skipped"
 
-            if citations and len(citations) > 0:
-                slides_with_citations += 1
-            else:
-                # Check if slide makes claims that should be cited
-                bullets = slide.get("bullets", [])
-                if len(bullets) > 0:  # Content slides should have citations
-                    missing_citations.append(slide_idx)
+        citations = slide.get("citations", [])
+
+        if citations and len(citations) > 0:
+            return "cited"
+
+        # Check if slide makes claims that should be cited
+        bullets = slide.get("bullets", [])
+        if len(bullets) > 0:  # Content slides should have citations
+            return "missing"
+        return "uncited"
+
+    def _citation_report(self, statuses: list[str]) -> dict[str, Any]:
+        """
+        Build the citation result from per-slide statuses.
+
+        Args:
+            statuses: _citation_status() of each slide
+
+        Returns:
+            Citation analysis with score and issues
+        """
+        total_slides = len(statuses)
+        slides_with_citations = statuses.count("cited")
+        missing_citations = [
+            slide_idx
+            for slide_idx, status in enumerate(statuses, 1)
+            if status == "missing"
+        ]
 
         # Calculate score
-        content_slides = total_slides - len(
-            [
-                s
-                for s in slides
-                if s.get("outline", {}).get("slide_type")
-                in ["TITLE SLIDE", "SECTION DIVIDER"]
-            ]
-        )
+        content_slides = total_slides - statuses.count("skipped")
 
         if content_slides == 0:
             score = 100
@@ -526,16 +1075,18 @@ Return valid JSON with your analysis."""
 
     def _approximate_flesch_score(self, text: str) -> float:
         """Approximate Flesch Reading Ease without textstat."""
-        words = text.split()
-        sentences = re.split(r"[.!?]+", text)
-        sentences = [s for s in sentences if s.strip()]
+        counts = TextCounts.from_text(text)
+        return self._flesch_from_counts(
+            counts.words, counts.sentences, counts.syllables
+        )
 
+    def _flesch_from_counts(self, words: int, sentences: int, syllables: int) -> float:
+        """Flesch Reading Ease from word, sentence and syllable counts."""
         if not sentences or not words:
             return 60.0  # Default middle score
 
-        avg_sentence_length = len(words) / len(sentences)
-        syllables = sum(self._count_syllables(word) for word in words)
-        avg_syllables_per_word = syllables / len(words)
+        avg_sentence_length = words / sentences
+        avg_syllables_per_word = syllables / words
 
         # Flesch Reading Ease formula
         score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
@@ -543,22 +1094,30 @@ Return valid JSON with your analysis."""
 
     def _count_syllables(self, word: str) -> int:
         """Approximate syllable count."""
-        word = word.lower()
-        vowels = "aeiouy"
-        syllable_count = 0
-        previous_was_vowel = False
-
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-
-        # Adjust for silent e
-        if word.endswith("e"):
-            syllable_count -= 1
+        return count_syllables(word)
+
+    def _slide_text(self, slide: dict[str, Any]) -> str:
+        """Join a slide's bullets and speaker notes (the text readability reads)."""
+        pieces = list(slide.get("bullets", []))
+        notes = slide.get("speaker_notes", "")
+        if notes:
+            pieces.append(notes)
+        return " ".join(pieces)
+
+    def _slide_text_counts(self, slide: dict[str, Any]) -> TextCounts:
+        """Measure a slide's readability text."""
+        return TextCounts.from_text(self._slide_text(slide))
+
+    def _tone_text(self, slides: list[dict[str, Any]]) -> str:
+        """Extract the slide content sent for tone analysis (first 10 slides)."""
+        slide_texts = []
+        for i, slide in enumerate(slides[:10], 1):
+            title = slide.get("title", "")
+            bullets = slide.get("bullets", [])
+            text = f"Slide {i} - {title}: " + " ".join(bullets)
+            slide_texts.append(text)
 
-        return max(1, syllable_count)
+        return "\n\n".join(slide_texts)
 
     def _approximate_grade_level(self, flesch_score: float) -> int:
         """Convert Flesch score to approximate grade level."""
@@ -708,6 +1267,211 @@ Return valid JSON with your analysis."""
         return recommendations
 
 
+@dataclass
+class SlideMetrics:
+    """Position-independent quality measurements of one slide."""
+
+    text: TextCounts
+    parallelism: tuple[bool, str] | None
+    bullets: tuple[str, ...]
+    citation_status: str
+
+
+class IncrementalQualityAnalyzer(QualityAnalyzer):
+    """
+    Quality analyzer that re-measures only changed slides.
+
+    Per-slide contributions (word and syllable counts, sentence fragments,
+    bullet parallelism, normalized bullets, citation status) are cached by a
+    hash of the slide's content; deck-level scores are re-aggregated from the
+    cache with the same rules as QualityAnalyzer, so results are identical.
+    The Claude tone check is cached by the exact text it analyzes, so edits
+    outside the first 10 slides' titles and bullets do not trigger a new
+    API call.
+
+    Args:
+        max_slides: Maximum cached slides
+        max_tone_results: Maximum cached tone results (deck and window)
+    """
+
+    def __init__(self, max_slides: int = 10000, max_tone_results: int = 1000):
+        """Initialize incremental analyzer."""
+        super().__init__()
+        self.max_slides = max_slides
+        self.max_tone_results = max_tone_results
+        self._slides: OrderedDict[str, SlideMetrics] = OrderedDict()
+        self._tone: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._readability: tuple[str, dict[str, Any]] | None = None
+        self.slide_hits = 0
+        self.slide_misses = 0
+        self.tone_hits = 0
+
+    def _slide_key(self, slide: dict[str, Any]) -> str:
+        """Hash the slide fields that quality metrics read."""
+        content = json.dumps(
+            [
+                slide.get("title", ""),
+                slide.get("bullets", []),
+                slide.get("speaker_notes", ""),
+                slide.get("citations", []),
+                slide.get("outline", {}).get("slide_type", "CONTENT"),
+            ],
+            default=str,
+        )
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _measure_slide(self, slide: dict[str, Any]) -> SlideMetrics:
+        """Measure one slide (cached by content hash)."""
+        key = self._slide_key(slide)
+        cached = self._slides.get(key)
+        if cached is not None:
+            self.slide_hits += 1
+            self._slides.move_to_end(key)
+            return cached
+
+        self.slide_misses += 1
+        bullets = slide.get("bullets", [])
+        metrics = SlideMetrics(
+            text=super()._slide_text_counts(slide),
+            parallelism=(
+                self._check_parallel_structure(bullets) if len(bullets) >= 2 else None
+            ),
+            bullets=tuple(bullet.lower().strip() for bullet in bullets),
+            citation_status=self._citation_status(slide),
+        )
+
+        self._slides[key] = metrics
+        if len(self._slides) > self.max_slides:
+            self._slides.popitem(last=False)
+        return metrics
+
+    def calculate_readability(self, slides: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Calculate readability from cached per-slide counts.
+
+        With textstat installed the combined text is measured by textstat
+        and the result cached until any slide text changes.
+        """
+        try:
+            import textstat  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            key = hashlib.sha1(
+                json.dumps(
+                    [
+                        [s.get("bullets", []), s.get("speaker_notes", "")]
+                        for s in slides
+                    ],
+                    default=str,
+                ).encode("utf-8")
+            ).hexdigest()
+            if self._readability is None or self._readability[0] != key:
+                self._readability = (key, super().calculate_readability(slides))
+            return copy.deepcopy(self._readability[1])
+
+        counts = [self._slide_text_counts(slide) for slide in slides]
+        if all(text.blank for text in counts):
+            return {"score": 100, "grade_level": "N/A", "issues": [], "metrics": {}}
+
+        words = sum(text.words for text in counts)
+        flesch_score = self._flesch_from_counts(
+            words,
+            joined_sentence_count(counts),
+            sum(text.syllables for text in counts),
+        )
+        return self._readability_report(
+            flesch_score, self._approximate_grade_level(flesch_score), False, words
+        )
+
+    def _slide_text_counts(self, slide: dict[str, Any]) -> TextCounts:
+        """Get a slide's readability counts from the cache."""
+        return self._measure_slide(slide).text
+
+    def check_tone_consistency(
+        self, slides: list[dict[str, Any]], target_tone: str = "professional"
+    ) -> dict[str, Any]:
+        """Check tone, reusing the result while the analyzed text is unchanged."""
+        key = hashlib.sha1(
+            f"{target_tone}\0{self._tone_text(slides)}".encode()
+        ).hexdigest()
+        cached = self._cached_tone(key)
+        if cached is not None:
+            return cached
+
+        result = super().check_tone_consistency(slides, target_tone)
+        if "error" not in result:
+            self._store_tone(key, result)
+        return result
+
+    async def _analyze_tone_window(
+        self, text: str, target_tone: str, client: AsyncClaudeClient
+    ) -> dict[str, Any]:
+        """Analyze one tone window, reusing results for unchanged windows."""
+        key = hashlib.sha1(f"window\0{target_tone}\0{text}".encode()).hexdigest()
+        cached = self._cached_tone(key)
+        if cached is not None:
+            return cached
+
+        analysis = await super()._analyze_tone_window(text, target_tone, client)
+        self._store_tone(key, analysis)
+        return analysis
+
+    def _cached_tone(self, key: str) -> dict[str, Any] | None:
+        """Copy of a cached tone result (refreshing its recency), or None."""
+        cached = self._tone.get(key)
+        if cached is None:
+            return None
+        self.tone_hits += 1
+        self._tone.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    def _store_tone(self, key: str, result: dict[str, Any]) -> None:
+        """Cache a tone result, evicting the least recently used over the limit."""
+        self._tone[key] = copy.deepcopy(result)
+        self._tone.move_to_end(key)
+        if len(self._tone) > self.max_tone_results:
+            self._tone.popitem(last=False)
+
+    def check_bullet_parallelism(self, slides: list[dict[str, Any]]) -> dict[str, Any]:
+        """Check bullet parallelism from cached per-slide results."""
+        return self._parallelism_report(
+            [self._measure_slide(slide).parallelism for slide in slides]
+        )
+
+    def detect_redundancy(self, slides: list[dict[str, Any]]) -> dict[str, Any]:
+        """Detect redundancy from cached normalized bullets."""
+        all_bullets = []
+        bullet_sources = []
+        for slide_idx, slide in enumerate(slides, 1):
+            bullets = self._measure_slide(slide).bullets
+            all_bullets.extend(bullets)
+            bullet_sources.extend([slide_idx] * len(bullets))
+        return self._redundancy_report(all_bullets, bullet_sources)
+
+    def validate_citations(self, slides: list[dict[str, Any]]) -> dict[str, Any]:
+        """Validate citations from cached per-slide statuses."""
+        return self._citation_report(
+            [self._measure_slide(slide).citation_status for slide in slides]
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cached slides and tone results, slide hits/misses and
+            tone cache hits
+        """
+        return {
+            "cached_slides": len(self._slides),
+            "cached_tone_results": len(self._tone),
+            "slide_hits": self.slide_hits,
+            "slide_misses": self.slide_misses,
+            "tone_hits": self.tone_hits,
+        }
+
+
 # Convenience function
 def get_quality_analyzer() -> QualityAnalyzer:
     """Get configured quality analyzer instance."""
@@ -259,6 +259,7 @@ class APIRateLimiter:
         "anthropic": RateLimitConfig(requests_per_minute=50, burst_size=5),
         "gemini": RateLimitConfig(requests_per_minute=60, burst_size=10),
         "google": RateLimitConfig(requests_per_minute=60, burst_size=10),
+        "web_search": RateLimitConfig(requests_per_minute=120, burst_size=10),
         "default": RateLimitConfig(requests_per_minute=30, burst_size=5),
     }
 
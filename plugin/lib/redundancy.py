@@ -0,0 +1,103 @@
+"""
+Near-linear redundant-text grouping with exact Jaccard similarity.
+
+Comparing every bullet with every other bullet is quadratic. This module
+finds the same groups while only comparing pairs that could possibly match:
+
+- Each text is tokenized once into a set of integer word IDs
+- Word IDs are ordered rarest-first across the corpus
+- Prefix filtering: if two word sets have Jaccard similarity >= t, their
+  first |A| - floor(t * |A|) + 1 rarest words must share at least one word,
+  so only texts sharing a word in those short prefixes become candidates
+- Candidates are verified with the exact Jaccard score
+
+Because the filter never drops a pair that meets the threshold, results are
+identical to the all-pairs comparison.
+
+Usage:
+    groups = find_similar_groups(["Cut food costs", "cut food costs", ...])
+    # [[0, 1], ...]
+"""
+
+import math
+from collections import Counter
+
+
+def find_similar_groups(texts: list[str], threshold: float = 0.8) -> list[list[int]]:
+    """
+    Group texts that repeat an earlier text.
+
+    Texts are visited in order; each text not already grouped absorbs every
+    later, ungrouped text that is identical to it or whose word-set Jaccard
+    similarity with it exceeds the threshold (words are whitespace-split
+    and lowercased).
+
+    Args:
+        texts: Texts in document order
+        threshold: Jaccard similarity that must be exceeded (0-1)
+
+    Returns:
+        Groups of two or more indices, each starting with the first text of
+        the group, in order of that first text
+    """
+    vocabulary: dict[str, int] = {}
+    word_sets = []
+    for text in texts:
+        word_sets.append(
+            frozenset(
+                vocabulary.setdefault(word, len(vocabulary))
+                for word in text.lower().split()
+            )
+        )
+
+    # Rarest words first keeps prefixes (and their posting lists) short
+    frequency = Counter(word for words in word_sets for word in words)
+    prefixes = []
+    postings: dict[int, list[int]] = {}
+    for index, words in enumerate(word_sets):
+        ordered = sorted(words, key=lambda word: (frequency[word], word))
+        prefix = ordered[: len(ordered) - math.floor(threshold * len(ordered)) + 1]
+        prefixes.append(prefix)
+        for word in prefix:
+            postings.setdefault(word, []).append(index)
+
+    identical: dict[str, list[int]] = {}
+    for index, text in enumerate(texts):
+        identical.setdefault(text, []).append(index)
+
+    groups = []
+    grouped: set[int] = set()
+    for i, words in enumerate(word_sets):
+        if i in grouped:
+            continue
+
+        candidates = {j for j in identical[texts[i]] if j > i}
+        for word in prefixes[i]:
+            candidates.update(j for j in postings[word] if j > i)
+
+        group = [i]
+        for j in sorted(candidates - grouped):
+            if texts[i] == texts[j] or jaccard(words, word_sets[j]) > threshold:
+                group.append(j)
+                grouped.add(j)
+
+        if len(group) > 1:
+            groups.append(group)
+    return groups
+
+
+def jaccard(words1: frozenset[int], words2: frozenset[int]) -> float:
+    """
+    Jaccard similarity of two word sets (0 if either is empty).
+
+    Args:
+        words1: First word set
+        words2: Second word set
+
+    Returns:
+        Intersection size over union size
+    """
+    if not words1 or not words2:
+        return 0.0
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
@@ -0,0 +1,329 @@
+"""
+Search result caching for WebSearch.
+
+Provides pluggable cache backends keyed by normalized query, search engine
+and result count:
+
+- SearchCache: in-process LRU cache (default; lost on exit)
+- SQLiteSearchCache: persistent on-disk cache shared across runs
+
+Both support a time-to-live, LRU eviction bounded by entry count (and,
+for SQLite, total payload bytes) and report hit/miss/byte statistics.
+
+Usage:
+    cache = SQLiteSearchCache("~/.cache/presentation/search.db", ttl_seconds=86400)
+    search = WebSearch(cache=cache)
+    search.search("quick service restaurant trends")
+    print(search.get_cache_stats())
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+def make_cache_key(query: str, engine: str, max_results: int) -> str:
+    """
+    Build a cache key from a search request.
+
+    Queries are normalized (case-folded, whitespace collapsed) so trivially
+    different spellings of the same query share an entry.
+
+    Args:
+        query: Search query
+        engine: Search engine name
+        max_results: Requested result count
+
+    Returns:
+        Hex digest cache key
+    """
+    normalized = " ".join(query.casefold().split())
+    raw = f"{engine}\x00{max_results}\x00{normalized}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    In-memory LRU search cache with optional TTL.
+
+    Values are lists of JSON-serializable result dicts.
+
+    Args:
+        ttl_seconds: Entry lifetime in seconds (None = never expires)
+        max_entries: Maximum cached queries (least recently used evicted)
+    """
+
+    # Whether entries outlive the process (callers skip routine clearing)
+    persistent = False
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int = 1000):
+        """Initialize in-memory search cache."""
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, list[dict[str, Any]], int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """
+        Look up cached results.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached result dicts, or None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(
+        self, key: str, results: list[dict[str, Any]], query: str = "", engine: str = ""
+    ) -> None:
+        """
+        Store results.
+
+        Args:
+            key: Cache key from make_cache_key()
+            results: JSON-serializable result dicts
+            query: Original query (informational)
+            engine: Engine name (informational)
+        """
+        size = len(json.dumps(results, default=str))
+        with self._lock:
+            self._entries[key] = (time.time(), results, size)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached queries."""
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, results, bytes, hits, misses and hit_rate
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        return self._stats(
+            len(entries),
+            sum(len(results) for _, results, _ in entries),
+            sum(size for _, _, size in entries),
+        )
+
+    def _expired(self, created_at: float) -> bool:
+        """Whether an entry created at created_at has outlived the TTL."""
+        return (
+            self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+        )
+
+    def _stats(self, entries: int, results: int, size: int) -> dict[str, Any]:
+        """Assemble a statistics dict."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.__class__.__name__,
+            "entries": entries,
+            "results": results,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SQLiteSearchCache(SearchCache):
+    """
+    Persistent search cache stored in a SQLite database.
+
+    Safe to share between threads (e.g., concurrent multi-query search) and
+    between processes running batch research jobs against the same file.
+
+    Args:
+        path: Database file path (parent directories are created)
+        ttl_seconds: Entry lifetime in seconds (default: 7 days, None = forever)
+        max_entries: Maximum cached queries (least recently used evicted)
+        max_bytes: Maximum total payload size in bytes (None = unbounded)
+    """
+
+    persistent = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS search_cache (
+            key TEXT PRIMARY KEY,
+            query TEXT NOT NULL,
+            engine TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            result_count INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_search_cache_accessed
+            ON search_cache (accessed_at);
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: float | None = 7 * 24 * 3600,
+        max_entries: int = 10000,
+        max_bytes: int | None = 100 * 1024 * 1024,
+    ):
+        """Initialize SQLite search cache."""
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """
+        Look up cached results, refreshing recency on hit.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached result dicts, or None on miss or expiry
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self._expired(row[1]):
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            return json.loads(row[0])
+
+    def set(
+        self, key: str, results: list[dict[str, Any]], query: str = "", engine: str = ""
+    ) -> None:
+        """
+        Store results and evict least recently used entries over the bounds.
+
+        Args:
+            key: Cache key from make_cache_key()
+            results: JSON-serializable result dicts
+            query: Original query (stored for inspection)
+            engine: Engine name (stored for inspection)
+        """
+        payload = json.dumps(results, default=str)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, query, engine, payload, len(payload), len(results), now, now),
+            )
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM search_cache")
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached queries."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, results, bytes, hits, misses and hit_rate
+        """
+        with self._lock:
+            entries, results, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(result_count), 0), "
+                "COALESCE(SUM(size), 0) FROM search_cache"
+            ).fetchone()
+        return self._stats(entries, results, size)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then LRU entries beyond the size bounds."""
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+        ).fetchone()
+
+        excess_entries = max(0, count - self.max_entries)
+        if excess_entries:
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                "SELECT key FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                (excess_entries,),
+            )
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+            ).fetchone()
+
+        if self.max_bytes is None or total <= self.max_bytes:
+            return
+
+        # Walk least recently used entries until enough bytes are freed
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM search_cache ORDER BY accessed_at"
+        ).fetchall():
+            if total - freed <= self.max_bytes:
+                break
+            victims.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM search_cache WHERE key = ?", victims)
@@ -2,11 +2,19 @@
 Web search functionality for research.
 
 Provides web search capabilities with support for multiple search engines.
+Multiple queries run concurrently (search_multiple_queries/search_merged),
+paced by the global APIRateLimiter. Results are cached through a pluggable
+backend (see search_cache.py), optionally persisted on disk.
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any
+from urllib.parse import urlsplit
+
+from .rate_limiter import APIRateLimiter, get_global_rate_limiter
+from .search_cache import SearchCache, make_cache_key
 
 
 # Import real search data
@@ -43,6 +51,9 @@ class WebSearchEngine:
     In production, this would integrate with Google Custom Search, Bing API, etc.
     """
 
+    # APIRateLimiter provider charged per search (None = not rate limited)
+    rate_limit_provider: str | None = None
+
     def __init__(self, api_key: str | None = None, max_results: int = 10):
         """
         Initialize search engine.
@@ -125,6 +136,8 @@ class ClaudeWebSearchEngine(WebSearchEngine):
     web searches and retrieve content.
     """
 
+    rate_limit_provider = "web_search"
+
     def __init__(self, **kwargs):
         """Initialize Claude web search engine."""
         super().__init__(**kwargs)
@@ -224,11 +237,18 @@ class WebSearch:
     Supports multiple search engines and aggregates results.
     """
 
+    # Reciprocal rank fusion constant for search_merged (higher = flatter)
+    RRF_K = 60
+
     def __init__(
         self,
         search_engine: WebSearchEngine | None = None,
         max_sources: int = 20,
         use_real_search: bool = True,
+        *,
+        max_workers: int = 5,
+        rate_limiter: APIRateLimiter | None = None,
+        cache: SearchCache | None = None,
     ):
         """
         Initialize web search.
@@ -237,6 +257,10 @@ class WebSearch:
             search_engine: Search engine implementation
             max_sources: Maximum sources to return
             use_real_search: If True, use ClaudeWebSearchEngine; if False, use mock
+            max_workers: Maximum queries run concurrently
+            rate_limiter: Rate limiter for engine calls (defaults to global limiter)
+            cache: Search cache backend (defaults to an in-memory SearchCache;
+                   use SQLiteSearchCache to persist across runs)
         """
         if search_engine is None:
             search_engine = (
@@ -245,7 +269,9 @@ class WebSearch:
 
         self.search_engine = search_engine
         self.max_sources = max_sources
-        self.search_cache: dict[str, list[SearchResult]] = {}
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or get_global_rate_limiter()
+        self.search_cache = cache if cache is not None else SearchCache()
 
     def search(
         self, query: str, max_results: int | None = None, use_cache: bool = True
@@ -261,19 +287,25 @@ class WebSearch:
         Returns:
             List of search results
         """
-        # Check cache
-        if use_cache and query in self.search_cache:
-            cached_results = self.search_cache[query]
-            if max_results:
-                return cached_results[:max_results]
-            return cached_results
-
-        # Execute search
         max_results = max_results or self.max_sources
+        engine = self.search_engine.__class__.__name__
+        key = make_cache_key(query, engine, max_results)
+
+        # Check cache
+        if use_cache:
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                return [SearchResult(**data) for data in cached]
+
+        # Execute search (rate limited across threads and clients)
+        if self.search_engine.rate_limit_provider:
+            self.rate_limiter.acquire(self.search_engine.rate_limit_provider)
         results = self.search_engine.search(query, max_results=max_results)
 
         # Cache results
-        self.search_cache[query] = results
+        self.search_cache.set(
+            key, [asdict(result) for result in results], query=query, engine=engine
+        )
 
         return results
 
@@ -281,21 +313,105 @@ class WebSearch:
         self, queries: list[str], max_results_per_query: int = 5
     ) -> dict[str, list[SearchResult]]:
         """
-        Execute multiple search queries.
+        Execute multiple search queries concurrently.
+
+        Queries run on a thread pool (up to max_workers at once); each engine
+        call still acquires the global rate limiter, so concurrency never
+        exceeds the provider's limits.
 
         Args:
             queries: List of search queries
             max_results_per_query: Max results per query
 
         Returns:
-            Dictionary mapping queries to results
+            Dictionary mapping queries to results (in query order)
         """
-        results = {}
+        unique_queries = list(dict.fromkeys(queries))
+        if len(unique_queries) <= 1:
+            return {
+                query: self.search(query, max_results=max_results_per_query)
+                for query in unique_queries
+            }
 
-        for query in queries:
-            results[query] = self.search(query, max_results=max_results_per_query)
+        workers = min(self.max_workers, len(unique_queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batches = executor.map(
+                lambda query: self.search(query, max_results=max_results_per_query),
+                unique_queries,
+            )
+            return dict(zip(unique_queries, batches, strict=True))
 
-        return results
+    def search_merged(
+        self,
+        queries: list[str],
+        max_results_per_query: int = 5,
+        max_results: int | None = None,
+    ) -> list[SearchResult]:
+        """
+        Search several queries concurrently and merge into one ranked list.
+
+        Results are deduplicated across queries by normalized URL and ranked
+        by reciprocal rank fusion, so sources that rank well for several
+        angles of a topic come first. Each merged result records the queries
+        it matched in metadata["matched_queries"] and its fused score in
+        metadata["fusion_score"].
+
+        Args:
+            queries: List of search queries
+            max_results_per_query: Max results per query
+            max_results: Maximum merged results (uses max_sources if None)
+
+        Returns:
+            Deduplicated results, best first
+        """
+        per_query = self.search_multiple_queries(queries, max_results_per_query)
+
+        merged: dict[str, SearchResult] = {}
+        fusion: dict[str, float] = {}
+        matched: dict[str, list[str]] = {}
+
+        for query, results in per_query.items():
+            for rank, result in enumerate(results, start=1):
+                key = self._normalize_url(result.url)
+                fusion[key] = fusion.get(key, 0.0) + 1.0 / (self.RRF_K + rank)
+                matched.setdefault(key, []).append(query)
+                best = merged.get(key)
+                if best is None or result.relevance_score > best.relevance_score:
+                    merged[key] = result
+
+        ranked = sorted(
+            merged,
+            key=lambda key: (fusion[key], merged[key].relevance_score),
+            reverse=True,
+        )
+
+        output = []
+        for key in ranked[: max_results or self.max_sources]:
+            result = merged[key]
+            output.append(
+                SearchResult(
+                    title=result.title,
+                    url=result.url,
+                    snippet=result.snippet,
+                    source=result.source,
+                    relevance_score=result.relevance_score,
+                    metadata={
+                        **result.metadata,
+                        "matched_queries": matched[key],
+                        "fusion_score": fusion[key],
+                    },
+                )
+            )
+        return output
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL for cross-query deduplication."""
+        parts = urlsplit(url.strip())
+        host = parts.netloc.lower().removeprefix("www.")
+        path = parts.path.rstrip("/")
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{host}{path}{query}"
 
     def deduplicate_results(self, results: list[SearchResult]) -> list[SearchResult]:
         """
@@ -378,13 +494,14 @@ class WebSearch:
         Get cache statistics.
 
         Returns:
-            Cache statistics
+            Cache statistics (cached_queries, total_cached_results, bytes,
+            hits, misses, hit_rate and backend)
         """
+        stats = self.search_cache.get_stats()
         return {
-            "cached_queries": len(self.search_cache),
-            "total_cached_results": sum(
-                len(results) for results in self.search_cache.values()
-            ),
+            "cached_queries": stats.pop("entries"),
+            "total_cached_results": stats.pop("results"),
+            **stats,
         }
 
     def __repr__(self) -> str:
@@ -13,11 +13,14 @@ Outputs improved presentation with detailed improvement log.
 """
 
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from plugin.base_skill import BaseSkill, SkillInput, SkillOutput, SkillStatus
 from plugin.lib.claude_client import get_claude_client
-from plugin.lib.quality_analyzer import QualityAnalyzer
+from plugin.lib.description_cache import DescriptionCache
+from plugin.lib.quality_analyzer import IncrementalQualityAnalyzer
 
 
 class ContentOptimizationSkill(BaseSkill):
@@ -31,6 +34,25 @@ class ContentOptimizationSkill(BaseSkill):
     - Provide quality scores before/after
     """
 
+    # Cache scope of the graphics description prompt
+    GRAPHICS_CACHE_SCOPE = "content_optimization"
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        """
+        Initialize content optimization skill.
+
+        Args:
+            config: Configuration dictionary
+        """
+        super().__init__(config)
+
+        # Improved graphics descriptions, optionally persisted across runs so
+        # re-optimizing templated decks reuses earlier fix-ups
+        self.description_cache = DescriptionCache(
+            cache_path=self.config.get("description_cache_path"),
+            max_entries=self.config.get("description_cache_max_entries", 2000),
+        )
+
     @property
     def skill_id(self) -> str:
         return "optimize-content"
@@ -73,6 +95,8 @@ class ContentOptimizationSkill(BaseSkill):
                 - style_guide: Style parameters (optional)
                 - optimization_goals: List of focus areas (optional)
                 - output_file: Output path (optional)
+                - full_deck_tone: Analyze tone of every slide in concurrent
+                  windows instead of the first 10 (optional, default: False)
 
         Returns:
             SkillOutput with:
@@ -95,6 +119,7 @@ class ContentOptimizationSkill(BaseSkill):
             ["readability", "tone", "parallelism", "redundancy", "citations"],
         )
         output_file = input.data.get("output_file")
+        full_deck_tone = input.data.get("full_deck_tone", False)
 
         if not output_file:
             # Generate output filename
@@ -105,13 +130,16 @@ class ContentOptimizationSkill(BaseSkill):
         print(f"Slides to optimize: {len(slides)}")
         print(f"Focus areas: {', '.join(optimization_goals)}")
 
-        # Initialize analyzer and client
-        analyzer = QualityAnalyzer()
+        # Initialize analyzer and client (the incremental analyzer caches
+        # per-slide metrics, so re-scoring only re-measures edited slides)
+        analyzer = IncrementalQualityAnalyzer()
         client = get_claude_client()
 
         # Analyze current quality
         print("\nAnalyzing current quality...")
-        initial_analysis = analyzer.analyze_presentation(slides, style_guide)
+        initial_analysis = analyzer.analyze_presentation(
+            slides, style_guide, chunked_tone=full_deck_tone
+        )
 
         print(f"  Initial quality score: {initial_analysis['overall_score']:.1f}/100")
         print(f"  Issues found: {len(initial_analysis['issues'])}")
@@ -130,7 +158,9 @@ class ContentOptimizationSkill(BaseSkill):
 
         # Analyze optimized quality
         print("\nAnalyzing optimized quality...")
-        final_analysis = analyzer.analyze_presentation(optimized_slides, style_guide)
+        final_analysis = analyzer.analyze_presentation(
+            optimized_slides, style_guide, chunked_tone=full_deck_tone
+        )
 
         print(f"  Final quality score: {final_analysis['overall_score']:.1f}/100")
         print(
@@ -166,6 +196,7 @@ class ContentOptimizationSkill(BaseSkill):
             metadata={
                 "slides_optimized": len(optimized_slides),
                 "improvements_count": len(improvements),
+                "description_cache": self.description_cache.get_stats(),
             },
         )
 
@@ -190,6 +221,9 @@ class ContentOptimizationSkill(BaseSkill):
         """
         Optimize slides based on quality analysis.
 
+        Slides with issues are optimized concurrently (up to the
+        max_concurrent_slides config, default 5); results keep slide order.
+
         Args:
             slides: Original slides
             analysis: Quality analysis results
@@ -200,24 +234,23 @@ class ContentOptimizationSkill(BaseSkill):
         Returns:
             (optimized_slides, improvements_log)
         """
-        optimized_slides = []
-        improvements = []
-
-        for slide_idx, slide in enumerate(slides):
-            # Find issues for this slide
-            slide_issues = [
-                issue
-                for issue in analysis["issues"]
-                if issue.get("slide_number") == slide_idx + 1
-            ]
-
-            if not slide_issues:
-                # No issues - keep slide as is
-                optimized_slides.append(slide)
-                continue
-
-            # Optimize slide
-            optimized_slide, slide_improvements = self._optimize_slide(
+        # Bucket issues by slide once instead of filtering per slide
+        issues_by_slide: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+        for issue in analysis["issues"]:
+            issues_by_slide[issue.get("slide_number")].append(issue)
+
+        # Slides without issues are kept as is
+        jobs = [
+            (slide_idx, slide, issues_by_slide[slide_idx + 1])
+            for slide_idx, slide in enumerate(slides)
+            if issues_by_slide.get(slide_idx + 1)
+        ]
+
+        def optimize(
+            job: tuple[int, dict[str, Any], list[dict[str, Any]]],
+        ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+            slide_idx, slide, slide_issues = job
+            return self._optimize_slide(
                 slide=slide,
                 slide_number=slide_idx + 1,
                 issues=slide_issues,
@@ -226,8 +259,18 @@ class ContentOptimizationSkill(BaseSkill):
                 client=client,
             )
 
-            optimized_slides.append(optimized_slide)
-            improvements.extend(slide_improvements)
+        # Optimize affected slides concurrently; map() keeps results in
+        # slide order, so output is deterministic
+        optimized_slides = list(slides)
+        improvements = []
+        if jobs:
+            workers = min(self.config.get("max_concurrent_slides", 5), len(jobs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for (slide_idx, _, _), (optimized_slide, slide_improvements) in zip(
+                    jobs, executor.map(optimize, jobs), strict=True
+                ):
+                    optimized_slides[slide_idx] = optimized_slide
+                    improvements.extend(slide_improvements)
 
         return optimized_slides, improvements
 
@@ -396,6 +439,9 @@ Return only the improved bullets, numbered 1-N."""
         """
         Optimize graphics description.
 
+        Improved descriptions are cached by normalized description, so a
+        recurring weak description is only sent to Claude once.
+
         Args:
             description: Original description
             title: Slide title for context
@@ -405,6 +451,13 @@ Return only the improved bullets, numbered 1-N."""
         Returns:
             (improved_description, improvement_log)
         """
+        cache_key = self.description_cache.make_key(
+            description, self.GRAPHICS_CACHE_SCOPE
+        )
+        cached = self.description_cache.get(cache_key)
+        if cached is not None:
+            return cached, self._graphics_improvement(description, cached)
+
         prompt = f"""Improve this graphics description for a presentation slide.
 
 Slide title: {title}
@@ -431,20 +484,27 @@ Return ONLY the improved description."""
                 max_tokens=500,
             )
 
-            improvement = {
-                "issue_type": "graphics_clarity",
-                "original": description[:100] + "..."
-                if len(description) > 100
-                else description,
-                "improved": improved[:100] + "..." if len(improved) > 100 else improved,
-                "reasoning": "Enhanced specificity and visual detail",
-            }
+            improvement = self._graphics_improvement(description, improved)
+            improved = improved.strip()
+            self.description_cache.set(cache_key, improved)
 
-            return improved.strip(), improvement
+            return improved, improvement
 
         except Exception:
             return description, {}
 
+    @staticmethod
+    def _graphics_improvement(description: str, improved: str) -> dict[str, Any]:
+        """Build the improvement log entry for a graphics description."""
+        return {
+            "issue_type": "graphics_clarity",
+            "original": description[:100] + "..."
+            if len(description) > 100
+            else description,
+            "improved": improved[:100] + "..." if len(improved) > 100 else improved,
+            "reasoning": "Enhanced specificity and visual detail",
+        }
+
     def _save_optimized_presentation(
         self,
         slides: list[dict[str, Any]],
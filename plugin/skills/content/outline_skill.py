@@ -7,6 +7,7 @@ Generates presentation outline from research and insights.
 from typing import Any
 
 from plugin.base_skill import BaseSkill, SkillInput, SkillOutput
+from plugin.lib.context_packer import ContextPacker
 from plugin.lib.json_utils import extract_json_from_response
 
 
@@ -17,6 +18,20 @@ class OutlineSkill(BaseSkill):
     Creates structured presentation outline with slides, titles, and content.
     """
 
+    def __init__(self, config: dict[str, Any] | None = None):
+        """
+        Initialize outline skill.
+
+        Args:
+            config: Configuration dictionary ("context_token_budget" caps the
+                    research content sent to Claude, default 2500 tokens)
+        """
+        super().__init__(config)
+        # Shared across runs so chunk token counts stay cached
+        self.context_packer = ContextPacker(
+            token_budget=self.config.get("context_token_budget", 2500)
+        )
+
     @property
     def skill_id(self) -> str:
         """Unique identifier for this skill."""
@@ -218,15 +233,15 @@ class OutlineSkill(BaseSkill):
         topic = research.get("search_query", "Research Topic")
         sources = research.get("sources", [])
 
-        # Build research summary for Claude
+        # Build research summary for Claude from the source chunks most
+        # relevant to the topic and objectives, within the token budget
+        query = " ".join([topic, *objectives, *research.get("key_themes", [])])
+        context = self.context_packer.pack(sources, query=query)
+
         research_summary = f"Topic: {topic}\n\n"
         research_summary += f"Number of sources: {len(sources)}\n\n"
         research_summary += "Key source content:\n"
-
-        for i, source in enumerate(sources[:10], 1):
-            research_summary += f"\n{i}. {source.get('title', 'Untitled')}\n"
-            research_summary += f"   Citation: {source.get('citation_id', 'N/A')}\n"
-            research_summary += f"   Content: {source.get('content', '')[:400]}...\n"
+        research_summary += context.render()
 
         # Use Claude to generate intelligent outline
         client = get_claude_client()
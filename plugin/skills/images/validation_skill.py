@@ -123,6 +123,7 @@ class ValidationSkill(BaseSkill):
         - style_config: Style configuration dict
         - enable_caching: Enable validation caching (default: True)
         - parallel: Enable parallel validation (default: False)
+        - batch_size: Slides per batched vision request (default: 1 = per slide)
         - dpi: Export DPI (default: 150)
 
         Returns:
@@ -145,6 +146,7 @@ class ValidationSkill(BaseSkill):
         - output_dir: Directory for exported slides (default: validation/)
         - enable_caching: Enable validation caching (default: True)
         - parallel: Enable parallel validation (default: False)
+        - batch_size: Slides per batched vision request (default: 1 = per slide)
         - dpi: Export DPI (default: 150)
         - skip_export_errors: Continue if export fails (default: True)
 
@@ -166,6 +168,7 @@ class ValidationSkill(BaseSkill):
 
         enable_caching = input.data.get("enable_caching", True)
         input.data.get("parallel", False)
+        batch_size = input.data.get("batch_size", 1)
         dpi = input.data.get("dpi", 150)
         skip_export_errors = input.data.get("skip_export_errors", True)
 
@@ -199,6 +202,8 @@ class ValidationSkill(BaseSkill):
         print(f"Total Slides: {len(slides)}")
         print(f"Export DPI: {dpi}")
         print(f"Caching: {'Enabled' if enable_caching else 'Disabled'}")
+        if batch_size > 1:
+            print(f"Batch Size: {batch_size} slides per vision request")
         print()
 
         start_time = time.time()
@@ -217,12 +222,13 @@ class ValidationSkill(BaseSkill):
                         metadata=self.platform_info,
                     )
 
-        # Validate each slide
+        # Export slides and collect those with images to validate
         validation_results = []
         passed_count = 0
         failed_count = 0
         total_score = 0.0
         export_errors = []
+        to_validate = []
 
         for i, slide in enumerate(slides):
             slide_number = i + 1
@@ -258,9 +264,51 @@ class ValidationSkill(BaseSkill):
             elif slide_image_path.exists():
                 print(f"  ✓ Using cached export: {slide_image_path.name}")
 
-            # Validate slide (if image exists)
             if slide_image_path.exists():
-                try:
+                # Placeholder keeps results in slide order; filled in below
+                validation_results.append({"slide_number": slide_number})
+                to_validate.append((slide_number, slide, slide_image_path))
+            else:
+                print("  ⚠️  Skipping validation (no exported image)")
+                validation_results.append(
+                    {
+                        "slide_number": slide_number,
+                        "skipped": True,
+                        "reason": "No exported image available",
+                    }
+                )
+
+        # Validate slides (batched requests when batch_size > 1)
+        batched = {}
+        if batch_size > 1 and len(to_validate) > 1:
+            try:
+                batch_results = self.validator.validate_slides_batch(
+                    [
+                        (str(path), slide, slide.get("type", "content"))
+                        for _, slide, path in to_validate
+                    ],
+                    style_config,
+                    batch_size=batch_size,
+                )
+                batched = {
+                    slide_number: result
+                    for (slide_number, _, _), result in zip(
+                        to_validate, batch_results, strict=True
+                    )
+                }
+                analytics.track_api_call(
+                    "gemini_vision", call_count=self.validator.last_batch_api_calls
+                )
+            except Exception as e:
+                print(f"\n⚠️  Batched validation failed ({e}) - validating per slide")
+
+        entries = {entry["slide_number"]: entry for entry in validation_results}
+        for slide_number, slide, slide_image_path in to_validate:
+            entry = entries[slide_number]
+            try:
+                if slide_number in batched:
+                    validation_result = batched[slide_number]
+                else:
                     # Determine slide type (from classification or default)
                     slide_type = slide.get("type", "content")
 
@@ -275,39 +323,29 @@ class ValidationSkill(BaseSkill):
                     # Track API call
                     analytics.track_api_call("gemini_vision", call_count=1)
 
-                    # Update counters
-                    if validation_result.passed:
-                        passed_count += 1
-                        print(f"  ✓ Passed ({validation_result.score:.1f}/100)")
-                    else:
-                        failed_count += 1
-                        print(f"  ✗ Failed ({validation_result.score:.1f}/100)")
-
-                        # Show top issues
-                        if validation_result.issues:
-                            for issue in validation_result.issues[:2]:
-                                print(f"      - {issue.get('message', issue)}")
-
-                    total_score += validation_result.score
-                    validation_results.append(
-                        {"slide_number": slide_number, "validation": validation_result}
+                # Update counters
+                if validation_result.passed:
+                    passed_count += 1
+                    print(
+                        f"  ✓ Slide {slide_number} passed ({validation_result.score:.1f}/100)"
                     )
-
-                except Exception as e:
-                    print(f"  ✗ Validation error: {e}")
-                    validation_results.append(
-                        {"slide_number": slide_number, "error": str(e)}
+                else:
+                    failed_count += 1
+                    print(
+                        f"  ✗ Slide {slide_number} failed ({validation_result.score:.1f}/100)"
                     )
 
-            else:
-                print("  ⚠️  Skipping validation (no exported image)")
-                validation_results.append(
-                    {
-                        "slide_number": slide_number,
-                        "skipped": True,
-                        "reason": "No exported image available",
-                    }
-                )
+                    # Show top issues
+                    if validation_result.issues:
+                        for issue in validation_result.issues[:2]:
+                            print(f"      - {issue.get('message', issue)}")
+
+                total_score += validation_result.score
+                entry["validation"] = validation_result
+
+            except Exception as e:
+                print(f"  ✗ Validation error: {e}")
+                entry["error"] = str(e)
 
         validation_time = time.time() - start_time
 
@@ -5,11 +5,53 @@ Extracts key insights, arguments, and concepts from research.
 """
 
 import re
+from collections.abc import Iterator
 from typing import Any
 
 from plugin.base_skill import BaseSkill, SkillInput, SkillOutput
 
 
+# Sentence boundary: terminal punctuation followed by whitespace
+SENTENCE_BOUNDARY_RE = re.compile(r"[.!?]+\s+")
+
+# Any insight indicator (one precompiled alternation)
+INSIGHT_RE = re.compile(
+    r"\b(?:shows?|demonstrates?|proves?|indicates?|suggests?"
+    r"|importantly?|significantly?|notably?"
+    r"|(?:research|study|analysis)\s+(?:shows?|finds?|reveals?))\b",
+    re.IGNORECASE,
+)
+
+# Claim/reasoning connector within a sentence
+CONNECTOR_RE = re.compile(r"\s+(?:because|therefore|thus)\s+", re.IGNORECASE)
+
+# Sentences longer than this are not treated as a single claim/reasoning
+# pair (e.g., navigation text with no punctuation)
+MAX_ARGUMENT_SENTENCE_CHARS = 1000
+
+MAX_INSIGHTS = 10
+MAX_ARGUMENTS = 5
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """
+    Yield sentences lazily, splitting on terminal punctuation + whitespace.
+
+    Equivalent to re.split(r"[.!?]+\\s+", text) without building the list.
+
+    Args:
+        text: Text to split
+
+    Yields:
+        Sentences (the last keeps any trailing punctuation)
+    """
+    start = 0
+    for boundary in SENTENCE_BOUNDARY_RE.finditer(text):
+        yield text[start : boundary.start()]
+        start = boundary.end()
+    yield text[start:]
+
+
 class InsightExtractionSkill(BaseSkill):
     """
     Extracts key insights, arguments, and concepts from research.
@@ -125,6 +167,9 @@ class InsightExtractionSkill(BaseSkill):
         """
         Extract key insights from sources.
 
+        Streams sentences through one precompiled indicator pattern and
+        stops as soon as MAX_INSIGHTS are found.
+
         Args:
             sources: Research sources
             focus_areas: Optional focus areas
@@ -134,38 +179,32 @@ class InsightExtractionSkill(BaseSkill):
         """
         insights = []
 
-        # Extract sentences from content
         for source in sources:
-            content = source.get("content", "")
-            sentences = re.split(r"[.!?]+\s+", content)
-
-            # Find sentences with insight indicators
-            insight_patterns = [
-                r"\b(shows?|demonstrates?|proves?|indicates?|suggests?)\b",
-                r"\b(importantly?|significantly?|notably?)\b",
-                r"\b(research|study|analysis)\s+(shows?|finds?|reveals?)\b",
-            ]
-
-            for sentence in sentences:
-                for pattern in insight_patterns:
-                    if re.search(pattern, sentence, re.IGNORECASE):
-                        insights.append(
-                            {
-                                "statement": sentence.strip(),
-                                "supporting_evidence": [source.get("snippet", "")],
-                                "confidence": 0.75,
-                                "sources": [source.get("citation_id")],
-                            }
-                        )
-                        break
-
-        # Deduplicate and limit
-        return insights[:10]
+            for sentence in iter_sentences(source.get("content", "")):
+                if not INSIGHT_RE.search(sentence):
+                    continue
+
+                insights.append(
+                    {
+                        "statement": sentence.strip(),
+                        "supporting_evidence": [source.get("snippet", "")],
+                        "confidence": 0.75,
+                        "sources": [source.get("citation_id")],
+                    }
+                )
+                if len(insights) == MAX_INSIGHTS:
+                    return insights
+
+        return insights
 
     def _extract_arguments(self, sources: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Extract arguments from sources.
 
+        A sentence of the form "<claim> because|therefore|thus <reasoning>"
+        yields one argument. Matching is per sentence (bounded by
+        MAX_ARGUMENT_SENTENCE_CHARS), so cost stays linear in source length.
+
         Args:
             sources: Research sources
 
@@ -174,33 +213,31 @@ class InsightExtractionSkill(BaseSkill):
         """
         arguments = []
 
-        # Find claim-evidence patterns
-        claim_patterns = [
-            r"(.*?)\s+because\s+(.*?)\.",
-            r"(.*?)\s+therefore\s+(.*?)\.",
-            r"(.*?)\s+thus\s+(.*?)\.",
-        ]
-
         for source in sources:
-            content = source.get("content", "")
+            for sentence in iter_sentences(source.get("content", "")):
+                if len(sentence) > MAX_ARGUMENT_SENTENCE_CHARS:
+                    continue
+                match = CONNECTOR_RE.search(sentence)
+                if match is None:
+                    continue
+
+                claim = sentence[: match.start()].strip()
+                reasoning = sentence[match.end() :].strip().rstrip(".!?")
+                if not claim or not reasoning:
+                    continue
+
+                arguments.append(
+                    {
+                        "claim": claim,
+                        "reasoning": reasoning,
+                        "evidence": [source.get("snippet", "")],
+                        "counter_arguments": [],  # Would be populated by analysis
+                    }
+                )
+                if len(arguments) == MAX_ARGUMENTS:
+                    return arguments
 
-            for pattern in claim_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    claim = match.group(1).strip()
-                    reasoning = match.group(2).strip()
-
-                    arguments.append(
-                        {
-                            "claim": claim,
-                            "reasoning": reasoning,
-                            "evidence": [source.get("snippet", "")],
-                            "counter_arguments": [],  # Would be populated by analysis
-                        }
-                    )
-
-        # Limit results
-        return arguments[:5]
+        return arguments
 
     def _build_concept_map(self, sources: list[dict[str, Any]]) -> dict[str, Any]:
         """
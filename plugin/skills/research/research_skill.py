@@ -7,8 +7,12 @@ Conducts web research and gathers authoritative sources on a topic.
 from typing import Any
 
 from plugin.base_skill import BaseSkill, SkillInput, SkillOutput
-from plugin.lib.citation_manager import CitationManager
+from plugin.lib.citation_manager import CitationManager, same_source_url
 from plugin.lib.content_extractor import ContentExtractor
+from plugin.lib.http_cache import HTTPCache
+from plugin.lib.keyword_engine import extract_corpus_keywords
+from plugin.lib.near_duplicates import NearDuplicateDetector
+from plugin.lib.search_cache import SQLiteSearchCache
 from plugin.lib.web_search import WebSearch
 
 
@@ -28,10 +32,42 @@ class ResearchSkill(BaseSkill):
             config: Configuration dictionary
         """
         super().__init__(config)
-        self.web_search = WebSearch()
-        self.content_extractor = ContentExtractor()
+
+        # Optional persistent search cache shared across runs
+        cache_path = self.config.get("search_cache_path")
+        cache = (
+            SQLiteSearchCache(
+                cache_path,
+                ttl_seconds=self.config.get("search_cache_ttl", 7 * 24 * 3600),
+            )
+            if cache_path
+            else None
+        )
+        self.web_search = WebSearch(cache=cache)
+
+        # Optional HTTP response cache for fetched source pages
+        http_cache_path = self.config.get("http_cache_path")
+        http_cache = (
+            HTTPCache(
+                http_cache_path,
+                max_bytes=self.config.get("http_cache_max_bytes", 200 * 1024 * 1024),
+            )
+            if http_cache_path
+            else None
+        )
+        self.content_extractor = ContentExtractor(
+            fetch_remote=self.config.get("fetch_sources", False),
+            timeout=self.config.get("fetch_timeout", 15.0),
+            max_concurrent=self.config.get("max_concurrent_fetches", 8),
+            per_host_limit=self.config.get("per_host_fetch_limit", 2),
+            http_cache=http_cache,
+        )
         self.citation_manager = CitationManager()
 
+        # Jaccard similarity above which a page is dropped as a near-duplicate
+        # (syndicated copy) of a higher-ranked one; None disables the check
+        self.near_duplicate_threshold = self.config.get("near_duplicate_threshold", 0.8)
+
     @property
     def skill_id(self) -> str:
         """Unique identifier for this skill."""
@@ -101,12 +137,14 @@ class ResearchSkill(BaseSkill):
                     "title": str,
                     "content": str,
                     "relevance_score": float,
-                    "word_count": int
+                    "word_count": int,
+                    "keywords": List[str]
                 }
             ],
             "summary": str,
             "key_themes": List[str],
-            "citations": List[dict]
+            "citations": List[dict],
+            "duplicate_sources": [{"url": str, "duplicate_of": str}]
         }
 
         Args:
@@ -128,10 +166,31 @@ class ResearchSkill(BaseSkill):
         query = self._build_search_query(topic, context)
         search_results = self.web_search.search(query, max_results=search_count)
 
-        # Extract content from top results
+        # Fetch and extract top results concurrently (returned in result order)
+        top_results = search_results[:max_sources]
+        extracted_pages = self.content_extractor.extract_many(
+            [result.url for result in top_results]
+        )
+
+        detector = (
+            NearDuplicateDetector(threshold=self.near_duplicate_threshold)
+            if self.near_duplicate_threshold
+            else None
+        )
+
         sources = []
-        for result in search_results[:max_sources]:
-            extracted = self.content_extractor.extract(result.url)
+        duplicate_sources = []
+        source_urls_by_citation: dict[str, str] = {}
+        for result, extracted in zip(top_results, extracted_pages, strict=True):
+            # Skip near-duplicates of higher-ranked pages (mock placeholder
+            # text is identical by construction and never compared)
+            if detector and not extracted.metadata.get("mock"):
+                original_url = detector.add(extracted.url, extracted.content)
+                if original_url is not None:
+                    duplicate_sources.append(
+                        {"url": extracted.url, "duplicate_of": original_url}
+                    )
+                    continue
 
             # Add citation
             citation_id = self.citation_manager.add_citation(
@@ -141,6 +200,18 @@ class ResearchSkill(BaseSkill):
                 publication_date=extracted.publication_date,
             )
 
+            # Same page (URL or DOI) as a source already kept in this run;
+            # a citation merged on title and author keeps both pages
+            original_url = source_urls_by_citation.get(citation_id)
+            if original_url is not None and same_source_url(
+                extracted.url, original_url
+            ):
+                duplicate_sources.append(
+                    {"url": extracted.url, "duplicate_of": original_url}
+                )
+                continue
+            source_urls_by_citation.setdefault(citation_id, extracted.url)
+
             sources.append(
                 {
                     "citation_id": citation_id,
@@ -156,8 +227,13 @@ class ResearchSkill(BaseSkill):
         # Generate summary
         summary = self._generate_summary(sources)
 
-        # Extract key themes
-        key_themes = self._extract_themes(sources)
+        # Per-source keywords and corpus themes in one TF-IDF pass
+        corpus_keywords = extract_corpus_keywords(
+            [source["content"] for source in sources], top_n=5, theme_count=10
+        )
+        for source, keywords in zip(sources, corpus_keywords.keywords, strict=True):
+            source["keywords"] = keywords
+        key_themes = corpus_keywords.themes
 
         # Export citations
         citations = self.citation_manager.export_citations()
@@ -170,6 +246,7 @@ class ResearchSkill(BaseSkill):
                 "citations": citations,
                 "search_query": query,
                 "sources_count": len(sources),
+                "duplicate_sources": duplicate_sources,
             }
         )
 
@@ -216,35 +293,8 @@ class ResearchSkill(BaseSkill):
 
         return "\n".join(summary_parts)
 
-    def _extract_themes(self, sources: list[dict[str, Any]]) -> list[str]:
-        """
-        Extract key themes from research sources.
-
-        Args:
-            sources: List of source data
-
-        Returns:
-            List of key themes
-        """
-        # Simple theme extraction based on keywords
-        all_keywords = []
-        for source in sources:
-            keywords = self.content_extractor.extract_keywords(
-                source["content"], top_n=5
-            )
-            all_keywords.extend(keywords)
-
-        # Count keyword frequency
-        keyword_freq: dict[str, int] = {}
-        for keyword in all_keywords:
-            keyword_freq[keyword] = keyword_freq.get(keyword, 0) + 1
-
-        # Get top themes
-        sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
-        themes = [keyword for keyword, _ in sorted_keywords[:10]]
-
-        return themes
-
     def cleanup(self) -> None:
         """Optional cleanup after execution."""
-        self.web_search.clear_cache()
+        # Persistent caches are kept for later runs
+        if not self.web_search.search_cache.persistent:
+            self.web_search.clear_cache()
@@ -76,6 +76,27 @@ def get_template(template_id: str, **kwargs) -> PresentationTemplate:
     return _TEMPLATES[template_id](**kwargs)
 
 
+def get_template_class(template_id: str) -> type[PresentationTemplate]:
+    """
+    Get the class of the specified template without instantiating it.
+
+    Args:
+        template_id: The template identifier (e.g., 'cfa', 'stratfield')
+
+    Returns:
+        The registered template class
+
+    Raises:
+        ValueError: If template_id is not registered
+    """
+    if template_id not in _TEMPLATES:
+        available = ", ".join(_TEMPLATES.keys())
+        raise ValueError(
+            f"Unknown template: '{template_id}'. Available templates: {available}"
+        )
+    return _TEMPLATES[template_id]
+
+
 def list_templates() -> list[tuple[str, str, str]]:
     """
     List all registered templates.
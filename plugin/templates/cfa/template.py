@@ -322,6 +322,9 @@ class CFAPresentation(PresentationTemplate):
         prs.save("q4_review.pptx")
     """
 
+    LAYOUT_SPECS = LAYOUTS
+    SLIDE_SIZE = (SLIDE_WIDTH, SLIDE_HEIGHT)
+
     @property
     def name(self) -> str:
         """Template display name."""
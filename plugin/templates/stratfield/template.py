@@ -348,6 +348,9 @@ class StratfieldPresentation(PresentationTemplate):
         prs.save("output.pptx")
     """
 
+    LAYOUT_SPECS = LAYOUTS
+    SLIDE_SIZE = (SLIDE_WIDTH_EMU / EMU_PER_INCH, SLIDE_HEIGHT_EMU / EMU_PER_INCH)
+
     @property
     def name(self) -> str:
         """Human-readable template name."""
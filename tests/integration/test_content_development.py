@@ -11,6 +11,7 @@ Usage:
 """
 
 import os
+import tempfile
 
 import pytest
 
@@ -24,6 +25,9 @@ from plugin.skills.content.content_optimization_skill import ContentOptimization
 # Cache for storing results between tests (module-level state)
 _test_cache = {}
 
+# Generated files go to a temp dir, never the working tree
+OUTPUT_DIR = tempfile.mkdtemp(prefix="content-development-")
+
 
 def print_section(title: str):
     """Print formatted section header."""
@@ -130,7 +134,7 @@ def drafting_output():
     """Fixture that provides drafting output, running drafting if needed."""
     if "drafting_output" not in _test_cache:
         # Ensure output directory exists
-        os.makedirs("./output/test", exist_ok=True)
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
 
         outline = create_test_outline()
         research = create_test_research()
@@ -151,7 +155,7 @@ def drafting_output():
                 "research": research,
                 "style_guide": style_guide,
                 "style_config": style_config,
-                "output_dir": "./output/test",
+                "output_dir": OUTPUT_DIR,
             },
             context={},
             config={},
@@ -189,7 +193,7 @@ def test_content_drafting():
             "research": research,
             "style_guide": style_guide,
             "style_config": style_config,
-            "output_dir": "./output/test",
+            "output_dir": OUTPUT_DIR,
         },
         context={},
         config={},
@@ -289,7 +293,7 @@ def test_content_optimization(drafting_output):
             "slides": slides,
             "style_guide": style_guide,
             "optimization_goals": ["readability", "parallelism", "citations"],
-            "output_file": "./output/test/optimized_presentation.md",
+            "output_file": os.path.join(OUTPUT_DIR, "optimized_presentation.md"),
         },
         context={},
         config={},
@@ -367,7 +371,7 @@ def main():
     print("#" * 80)
 
     # Create output directory
-    os.makedirs("./output/test", exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # Phase 1: Content Drafting
     drafting_output = test_content_drafting()
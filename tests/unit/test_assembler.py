@@ -815,6 +815,91 @@ class TestBuildSlideWithValidation:
             # Verify no refinement was needed (passed first time)
             mock_refiner.generate_refinement.assert_not_called()
 
+    def _build_with_failing_preview(self, **kwargs):
+        """Run _build_slide_with_validation on a slide whose preview has issues."""
+        from plugin.lib.presentation.assembler import _build_slide_with_validation
+
+        slide = Slide(
+            number=4,
+            slide_type="CONTENT",
+            title="Crowded Slide",
+            content_bullets=[("Long text", 0)],
+            graphic="A diagram",
+        )
+        classification = TypeClassification(
+            slide_type="content",
+            confidence=0.9,
+            reasoning="Content slide",
+            template_method="add_content_slide",
+        )
+
+        mock_preview = MagicMock()
+        mock_preview.has_issues = True
+        mock_previewer = MagicMock()
+        mock_previewer.render.return_value = mock_preview
+
+        mock_validator = MagicMock()
+        mock_validator.validate_preview.return_value.issues = ["Text overflows"]
+        mock_validator.validate_slide.return_value.passed = True
+        mock_validator.validate_slide.return_value.score = 0.95
+        mock_exporter = MagicMock()
+        mock_exporter.export_slide.return_value = True
+
+        self.mock_template.prs.slides.__len__ = MagicMock(return_value=1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            validation_dir = Path(temp_dir) / "validation"
+            validation_dir.mkdir()
+
+            _build_slide_with_validation(
+                template=self.mock_template,
+                slide=slide,
+                classification=classification,
+                image_paths={},
+                images_dir=Path(temp_dir),
+                validator=mock_validator,
+                refiner=MagicMock(),
+                exporter=mock_exporter,
+                validation_dir=validation_dir,
+                style_config={},
+                output_path=Path(temp_dir) / "output.pptx",
+                max_attempts=3,
+                fast_mode=False,
+                notext=True,
+                previewer=mock_previewer,
+                **kwargs,
+            )
+
+        mock_previewer.render.assert_called_once_with(slide, "add_content_slide", None)
+        mock_validator.validate_preview.assert_called_once_with(mock_preview, slide)
+        return mock_validator, mock_exporter
+
+    @patch("plugin.lib.presentation.assembler._add_slide_to_presentation")
+    @patch("plugin.lib.presentation.assembler.generate_slide_image")
+    def test_preview_issues_still_run_export_and_vision(
+        self, mock_generate_image, mock_add_slide
+    ):
+        """Test failing preview check is logged and vision validation still runs."""
+        mock_validator, mock_exporter = self._build_with_failing_preview()
+
+        mock_exporter.export_slide.assert_called_once()
+        mock_validator.validate_slide.assert_called_once()
+        mock_generate_image.assert_not_called()
+
+    @patch("plugin.lib.presentation.assembler._add_slide_to_presentation")
+    @patch("plugin.lib.presentation.assembler.generate_slide_image")
+    def test_preview_issues_stop_when_requested(
+        self, mock_generate_image, mock_add_slide
+    ):
+        """Test stop_on_preview_issues skips export and Gemini validation."""
+        mock_validator, mock_exporter = self._build_with_failing_preview(
+            stop_on_preview_issues=True
+        )
+
+        mock_exporter.export_slide.assert_not_called()
+        mock_validator.validate_slide.assert_not_called()
+        mock_generate_image.assert_not_called()
+
     @patch("plugin.lib.presentation.assembler._add_slide_to_presentation")
     @patch("plugin.lib.presentation.assembler._remove_last_slide")
     @patch("plugin.lib.presentation.assembler.generate_slide_image")
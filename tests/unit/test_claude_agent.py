@@ -154,6 +154,58 @@ class TestResearchAgentConductResearch:
         assert len(result["sources"]) > 0
         assert result["search_query"] == "test topic"
 
+    @patch("plugin.lib.claude_agent.Anthropic")
+    def test_conduct_research_runs_searches_concurrently(self, mock_anthropic):
+        """Test several web_search calls in one turn run in parallel."""
+        import threading
+
+        mock_client = MagicMock()
+        mock_anthropic.return_value = mock_client
+
+        tool_uses = []
+        for i in range(3):
+            tool_use = MagicMock()
+            tool_use.type = "tool_use"
+            tool_use.name = "web_search"
+            tool_use.id = f"tool-{i}"
+            tool_use.input = {"query": f"query {i}", "num_results": 2}
+            tool_uses.append(tool_use)
+
+        mock_response1 = MagicMock()
+        mock_response1.content = tool_uses
+
+        mock_text_block = MagicMock()
+        mock_text_block.type = "text"
+        mock_text_block.text = '{"summary": "Done"}'
+        mock_response2 = MagicMock()
+        mock_response2.content = [mock_text_block]
+
+        mock_client.messages.create.side_effect = [mock_response1, mock_response2]
+
+        # Every search waits for the others - only completes if concurrent
+        barrier = threading.Barrier(3, timeout=5)
+
+        def mock_search(query, num_results):
+            barrier.wait()
+            return [{"title": query, "url": f"http://example.com/{query[-1]}"}]
+
+        agent = ResearchAgent(api_key="test-key")
+        result = agent.conduct_research("test topic", search_function=mock_search)
+
+        assert [s["title"] for s in result["sources"]] == [
+            "query 0",
+            "query 1",
+            "query 2",
+        ]
+        tool_results = mock_client.messages.create.call_args_list[1].kwargs["messages"][
+            2
+        ]["content"]
+        assert [r["tool_use_id"] for r in tool_results] == [
+            "tool-0",
+            "tool-1",
+            "tool-2",
+        ]
+
     @patch("plugin.lib.claude_agent.Anthropic")
     def test_conduct_research_with_extract_tool(self, mock_anthropic):
         """Test research with content extraction tool use."""
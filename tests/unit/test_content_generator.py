@@ -1352,3 +1352,64 @@ Second paragraph continues here."""
         )
 
         assert long_description in result
+
+
+class TestResearchRetrieval:
+    """Tests for per-slide research passage retrieval."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch("plugin.lib.content_generator.get_claude_client"):
+            self.generator = ContentGenerator()
+        self.research = {
+            "sources": [
+                {
+                    "citation_id": "cite-001",
+                    "title": "Staffing Guide",
+                    "content": "Kitchen staffing follows predicted covers.",
+                },
+                {
+                    "citation_id": "cite-002",
+                    "title": "Pricing Study",
+                    "content": "Menu pricing uses anchor dishes to frame value.",
+                },
+            ]
+        }
+
+    def test_generate_bullets_retrieves_relevant_passages(self):
+        """Test bullets only receive passages relevant to the slide."""
+        slide = {"purpose": "Explain menu pricing", "key_points": ["anchor dishes"]}
+
+        with patch.object(
+            self.generator.client, "generate_text", return_value="1. Bullet"
+        ) as mock_generate:
+            self.generator.generate_bullets(slide, self.research)
+            prompt = mock_generate.call_args.kwargs["prompt"]
+
+        assert "Menu pricing uses anchor dishes" in prompt
+        assert "Kitchen staffing" not in prompt
+
+    def test_generate_speaker_notes_includes_relevant_passage(self):
+        """Test speaker notes receive matching research content."""
+        with patch.object(
+            self.generator.client, "generate_text", return_value="Notes"
+        ) as mock_generate:
+            self.generator.generate_speaker_notes(
+                slide={"purpose": "Plan kitchen staffing"},
+                title="Staffing",
+                bullets=["Match staff to covers"],
+                research_context=self.research,
+            )
+            prompt = mock_generate.call_args.kwargs["prompt"]
+
+        assert "Staffing Guide: Kitchen staffing follows predicted covers." in prompt
+        assert "Pricing Study" not in prompt
+
+    def test_passage_index_built_once_per_research(self):
+        """Test slides of one run share a single index."""
+        first = self.generator.get_passage_index(self.research)
+        second = self.generator.get_passage_index(self.research)
+        other = self.generator.get_passage_index({"sources": []})
+
+        assert first is second
+        assert other is not first
@@ -6,6 +6,7 @@ Tests the ContentOptimizationSkill class and its methods.
 
 import os
 import tempfile
+import threading
 from unittest.mock import MagicMock, patch
 
 from plugin.base_skill import SkillInput, SkillStatus
@@ -140,7 +141,9 @@ class TestContentOptimizationSkillExecute:
             shutil.rmtree(self.temp_dir)
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_execute_with_slides_success(self, mock_analyzer_class, mock_get_client):
         """Test successful execution with slides input."""
         # Set up mocks
@@ -185,11 +188,15 @@ class TestContentOptimizationSkillExecute:
         assert output_file in output.artifacts
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_execute_generates_default_output_filename(
-        self, mock_analyzer_class, mock_get_client
+        self, mock_analyzer_class, mock_get_client, monkeypatch
     ):
         """Test execute generates default output filename when not provided."""
+        # The default output file is written to the working directory
+        monkeypatch.chdir(self.temp_dir)
         mock_analyzer = MagicMock()
         mock_analyzer.analyze_presentation.return_value = {
             "overall_score": 80.0,
@@ -216,9 +223,14 @@ class TestContentOptimizationSkillExecute:
 
         assert output.success is True
         assert output.data["optimized_file"] == "my_presentation_optimized.md"
+        assert os.path.exists(
+            os.path.join(self.temp_dir, "my_presentation_optimized.md")
+        )
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_execute_includes_quality_improvement(
         self, mock_analyzer_class, mock_get_client
     ):
@@ -254,7 +266,9 @@ class TestContentOptimizationSkillExecute:
         assert output.data["quality_improvement"] == 25.0
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_execute_with_style_guide(self, mock_analyzer_class, mock_get_client):
         """Test execute passes style_guide to analyzer."""
         mock_analyzer = MagicMock()
@@ -293,7 +307,38 @@ class TestContentOptimizationSkillExecute:
         )
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
+    def test_execute_full_deck_tone(self, mock_analyzer_class, mock_get_client):
+        """Test full_deck_tone enables chunked tone analysis."""
+        mock_analyzer = MagicMock()
+        mock_analyzer.analyze_presentation.return_value = {
+            "overall_score": 75.0,
+            "issues": [],
+        }
+        mock_analyzer_class.return_value = mock_analyzer
+
+        skill = ContentOptimizationSkill()
+        input_data = SkillInput(
+            data={
+                "slides": [{"title": "Test"}],
+                "output_file": os.path.join(self.temp_dir, "optimized.md"),
+                "full_deck_tone": True,
+            },
+            context={},
+            config={},
+        )
+
+        skill.execute(input_data)
+
+        for call in mock_analyzer.analyze_presentation.call_args_list:
+            assert call.kwargs["chunked_tone"] is True
+
+    @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_execute_with_custom_optimization_goals(
         self, mock_analyzer_class, mock_get_client
     ):
@@ -328,7 +373,9 @@ class TestContentOptimizationSkillExecute:
         assert output.success is True
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_execute_metadata_contains_counts(
         self, mock_analyzer_class, mock_get_client
     ):
@@ -363,6 +410,7 @@ class TestContentOptimizationSkillExecute:
         assert "slides_optimized" in output.metadata
         assert output.metadata["slides_optimized"] == 2
         assert "improvements_count" in output.metadata
+        assert output.metadata["description_cache"]["entries"] == 0
 
 
 class TestLoadSlidesFromFile:
@@ -471,6 +519,49 @@ class TestOptimizeSlides:
         assert optimized[0] == slides[0]
         assert optimized[2] == slides[2]
 
+    def test_optimize_slides_runs_concurrently_in_order(self):
+        """Test slides are optimized concurrently with deterministic order."""
+
+        # Every call waits until all 10 are in flight, so this only
+        # completes if the slides really are optimized concurrently
+        barrier = threading.Barrier(10, timeout=5)
+
+        def slow_generate(prompt, **kwargs):
+            barrier.wait()
+            number = prompt.split("Original bullets:\n1. Point ")[1].split()[0]
+            return f"1. Better {number} a\n2. Better {number} b"
+
+        mock_client = MagicMock()
+        mock_client.generate_text.side_effect = slow_generate
+
+        skill = ContentOptimizationSkill(config={"max_concurrent_slides": 10})
+        slides = [
+            {"title": f"Slide {i}", "bullets": [f"Point {i} a", f"Point {i} b"]}
+            for i in range(1, 11)
+        ]
+        analysis = {
+            "issues": [
+                {"slide_number": i, "type": "structure", "message": "Not parallel"}
+                for i in range(10, 0, -1)
+            ]
+        }
+
+        optimized, improvements = skill._optimize_slides(
+            slides=slides,
+            analysis=analysis,
+            optimization_goals=["parallelism"],
+            style_guide={},
+            client=mock_client,
+        )
+
+        assert not barrier.broken
+        assert [s["bullets"][0] for s in optimized] == [
+            f"Better {i} a" for i in range(1, 11)
+        ]
+        assert [imp["slide_number"] for imp in improvements] == [
+            i for i in range(1, 11) for _ in range(2)
+        ]
+
 
 class TestOptimizeSlide:
     """Tests for _optimize_slide method."""
@@ -871,6 +962,65 @@ class TestOptimizeGraphicsDescription:
         assert improvement == {}
 
 
+class TestGraphicsDescriptionCache:
+    """Tests for caching improved graphics descriptions in the skill."""
+
+    def test_repeated_description_uses_cache(self):
+        """Test a recurring description is only sent to Claude once."""
+        mock_client = MagicMock()
+        mock_client.generate_text.return_value = " A centered bar chart. "
+        skill = ContentOptimizationSkill()
+
+        first = skill._optimize_graphics_description(
+            description="Chart showing sales.",
+            title="Q1",
+            issues=[],
+            client=mock_client,
+        )
+        second = skill._optimize_graphics_description(
+            description="chart showing sales", title="Q2", issues=[], client=mock_client
+        )
+
+        assert first[0] == second[0] == "A centered bar chart."
+        assert second[1]["issue_type"] == "graphics_clarity"
+        mock_client.generate_text.assert_called_once()
+        assert skill.description_cache.get_stats()["hits"] == 1
+
+    def test_failures_are_not_cached(self):
+        """Test a failed request is retried for the same description."""
+        mock_client = MagicMock()
+        mock_client.generate_text.side_effect = [Exception("API Error"), "Better."]
+        skill = ContentOptimizationSkill()
+
+        first = skill._optimize_graphics_description(
+            description="Chart.", title="", issues=[], client=mock_client
+        )
+        second = skill._optimize_graphics_description(
+            description="Chart.", title="", issues=[], client=mock_client
+        )
+
+        assert first == ("Chart.", {})
+        assert second[0] == "Better."
+
+    def test_persistent_cache_from_config(self, tmp_path):
+        """Test description_cache_path persists fix-ups across skill instances."""
+        config = {"description_cache_path": str(tmp_path / "descriptions.json")}
+        mock_client = MagicMock()
+        mock_client.generate_text.return_value = "A centered bar chart."
+
+        ContentOptimizationSkill(config=config)._optimize_graphics_description(
+            description="Chart.", title="", issues=[], client=mock_client
+        )
+        improved, _ = ContentOptimizationSkill(
+            config=config
+        )._optimize_graphics_description(
+            description="Chart.", title="", issues=[], client=mock_client
+        )
+
+        assert improved == "A centered bar chart."
+        mock_client.generate_text.assert_called_once()
+
+
 class TestSaveOptimizedPresentation:
     """Tests for _save_optimized_presentation method."""
 
@@ -1081,7 +1231,9 @@ class TestContentOptimizationSkillIntegration:
             shutil.rmtree(self.temp_dir)
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_full_optimization_flow_with_issues(
         self, mock_analyzer_class, mock_get_client
     ):
@@ -1140,7 +1292,9 @@ class TestContentOptimizationSkillIntegration:
         assert os.path.exists(output_file)
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_optimization_with_graphics_issues(
         self, mock_analyzer_class, mock_get_client
     ):
@@ -1192,7 +1346,9 @@ class TestContentOptimizationSkillIntegration:
         assert mock_client.generate_text.called
 
     @patch("plugin.skills.content.content_optimization_skill.get_claude_client")
-    @patch("plugin.skills.content.content_optimization_skill.QualityAnalyzer")
+    @patch(
+        "plugin.skills.content.content_optimization_skill.IncrementalQualityAnalyzer"
+    )
     def test_run_method_handles_validation_failure(
         self, mock_analyzer_class, mock_get_client
     ):
@@ -0,0 +1,108 @@
+"""
+Unit tests for plugin/lib/context_packer.py
+
+Tests chunking, token counting cache, relevance ranking and budgeted
+packing of research sources.
+"""
+
+from plugin.lib.context_packer import ContextPacker, estimate_tokens
+
+
+def _source(index: int, content: str) -> dict:
+    return {
+        "title": f"Source {index}",
+        "citation_id": f"cite-{index:03d}",
+        "content": content,
+    }
+
+
+FILLER = "Operators reviewed general business conditions this quarter. " * 40
+PRICING = "Menu pricing rose sharply as restaurants passed on food costs. " * 5
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens()."""
+
+    def test_four_characters_per_token(self):
+        """Test the heuristic rounds up and handles empty text."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abc") == 1
+        assert estimate_tokens("a" * 400) == 100
+
+
+class TestContextPacker:
+    """Tests for ContextPacker."""
+
+    def test_chunks_are_sentence_aligned_and_bounded(self):
+        """Test chunks end on sentence boundaries near chunk_tokens."""
+        packer = ContextPacker(chunk_tokens=50)
+
+        chunks = packer.chunk_sources([_source(1, FILLER)])
+
+        assert len(chunks) > 1
+        assert all(chunk.text.endswith(".") for chunk in chunks)
+        assert all(chunk.tokens <= 60 for chunk in chunks)
+        assert [chunk.position for chunk in chunks] == list(range(len(chunks)))
+
+    def test_pack_respects_budget(self):
+        """Test packed tokens never exceed the budget."""
+        packer = ContextPacker(token_budget=300, chunk_tokens=50)
+        sources = [_source(i, FILLER) for i in range(10)]
+
+        context = packer.pack(sources, query="business conditions")
+
+        assert 0 < context.total_tokens <= 300
+        assert context.dropped_chunks > 0
+
+    def test_relevant_chunks_win_over_source_order(self):
+        """Test a relevant chunk in a late source beats leading filler."""
+        packer = ContextPacker(token_budget=120, chunk_tokens=80)
+        sources = [_source(i, FILLER) for i in range(5)]
+        sources.append(_source(5, PRICING))
+
+        context = packer.pack(sources, query="menu pricing trends")
+
+        assert context.chunks[0].source_index == 5
+        assert "Menu pricing rose" in context.render()
+        assert "cite-005" in context.render()
+
+    def test_empty_query_keeps_source_order(self):
+        """Test without a query the leading chunks of top sources are used."""
+        packer = ContextPacker(token_budget=200, chunk_tokens=80)
+        sources = [_source(i, FILLER) for i in range(5)]
+
+        context = packer.pack(sources)
+
+        assert {chunk.source_index for chunk in context.chunks} == {0}
+        assert context.render().lstrip().startswith("1. Source 0")
+
+    def test_render_groups_chunks_by_source_in_order(self):
+        """Test rendering lists each source once, in source order."""
+        packer = ContextPacker(token_budget=2000, chunk_tokens=40)
+        sources = [_source(1, PRICING), _source(2, FILLER[:300])]
+
+        rendered = packer.pack(sources, query="pricing").render()
+
+        assert rendered.count("Citation: cite-001") == 1
+        assert rendered.index("cite-001") < rendered.index("cite-002")
+
+    def test_token_counts_are_cached(self):
+        """Test repeated packing reuses cached chunk counts."""
+        calls = []
+
+        def counter(text):
+            calls.append(text)
+            return len(text.split())
+
+        packer = ContextPacker(chunk_tokens=50, token_counter=counter)
+        sources = [_source(i, FILLER) for i in range(3)]
+
+        packer.pack(sources, query="business")
+        first_calls = len(calls)
+        packer.pack(sources, query="quarter")
+
+        assert first_calls > 0
+        # Identical chunks across sources are counted once as well
+        assert first_calls < len(packer.chunk_sources(sources))
+        assert len(calls) == first_calls
+        assert packer.get_stats()["hits"] > 0
@@ -0,0 +1,117 @@
+"""
+Unit tests for plugin/lib/description_cache.py
+
+Tests description normalization, cache keys and the DescriptionCache used to
+reuse improved graphics descriptions across slides and runs.
+"""
+
+import json
+
+from plugin.lib.description_cache import (
+    DescriptionCache,
+    normalize_description,
+    style_fingerprint,
+)
+
+
+class TestNormalizeDescription:
+    """Tests for normalize_description()."""
+
+    def test_case_punctuation_and_whitespace_ignored(self):
+        """Test near-identical spellings normalize to the same text."""
+        assert normalize_description("A simple  image.") == normalize_description(
+            "a SIMPLE image"
+        )
+
+    def test_hex_colors_and_hyphens_kept(self):
+        """Test hex colors and hyphenated terms survive normalization."""
+        assert (
+            normalize_description("Split-screen, #DD0033 accents!")
+            == "split-screen #dd0033 accents"
+        )
+
+
+class TestStyleFingerprint:
+    """Tests for style_fingerprint()."""
+
+    def test_key_order_does_not_matter(self):
+        """Test equal configs fingerprint equally regardless of key order."""
+        assert style_fingerprint({"a": 1, "b": [2]}) == style_fingerprint(
+            {"b": [2], "a": 1}
+        )
+
+    def test_none_and_empty_are_equivalent(self):
+        """Test no style config and an empty one share a fingerprint."""
+        assert style_fingerprint(None) == style_fingerprint({})
+        assert style_fingerprint({"brand_colors": ["#DD0033"]}) != style_fingerprint(
+            None
+        )
+
+
+class TestDescriptionCache:
+    """Tests for DescriptionCache."""
+
+    def test_make_key_scopes_by_prompt_and_style(self):
+        """Test keys differ by scope and style but not by spelling."""
+        key = DescriptionCache.make_key("A chart.", "validator", {"c": 1})
+
+        assert key == DescriptionCache.make_key("a chart", "validator", {"c": 1})
+        assert key != DescriptionCache.make_key("A chart.", "skill", {"c": 1})
+        assert key != DescriptionCache.make_key("A chart.", "validator", {"c": 2})
+
+    def test_get_and_set_track_hits_and_misses(self):
+        """Test lookups update hit/miss statistics."""
+        cache = DescriptionCache()
+
+        assert cache.get("key") is None
+        cache.set("key", "Improved.")
+        assert cache.get("key") == "Improved."
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used entry is evicted over max_entries."""
+        cache = DescriptionCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries written to cache_path are loaded by a new cache."""
+        path = tmp_path / "nested" / "description_cache.json"
+        DescriptionCache(cache_path=path).set("key", "Improved.")
+
+        assert DescriptionCache(cache_path=path).get("key") == "Improved."
+
+    def test_unreadable_cache_file_ignored(self, tmp_path, caplog):
+        """Test a corrupt cache file starts an empty cache."""
+        path = tmp_path / "description_cache.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        cache = DescriptionCache(cache_path=path)
+
+        assert len(cache) == 0
+        assert "Ignoring unreadable description cache" in caplog.text
+
+    def test_clear_resets_entries_and_stats(self, tmp_path):
+        """Test clear empties the cache and its persisted file."""
+        path = tmp_path / "description_cache.json"
+        cache = DescriptionCache(cache_path=path)
+        cache.set("key", "Improved.")
+        cache.get("key")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get_stats()["hits"] == 0
+        assert json.loads(path.read_text(encoding="utf-8")) == {"entries": []}
@@ -4,14 +4,20 @@ Unit tests for plugin/lib/graphics_validator.py
 Tests the GraphicsValidator class and validation functions.
 """
 
+import random
+import time
 from unittest.mock import patch
 
+import pytest
 from anthropic import APIError
 
+from plugin.lib.description_cache import DescriptionCache
 from plugin.lib.graphics_validator import (
     GraphicsValidator,
+    KeywordScanner,
     ValidationResult,
     get_graphics_validator,
+    get_keyword_scanner,
     validate_graphics_batch,
 )
 
@@ -939,6 +945,206 @@ class TestValidateGraphicsBatchEdgeCases:
             assert result["total_slides"] == 1
 
 
+class TestValidateGraphicsBatchConcurrency:
+    """Tests for concurrent improvement requests in validate_graphics_batch."""
+
+    @staticmethod
+    def _slow_improvement(prompt: str, **kwargs) -> str:
+        """Fake Claude call: slow, and echoes the slide title."""
+        time.sleep(0.2)
+        title = prompt.split("Slide Title: ", 1)[1].split("\n", 1)[0]
+        return f" Improved {title} "
+
+    def test_improvements_requested_concurrently_in_slide_order(self):
+        """Test failing slides are improved in parallel, results in order."""
+        slides = [
+            {"title": f"Bad {number}", "graphics_description": f"Simple {number}."}
+            for number in range(1, 6)
+        ]
+        slides.insert(
+            2,
+            {
+                "title": "Good",
+                "graphics_description": (
+                    "A professional diagram with centered composition. "
+                    "Blue arrows indicate flow direction clearly. "
+                    "Red shapes highlight key components with depth."
+                ),
+            },
+        )
+
+        with patch("plugin.lib.graphics_validator.get_claude_client") as mock_client:
+            mock_client.return_value.generate_text.side_effect = self._slow_improvement
+            start = time.perf_counter()
+            result = validate_graphics_batch(slides, max_concurrent=5)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6  # Serial requests would take 1.0s
+        assert mock_client.return_value.generate_text.call_count == 5
+        assert [r["slide_number"] for r in result["results"]] == [1, 2, 3, 4, 5, 6]
+        assert [r["validation"].description_improved for r in result["results"]] == [
+            "Improved Bad 1",
+            "Improved Bad 2",
+            None,
+            "Improved Bad 3",
+            "Improved Bad 4",
+            "Improved Bad 5",
+        ]
+
+    def test_improvement_prompt_lists_rule_issues(self):
+        """Test each improvement request carries that slide's issues."""
+        slides = [{"title": "Bad", "graphics_description": "Concept text."}]
+
+        with patch("plugin.lib.graphics_validator.get_claude_client") as mock_client:
+            mock_client.return_value.generate_text.return_value = "Better."
+            result = validate_graphics_batch(slides)
+
+        prompt = mock_client.return_value.generate_text.call_args.kwargs["prompt"]
+        for issue in result["results"][0]["validation"].issues:
+            assert issue["message"] in prompt
+        assert result["results"][0]["validation"].description_improved == "Better."
+
+    def test_failed_improvement_does_not_affect_other_slides(self):
+        """Test an API failure for one slide leaves the others improved."""
+
+        def flaky(prompt: str, **kwargs) -> str:
+            if "Slide Title: Bad 2" in prompt:
+                raise APIError(message="API failure", request=None, body=None)
+            return "Better."
+
+        slides = [
+            {"title": f"Bad {number}", "graphics_description": f"Simple {number}."}
+            for number in range(1, 4)
+        ]
+
+        with patch("plugin.lib.graphics_validator.get_claude_client") as mock_client:
+            mock_client.return_value.generate_text.side_effect = flaky
+            result = validate_graphics_batch(slides, max_concurrent=2)
+
+        assert [r["validation"].description_improved for r in result["results"]] == [
+            "Better.",
+            None,
+            "Better.",
+        ]
+
+    def test_passing_slides_make_no_api_calls(self):
+        """Test no improvement requests are made when every slide passes."""
+        slides = [
+            {
+                "title": "Good",
+                "graphics_description": (
+                    "A professional diagram with centered composition. "
+                    "Blue arrows indicate flow direction clearly. "
+                    "Red shapes highlight key components with depth."
+                ),
+            }
+        ]
+
+        with patch("plugin.lib.graphics_validator.get_claude_client") as mock_client:
+            result = validate_graphics_batch(slides)
+
+        assert result["passed"] == 1
+        mock_client.return_value.generate_text.assert_not_called()
+
+
+class TestGraphicsValidatorDescriptionCache:
+    """Tests for caching improved descriptions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = patch(
+            "plugin.lib.graphics_validator.get_claude_client"
+        ).start()
+        self.generate_text = self.mock_client.return_value.generate_text
+        self.generate_text.return_value = " A centered diagram. "
+
+    def teardown_method(self):
+        """Tear down test fixtures."""
+        patch.stopall()
+
+    def test_near_identical_description_served_from_cache(self):
+        """Test a re-spelled description reuses the earlier improvement."""
+        validator = GraphicsValidator()
+        issues = [{"type": "length", "message": "Too short"}]
+
+        first = validator._generate_improved_description(
+            "A simple image.", issues, {"title": "One"}, None
+        )
+        second = validator._generate_improved_description(
+            "a simple   IMAGE", issues, {"title": "Two"}, None
+        )
+
+        assert first == second == "A centered diagram."
+        self.generate_text.assert_called_once()
+        assert validator.cache.get_stats()["hits"] == 1
+
+    def test_style_config_is_part_of_key(self):
+        """Test a different style config requests a new improvement."""
+        validator = GraphicsValidator()
+        issues = [{"type": "length", "message": "Too short"}]
+
+        validator._generate_improved_description(
+            "A simple image.", issues, {}, {"brand_colors": ["#DD0033"]}
+        )
+        validator._generate_improved_description(
+            "A simple image.", issues, {}, {"brand_colors": ["#004F71"]}
+        )
+
+        assert self.generate_text.call_count == 2
+
+    def test_failures_are_not_cached(self):
+        """Test a failed request is retried on the next lookup."""
+        self.generate_text.side_effect = [
+            APIError(message="API failure", request=None, body=None),
+            "Better.",
+        ]
+        validator = GraphicsValidator()
+        issues = [{"type": "length", "message": "Too short"}]
+
+        assert (
+            validator._generate_improved_description("Simple.", issues, {}, None)
+            is None
+        )
+        assert (
+            validator._generate_improved_description("Simple.", issues, {}, None)
+            == "Better."
+        )
+
+    def test_batch_identical_descriptions_share_one_request(self):
+        """Test repeated failing descriptions in a batch are improved once."""
+        slides = [
+            {"title": f"Slide {number}", "graphics_description": "A simple image."}
+            for number in range(1, 4)
+        ]
+
+        result = validate_graphics_batch(slides)
+
+        self.generate_text.assert_called_once()
+        assert [r["validation"].description_improved for r in result["results"]] == [
+            "A centered diagram."
+        ] * 3
+
+    def test_persistent_cache_reused_across_batches(self, tmp_path):
+        """Test a re-run with a persisted cache makes no API calls."""
+        path = tmp_path / "description_cache.json"
+        slides = [
+            {"title": "Slide 1", "graphics_description": "A simple image."},
+            {"title": "Slide 2", "graphics_description": "Some concept."},
+        ]
+
+        validate_graphics_batch(slides, cache=DescriptionCache(cache_path=path))
+        self.generate_text.reset_mock()
+        rerun_cache = DescriptionCache(cache_path=path)
+        result = validate_graphics_batch(slides, cache=rerun_cache)
+
+        self.generate_text.assert_not_called()
+        assert rerun_cache.get_stats()["hits"] == 2
+        assert all(
+            r["validation"].description_improved == "A centered diagram."
+            for r in result["results"]
+        )
+
+
 class TestGraphicsValidatorCheckLengthEdgeCases:
     """Edge case tests for _check_length method."""
 
@@ -1092,3 +1298,107 @@ class TestGraphicsValidatorMultipleIssues:
         # Should have a suggestion for each unique issue type
         issue_types = {issue["type"] for issue in result.issues}
         assert len(result.suggestions) == len(issue_types)
+
+
+class TestKeywordScanner:
+    """Tests for the precompiled single-pass keyword scanner."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch("plugin.lib.graphics_validator.get_claude_client"):
+            self.validator = GraphicsValidator()
+
+    def test_scan_counts_sentences_and_keywords(self):
+        """Test one scan provides sentence count and keywords for all rules."""
+        scan = self.validator.scanner.scan(
+            "A Centered diagram. Labeled arrows!  . Red shadow?"
+        )
+
+        assert scan.sentence_count == 3
+        assert scan.text == "a centered diagram. labeled arrows!  . red shadow?"
+        assert {"centered", "diagram", "label", "labeled", "arrows", "red"} <= (
+            scan.keywords
+        )
+        assert scan.matches(self.validator.LAYOUT_KEYWORDS) == ["centered"]
+
+    def test_keywords_match_as_substrings(self):
+        """Test keywords match inside longer words like the per-rule checks."""
+        scan = self.validator.scanner.scan("A rectangle with something handsome.")
+
+        assert "angle" in scan.keywords
+        assert "some" in scan.keywords
+
+    def test_matches_preserve_rule_set_order(self):
+        """Test matched keywords keep the rule set's iteration order."""
+        description = "An abstract concept showing the general idea of various themes."
+        scan = self.validator.scanner.scan(description)
+
+        assert scan.matches(self.validator.VAGUE_WORDS) == [
+            word for word in self.validator.VAGUE_WORDS if word in description.lower()
+        ]
+
+    def test_scan_matches_per_keyword_search(self):
+        """Test scanned keywords equal a direct search for every keyword."""
+        rng = random.Random(0)
+        vocabulary = [*self.validator.scanner.keywords, "the", "kitchen", "flow"]
+        for _ in range(200):
+            description = " ".join(rng.choice(vocabulary) for _ in range(15))
+            expected = {
+                word
+                for word in self.validator.scanner.keywords
+                if word in description.lower()
+            }
+
+            assert self.validator.scanner.scan(description).keywords == expected
+
+    def test_scans_are_memoized(self):
+        """Test re-validating a description reuses its scan."""
+        scanner = KeywordScanner(frozenset({"diagram"}))
+
+        first = scanner.scan("A diagram.")
+        second = scanner.scan("A diagram.")
+
+        assert first is second
+        assert scanner.scan.cache_info().hits == 1
+
+    def test_scanner_shared_between_validators(self):
+        """Test validators with the same keyword sets share one scanner."""
+        with patch("plugin.lib.graphics_validator.get_claude_client"):
+            other = GraphicsValidator()
+
+        assert other.scanner is self.validator.scanner
+        assert get_keyword_scanner(frozenset({"a"})) is get_keyword_scanner(
+            frozenset({"a"})
+        )
+
+
+@pytest.mark.performance
+class TestGraphicsValidatorPerformance:
+    """Benchmark tests for large batches."""
+
+    def test_batch_revalidation_is_fast(self):
+        """Test thousands of descriptions validate quickly, twice."""
+        rng = random.Random(0)
+        with patch("plugin.lib.graphics_validator.get_claude_client"):
+            vocabulary = [*GraphicsValidator().scanner.keywords, "kitchen", "team"]
+        slides = [
+            {
+                "graphics_description": ". ".join(
+                    " ".join(rng.choice(vocabulary) for _ in range(12))
+                    for _ in range(3)
+                )
+            }
+            for _ in range(2000)
+        ]
+
+        start = time.perf_counter()
+        with patch("plugin.lib.graphics_validator.get_claude_client"):
+            first = validate_graphics_batch(slides)
+            second = validate_graphics_batch(slides)
+        elapsed = time.perf_counter() - start
+
+        assert first["total_slides"] == 2000
+        assert [r["validation"].score for r in first["results"]] == [
+            r["validation"].score for r in second["results"]
+        ]
+        assert elapsed < 5.0
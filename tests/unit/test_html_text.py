@@ -0,0 +1,117 @@
+"""
+Unit tests for plugin/lib/html_text.py
+
+Tests the streaming HTML-to-text extractor.
+"""
+
+from plugin.lib.html_text import HTMLTextExtractor, iter_html_text, parse_html
+
+
+PAGE = """<!DOCTYPE html>
+<HTML>
+<head>
+  <title>Caf&eacute; Trends &amp; Data</title>
+  <meta name="Author" content="Jane  Roe">
+  <meta property="article:published_time" content="2025-03-01">
+  <meta name="description" content="Menu &quot;pricing&quot; report">
+  <style>body { color: red; }</style>
+  <script>if (a < b && c > d) { document.write("<p>hidden</p>"); }</script>
+</head>
+<body>
+  <!-- <p>commented out</p> -->
+  <noscript><p>Enable JavaScript</p></noscript>
+  <svg viewBox="0 0 10 10"><text>chart label</text></svg>
+  <svg class="icon"/>
+  <h1>Menu&nbsp;Pricing</h1>
+  <p>Prices rose 5&#37; in Q1 &#x2014; driven by <b>labor</b> costs.</p>
+  <p>Operators said &ldquo;demand is strong&rdquo;.</p>
+</body>
+</HTML>
+"""
+
+EXPECTED_TEXT = (
+    "Menu Pricing Prices rose 5% in Q1 — driven by labor costs. "
+    "Operators said “demand is strong”."
+)
+
+
+class TestHTMLTextExtractor:
+    """Tests for HTMLTextExtractor."""
+
+    def test_extracts_normalized_text(self):
+        """Test skipped subtrees, entity decoding and whitespace collapsing."""
+        parser = parse_html(PAGE)
+
+        assert parser.text == EXPECTED_TEXT
+
+    def test_title_meta_and_author(self):
+        """Test head fields are captured in the same pass."""
+        parser = parse_html(PAGE)
+
+        assert parser.title == "Café Trends & Data"
+        assert parser.author == "Jane Roe"
+        assert parser.meta["article:published_time"] == "2025-03-01"
+        assert parser.meta["description"] == 'Menu "pricing" report'
+
+    def test_result_is_independent_of_chunking(self):
+        """Test tags and entities split across chunks parse identically."""
+        for size in (1, 3, 7, 64):
+            parser = HTMLTextExtractor()
+            for start in range(0, len(PAGE), size):
+                parser.feed(PAGE[start : start + size])
+            parser.close()
+
+            assert parser.text == EXPECTED_TEXT, size
+            assert parser.title == "Café Trends & Data"
+            assert parser.author == "Jane Roe"
+
+    def test_inline_text_across_chunks_is_not_split(self):
+        """Test a word split between chunks is rejoined."""
+        parser = HTMLTextExtractor()
+        parser.feed("<p>restau")
+        parser.feed("rant trends</p>")
+        parser.close()
+
+        assert parser.text == "restaurant trends"
+
+    def test_stray_angle_bracket_is_text(self):
+        """Test a '<' that does not start a tag is kept."""
+        assert parse_html("<p>a < b and c > d</p>").text == "a < b and c > d"
+
+    def test_max_chars_truncates(self):
+        """Test body text stops at max_chars."""
+        parser = parse_html("<p>" + "word " * 1000 + "</p>", max_chars=50)
+
+        assert len(parser.text) == 50
+        assert parser.truncated
+
+    def test_missing_title(self):
+        """Test pages without a title report None."""
+        assert parse_html("<p>Body</p>").title is None
+
+
+class TestIterHTMLText:
+    """Tests for iter_html_text()."""
+
+    def test_yields_text_incrementally(self):
+        """Test fragments arrive per chunk and join to the full text."""
+        chunks = [PAGE[i : i + 40] for i in range(0, len(PAGE), 40)]
+
+        fragments = list(iter_html_text(chunks))
+
+        assert len(fragments) > 1
+        assert "".join(fragments) == EXPECTED_TEXT
+
+    def test_stops_consuming_after_max_chars(self):
+        """Test the chunk iterator is not drained once the cap is reached."""
+        consumed = []
+
+        def chunks():
+            for i in range(100):
+                consumed.append(i)
+                yield f"<p>chunk number {i}</p>"
+
+        text = "".join(iter_html_text(chunks(), max_chars=30))
+
+        assert len(text) == 30
+        assert len(consumed) < 10
@@ -0,0 +1,268 @@
+"""
+Unit tests for plugin/lib/http_cache.py
+
+Tests the HTTP response cache on its own and through
+ContentExtractor.extract_many() against a local HTTP server.
+"""
+
+import gzip
+import itertools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from plugin.lib.content_extractor import ContentExtractor
+from plugin.lib.http_cache import HTTPCache, parse_max_age
+
+
+def _page(title):
+    return (
+        f"<html><head><title>{title}</title></head>"
+        f"<body><p>Body of {title}</p></body></html>"
+    ).encode()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """HTTP cache in a temporary directory."""
+    backend = HTTPCache(tmp_path / "http.db")
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def origin():
+    """
+    Local HTTP server with validators.
+
+    Pages are configured through the returned dict (path -> settings);
+    every request is logged with its conditional headers and status.
+    """
+    pages = {}
+    log = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            page = pages.get(self.path)
+            if page is None:
+                status = 404
+            elif (
+                page.get("etag") and self.headers.get("If-None-Match") == page["etag"]
+            ) or (
+                page.get("last_modified")
+                and self.headers.get("If-Modified-Since") == page["last_modified"]
+            ):
+                status = 304
+            else:
+                status = page.get("status", 200)
+
+            with lock:
+                log.append(
+                    {
+                        "path": self.path,
+                        "status": status,
+                        "if_none_match": self.headers.get("If-None-Match"),
+                        "if_modified_since": self.headers.get("If-Modified-Since"),
+                        "accept_encoding": self.headers.get("Accept-Encoding", ""),
+                    }
+                )
+
+            if status >= 400:
+                self.send_error(status)
+                return
+
+            self.send_response(status)
+            if page.get("etag"):
+                self.send_header("ETag", page["etag"])
+            if page.get("last_modified"):
+                self.send_header("Last-Modified", page["last_modified"])
+            if page.get("cache_control"):
+                self.send_header("Cache-Control", page["cache_control"])
+            if status == 304:
+                self.end_headers()
+                return
+
+            body = page["body"]
+            if page.get("gzip"):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", pages, log
+    server.shutdown()
+    server.server_close()
+
+
+class TestParseMaxAge:
+    """Tests for parse_max_age()."""
+
+    def test_directives(self):
+        """Test max-age extraction and no-cache handling."""
+        assert parse_max_age("public, max-age=600") == 600.0
+        assert parse_max_age("no-cache") == 0.0
+        assert parse_max_age("private") is None
+        assert parse_max_age(None) is None
+
+
+class TestHTTPCache:
+    """Tests for HTTPCache storage."""
+
+    def test_round_trip_with_validators(self, cache):
+        """Test bodies and validators are returned intact."""
+        cache.store(
+            "https://a.com/",
+            _page("A"),
+            {"content-type": "text/html", "etag": '"v1"', "last-modified": "Mon"},
+        )
+
+        cached = cache.lookup("https://a.com/")
+
+        assert cached.body == _page("A")
+        assert cached.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon",
+        }
+        assert not cached.is_fresh
+        assert cache.lookup("https://b.com/") is None
+
+    def test_identical_bodies_are_stored_once(self, cache):
+        """Test URLs serving the same content share one body."""
+        headers = {"content-type": "text/html"}
+        cache.store("https://a.com/?utm=1", _page("A"), headers)
+        cache.store("https://a.com/?utm=2", _page("A"), headers)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bodies"] == 1
+
+    def test_no_store_is_not_cached(self, cache):
+        """Test Cache-Control: no-store responses are skipped."""
+        cache.store("https://a.com/", _page("A"), {"cache-control": "no-store"})
+
+        assert cache.lookup("https://a.com/") is None
+
+    def test_max_bytes_evicts_least_recently_used(self, tmp_path):
+        """Test the total body size stays under the cap."""
+        cache = HTTPCache(tmp_path / "http.db", max_bytes=2500)
+        with patch(
+            "plugin.lib.http_cache.time.time",
+            side_effect=itertools.count(time.time()),
+        ):
+            for name in "abc":
+                # Incompressible bodies so each one is ~1KB on disk
+                cache.store(f"https://{name}.com/", os.urandom(1000), {})
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 2500
+        assert stats["bodies"] == 2
+        assert cache.lookup("https://a.com/") is None
+        assert cache.lookup("https://c.com/") is not None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the database."""
+        path = tmp_path / "nested" / "http.db"
+        first = HTTPCache(path)
+        first.store("https://a.com/", _page("A"), {"etag": '"v1"'})
+        first.close()
+
+        second = HTTPCache(path)
+        assert second.lookup("https://a.com/").etag == '"v1"'
+        second.close()
+
+
+class TestContentExtractorHTTPCache:
+    """Tests for ContentExtractor fetching through an HTTPCache."""
+
+    def test_unchanged_page_is_revalidated_with_etag(self, origin, cache):
+        """Test a repeat fetch sends If-None-Match and reuses the body on 304."""
+        base, pages, log = origin
+        pages["/a"] = {"body": _page("Alpha"), "etag": '"v1"'}
+        extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+
+        first = extractor.extract_many([f"{base}/a"])
+        second = extractor.extract_many([f"{base}/a"])
+
+        assert first[0].title == second[0].title == "Alpha"
+        assert "Body of Alpha" in second[0].content
+        assert [entry["status"] for entry in log] == [200, 304]
+        assert log[1]["if_none_match"] == '"v1"'
+        stats = cache.get_stats()
+        assert (stats["misses"], stats["revalidated"]) == (1, 1)
+
+    def test_last_modified_revalidation(self, origin, cache):
+        """Test pages without an ETag revalidate with If-Modified-Since."""
+        base, pages, log = origin
+        stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+        pages["/a"] = {"body": _page("Alpha"), "last_modified": stamp}
+        extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+
+        extractor.extract_many([f"{base}/a"])
+        extractor.extract_many([f"{base}/a"])
+
+        assert log[1]["if_modified_since"] == stamp
+        assert log[1]["status"] == 304
+
+    def test_changed_page_is_downloaded_again(self, origin, cache):
+        """Test a new ETag replaces the cached body."""
+        base, pages, _ = origin
+        pages["/a"] = {"body": _page("Old"), "etag": '"v1"'}
+        extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+        extractor.extract_many([f"{base}/a"])
+
+        pages["/a"] = {"body": _page("New"), "etag": '"v2"'}
+        results = extractor.extract_many([f"{base}/a"])
+
+        assert results[0].title == "New"
+        assert cache.lookup(f"{base}/a").etag == '"v2"'
+
+    def test_fresh_page_skips_network(self, origin, cache):
+        """Test pages within max-age are served without a request."""
+        base, pages, log = origin
+        pages["/a"] = {"body": _page("Alpha"), "cache_control": "max-age=600"}
+        extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+
+        extractor.extract_many([f"{base}/a"])
+        results = extractor.extract_many([f"{base}/a"])
+
+        assert results[0].title == "Alpha"
+        assert len(log) == 1
+        assert cache.get_stats()["fresh_hits"] == 1
+
+    def test_gzip_response_is_decoded_and_cached(self, origin, cache):
+        """Test compressed transfer is negotiated and stored decoded."""
+        base, pages, log = origin
+        pages["/a"] = {"body": _page("Zipped"), "gzip": True}
+        extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+
+        results = extractor.extract_many([f"{base}/a"])
+
+        assert "gzip" in log[0]["accept_encoding"]
+        assert results[0].title == "Zipped"
+        assert cache.lookup(f"{base}/a").body == _page("Zipped")
+
+    def test_stale_copy_used_when_fetch_fails(self, origin, cache):
+        """Test a cached page is used if the origin starts failing."""
+        base, pages, _ = origin
+        pages["/a"] = {"body": _page("Alpha"), "etag": '"v1"'}
+        extractor = ContentExtractor(fetch_remote=True, http_cache=cache)
+        extractor.extract_many([f"{base}/a"])
+
+        pages["/a"] = {"status": 500}
+        results = extractor.extract_many([f"{base}/a"])
+
+        assert results[0].title == "Alpha"
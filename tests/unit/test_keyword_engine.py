@@ -0,0 +1,68 @@
+"""
+Unit tests for plugin/lib/keyword_engine.py
+
+Tests tokenization and corpus-level TF-IDF keyword/theme extraction.
+"""
+
+from plugin.lib.keyword_engine import extract_corpus_keywords, tokenize
+
+
+CORPUS = [
+    "Restaurant menu pricing rose. Menu pricing drives restaurant margins. "
+    "Pricing pricing pricing.",
+    "Restaurant labor costs climbed. Labor shortages and labor wages hit margins.",
+    "Restaurant delivery apps grow. Delivery fees and delivery margins matter.",
+]
+
+
+class TestTokenize:
+    """Tests for tokenize()."""
+
+    def test_drops_stop_words_and_short_words(self):
+        """Test tokens are lowercase, 3+ letters and not stop words."""
+        assert tokenize("The AI menu is on THE Table, and it's great") == [
+            "menu",
+            "table",
+            "great",
+        ]
+
+
+class TestExtractCorpusKeywords:
+    """Tests for extract_corpus_keywords()."""
+
+    def test_keywords_favor_distinctive_terms(self):
+        """Test terms shared by every source rank below distinctive ones."""
+        corpus = extract_corpus_keywords(CORPUS, top_n=2)
+
+        assert corpus.keywords[0] == ["pricing", "menu"]
+        assert corpus.keywords[1][0] == "labor"
+        assert corpus.keywords[2][0] == "delivery"
+        assert all("restaurant" not in keywords for keywords in corpus.keywords)
+
+    def test_themes_reward_terms_across_sources(self):
+        """Test a term used by many sources outranks one spammed by a single source."""
+        documents = [
+            f"{topic} menu pricing"
+            for topic in ("Franchise", "Delivery", "Catering", "Breakfast", "Coffee")
+        ]
+        documents.append("Menu pricing and loyalty. " + "loyalty points " * 50)
+
+        corpus = extract_corpus_keywords(documents, theme_count=3)
+
+        assert set(corpus.themes[:2]) == {"menu", "pricing"}
+        assert list(corpus.theme_scores) == corpus.themes
+
+    def test_keywords_align_with_documents(self):
+        """Test empty documents keep their slot."""
+        corpus = extract_corpus_keywords(["", CORPUS[0], "the and of"])
+
+        assert corpus.keywords[0] == []
+        assert corpus.keywords[1]
+        assert corpus.keywords[2] == []
+
+    def test_empty_corpus(self):
+        """Test an empty corpus yields nothing."""
+        corpus = extract_corpus_keywords([])
+
+        assert corpus.keywords == []
+        assert corpus.themes == []
@@ -0,0 +1,114 @@
+"""
+Unit tests for plugin/lib/near_duplicates.py
+
+Tests MinHash signatures, LSH candidate selection and near-duplicate
+detection.
+"""
+
+import random
+import time
+
+import pytest
+
+from plugin.lib.near_duplicates import (
+    NearDuplicateDetector,
+    _lsh_params,
+    find_near_duplicates,
+)
+
+
+def _article(seed: int, words: int = 400) -> str:
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+def _syndicated(text: str) -> str:
+    """Copy with a different header/footer, as a wire-story mirror would have."""
+    return f"Published by Regional News Network. {text} Copyright Mirror Site."
+
+
+class TestLSHParams:
+    """Tests for band/row selection."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.8, 0.95])
+    def test_candidate_threshold_is_below_target(self, threshold):
+        """Test banding compares pairs at the target similarity."""
+        bands, rows = _lsh_params(threshold, 128)
+
+        assert bands * rows <= 128
+        assert (1 / bands) ** (1 / rows) <= threshold
+
+
+class TestNearDuplicateDetector:
+    """Tests for NearDuplicateDetector."""
+
+    def test_signature_similarity_tracks_overlap(self):
+        """Test identical texts agree fully and unrelated texts barely."""
+        detector = NearDuplicateDetector()
+        text = _article(1)
+
+        same = detector.similarity(detector.signature(text), detector.signature(text))
+        other = detector.similarity(
+            detector.signature(text), detector.signature(_article(2))
+        )
+
+        assert same == 1.0
+        assert other < 0.1
+
+    def test_short_text_has_no_signature(self):
+        """Test texts shorter than one shingle are never matched."""
+        detector = NearDuplicateDetector()
+
+        assert detector.signature("too short") is None
+        assert detector.add("a", "too short") is None
+        assert detector.add("b", "too short") is None
+
+    def test_syndicated_copy_is_reported_against_first(self):
+        """Test the earlier (higher-ranked) text is kept as the original."""
+        detector = NearDuplicateDetector(threshold=0.8)
+        original = _article(1)
+
+        assert detector.add("https://origin.com/a", original) is None
+        assert detector.add("https://other.com/b", _article(2)) is None
+        assert (
+            detector.add("https://mirror.com/a", _syndicated(original))
+            == "https://origin.com/a"
+        )
+        assert detector.get_stats()["indexed"] == 2
+
+    def test_threshold_controls_matches(self):
+        """Test a lightly edited copy matches at 0.5 but not at 0.95."""
+        words = _article(1).split()
+        edited = list(words)
+        for i in range(0, len(edited), 25):
+            edited[i] = "edited"
+        edited_text = " ".join(edited)
+
+        loose = find_near_duplicates([" ".join(words), edited_text], threshold=0.5)
+        strict = find_near_duplicates([" ".join(words), edited_text], threshold=0.95)
+
+        assert loose == {1: 0}
+        assert strict == {}
+
+    def test_invalid_threshold(self):
+        """Test thresholds outside (0, 1] are rejected."""
+        with pytest.raises(ValueError, match="threshold"):
+            NearDuplicateDetector(threshold=0)
+
+
+@pytest.mark.performance
+class TestNearDuplicatePerformance:
+    """Benchmark detection over a larger corpus."""
+
+    def test_corpus_scales_near_linearly(self):
+        """Test 200 distinct sources plus copies are processed quickly."""
+        texts = [_article(seed, words=300) for seed in range(200)]
+        texts += [_syndicated(text) for text in texts[:20]]
+
+        start = time.perf_counter()
+        duplicates = find_near_duplicates(texts)
+        elapsed = time.perf_counter() - start
+
+        assert duplicates == {200 + i: i for i in range(20)}
+        assert elapsed < 10.0
@@ -0,0 +1,119 @@
+"""
+Unit tests for passage_index module.
+
+Tests hashed bag-of-words passage retrieval.
+"""
+
+from plugin.lib.passage_index import Passage, PassageIndex
+
+
+def _source(title: str, content: str) -> dict:
+    """Build a research source."""
+    return {"title": title, "content": content}
+
+
+SOURCES = [
+    _source(
+        "Pricing",
+        "Menu pricing strategy balances food cost and perceived value. "
+        "Anchor prices make mid-range dishes look reasonable.",
+    ),
+    _source(
+        "Staffing",
+        "Kitchen staffing levels follow predicted covers. "
+        "Cross-training lets servers help in the kitchen during rushes.",
+    ),
+    _source(
+        "Marketing",
+        "Loyalty programs reward repeat guests. "
+        "Social media posts drive weekday traffic.",
+    ),
+]
+
+
+class TestPassageIndex:
+    """Tests for PassageIndex."""
+
+    def test_search_ranks_relevant_passage_first(self):
+        """Test the passage sharing the query's terms ranks first."""
+        index = PassageIndex(SOURCES)
+
+        results = index.search("kitchen staffing for rushes", k=2)
+
+        assert results[0].source_index == 1
+        assert results[0].score > 0
+        assert all(result.source_index != 0 for result in results)
+
+    def test_search_returns_only_matching_passages(self):
+        """Test unrelated passages are not returned."""
+        index = PassageIndex(SOURCES)
+
+        results = index.search("loyalty guests", k=10)
+
+        assert [result.source_index for result in results] == [2]
+
+    def test_search_respects_k_and_order(self):
+        """Test results are capped at k and sorted by score."""
+        long_source = _source(
+            "Long", " ".join(f"Pricing note number {i} here." for i in range(200))
+        )
+        index = PassageIndex([long_source], passage_chars=100)
+
+        results = index.search("pricing", k=3)
+
+        assert len(results) == 3
+        assert [r.score for r in results] == sorted(
+            (r.score for r in results), reverse=True
+        )
+
+    def test_search_filters_sources(self):
+        """Test source_indices restricts candidates."""
+        index = PassageIndex(SOURCES)
+
+        results = index.search("kitchen pricing", k=5, source_indices={0})
+
+        assert results
+        assert {result.source_index for result in results} == {0}
+
+    def test_search_unknown_terms_returns_empty(self):
+        """Test a query with no indexed terms matches nothing."""
+        index = PassageIndex(SOURCES)
+
+        assert index.search("zzzz qqqq") == []
+        assert index.search("") == []
+
+    def test_search_does_not_mutate_index(self):
+        """Test returned passages are copies carrying the score."""
+        index = PassageIndex(SOURCES)
+
+        index.search("menu pricing")
+
+        assert all(passage.score == 0.0 for passage in index.passages)
+
+    def test_leading_returns_opening_passages(self):
+        """Test leading() returns the first passage of each source."""
+        index = PassageIndex(SOURCES, passage_chars=60)
+
+        leading = index.leading(k=2)
+
+        assert [(p.source_index, p.position) for p in leading] == [(0, 0), (1, 0)]
+        assert index.leading(k=5, source_indices={2})[0].source_index == 2
+
+    def test_snippet_fallback_and_empty_sources(self):
+        """Test snippets are indexed and empty sources are skipped."""
+        index = PassageIndex(
+            [{"title": "Empty"}, {"title": "Snippet", "snippet": "Brunch menus grow."}]
+        )
+
+        assert index.get_stats()["passages"] == 1
+        assert index.search("brunch")[0] == Passage(
+            1, 0, "Brunch menus grow.", index.search("brunch")[0].score
+        )
+
+    def test_get_stats(self):
+        """Test get_stats reports index size."""
+        stats = PassageIndex(SOURCES).get_stats()
+
+        assert stats["sources"] == 3
+        assert stats["passages"] == 3
+        assert stats["buckets"] > 0
@@ -4,11 +4,25 @@ Unit tests for plugin/lib/quality_analyzer.py
 Tests the QualityAnalyzer class and helper methods.
 """
 
+import asyncio
+import json
+import re
+import time
+from itertools import pairwise
 from unittest.mock import patch
 
+import httpx
+import pytest
 from anthropic import APIError
 
-from plugin.lib.quality_analyzer import QualityAnalyzer, get_quality_analyzer
+from plugin.lib.quality_analyzer import (
+    IncrementalQualityAnalyzer,
+    QualityAnalyzer,
+    TextCounts,
+    count_syllables,
+    get_quality_analyzer,
+    joined_sentence_count,
+)
 
 
 class TestQualityAnalyzerHelpers:
@@ -1386,3 +1400,396 @@ class TestSimilarityScore:
         score = self.analyzer._similarity_score(text1, text2)
         # Should be identical after splitting
         assert score == 1.0
+
+
+class TestIncrementalQualityAnalyzer:
+    """Tests for IncrementalQualityAnalyzer."""
+
+    TONE = {
+        "detected_tone": "professional",
+        "matches_target": True,
+        "consistency_rating": "high",
+        "tone_shifts": [],
+        "suggestions": [],
+    }
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client"):
+            self.analyzer = QualityAnalyzer()
+            self.incremental = IncrementalQualityAnalyzer()
+        for analyzer in (self.analyzer, self.incremental):
+            analyzer.client.generate_text.return_value = json.dumps(self.TONE)
+
+        self.slides = [
+            {"title": "Intro", "bullets": [], "outline": {"slide_type": "TITLE SLIDE"}},
+            {
+                "title": "Costs",
+                "bullets": ["Reduce food waste daily", "Reducing labor costs"],
+                "speaker_notes": "Costs matter. We track them weekly",
+                "citations": ["cite-001"],
+            },
+            {
+                "title": "Staff",
+                "bullets": ["Train staff on allergens", "reduce food waste daily"],
+                "speaker_notes": "and review results!",
+            },
+            {"title": "Wrap", "bullets": ["Questions?"], "speaker_notes": "Thanks"},
+        ]
+
+    def test_results_match_full_analysis(self):
+        """Test incremental results equal QualityAnalyzer results."""
+        with patch.dict("sys.modules", {"textstat": None}):
+            expected = self.analyzer.analyze_presentation(self.slides)
+            assert self.incremental.analyze_presentation(self.slides) == expected
+            # Again from cache
+            assert self.incremental.analyze_presentation(self.slides) == expected
+
+    def test_sentence_counts_across_slide_boundaries(self):
+        """Test sentences spanning joined slide texts are counted like the deck text."""
+        decks = [
+            [{"bullets": ["no terminator"]}, {"bullets": ["continues here. Next"]}],
+            [{"bullets": ["ends."]}, {"bullets": [""]}, {"bullets": ["! start"]}],
+            [{"bullets": ["a. b. c"]}, {"speaker_notes": "d"}, {"bullets": ["e."]}],
+            [{"bullets": ["   "]}, {"bullets": ["Only words"]}],
+        ]
+        with patch.dict("sys.modules", {"textstat": None}):
+            for slides in decks:
+                assert self.incremental.calculate_readability(
+                    slides
+                ) == self.analyzer.calculate_readability(slides)
+
+    def test_reanalysis_measures_only_changed_slides(self):
+        """Test editing one slide re-measures only that slide."""
+        with patch.dict("sys.modules", {"textstat": None}):
+            self.incremental.analyze_presentation(self.slides)
+            assert self.incremental.get_stats()["slide_misses"] == 4
+
+            edited = list(self.slides)
+            edited[2] = {**edited[2], "bullets": ["Train staff", "Track waste"]}
+            result = self.incremental.analyze_presentation(edited)
+
+        assert self.incremental.get_stats()["slide_misses"] == 5
+        with patch.dict("sys.modules", {"textstat": None}):
+            assert result == self.analyzer.analyze_presentation(edited)
+
+    def test_tone_check_reused_when_analyzed_text_unchanged(self):
+        """Test the Claude tone check only runs again when its input changes."""
+        with patch.dict("sys.modules", {"textstat": None}):
+            self.incremental.analyze_presentation(self.slides)
+
+            notes_edit = list(self.slides)
+            notes_edit[1] = {**notes_edit[1], "speaker_notes": "New notes."}
+            self.incremental.analyze_presentation(notes_edit)
+            assert self.incremental.client.generate_text.call_count == 1
+            assert self.incremental.get_stats()["tone_hits"] == 1
+
+            bullet_edit = list(self.slides)
+            bullet_edit[1] = {**bullet_edit[1], "bullets": ["Cut costs"]}
+            self.incremental.analyze_presentation(bullet_edit)
+            assert self.incremental.client.generate_text.call_count == 2
+
+    def test_tone_errors_are_not_cached(self):
+        """Test failed tone checks are retried on the next analysis."""
+        self.incremental.client.generate_text.side_effect = APIError(
+            message="API Error", request=None, body=None
+        )
+
+        self.incremental.check_tone_consistency(self.slides)
+        self.incremental.check_tone_consistency(self.slides)
+
+        assert self.incremental.client.generate_text.call_count == 2
+
+    def test_tone_cache_evicts_least_recently_used(self):
+        """Test the tone cache is bounded by max_tone_results."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client") as mock_get:
+            mock_get.return_value.generate_text.return_value = json.dumps(self.TONE)
+            incremental = IncrementalQualityAnalyzer(max_tone_results=2)
+        decks = [[{"title": title, "bullets": ["Point"]}] for title in "ABC"]
+
+        incremental.check_tone_consistency(decks[0])
+        incremental.check_tone_consistency(decks[1])
+        incremental.check_tone_consistency(decks[0])
+        incremental.check_tone_consistency(decks[2])
+
+        assert incremental.get_stats()["cached_tone_results"] == 2
+        assert incremental.client.generate_text.call_count == 3
+        incremental.check_tone_consistency(decks[0])
+        assert incremental.client.generate_text.call_count == 3
+        incremental.check_tone_consistency(decks[1])
+        assert incremental.client.generate_text.call_count == 4
+
+
+class TestSlideReadability:
+    """Tests for memoized syllables and per-slide readability."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client"):
+            self.analyzer = QualityAnalyzer()
+
+    def test_count_syllables_is_memoized(self):
+        """Test repeated words hit the syllable memo."""
+        count_syllables.cache_clear()
+
+        assert count_syllables("university") == 5
+        assert count_syllables("university") == 5
+
+        info = count_syllables.cache_info()
+        assert info.hits == 1
+        assert info.maxsize is not None
+
+    def test_text_counts_match_approximate_flesch(self):
+        """Test one-pass counts reproduce the approximate Flesch inputs."""
+        text = "The cat sat. It was happy!  Then it slept"
+        counts = TextCounts.from_text(text)
+
+        assert (counts.words, counts.sentences) == (9, 3)
+        assert self.analyzer._flesch_from_counts(
+            counts.words, counts.sentences, counts.syllables
+        ) == self.analyzer._approximate_flesch_score(text)
+
+    def test_joined_sentence_count_matches_joined_text(self):
+        """Test sentence counts of joined texts equal counting the join."""
+        texts = ["open start", "still going. done", "", "! next one.", "tail"]
+
+        joined = TextCounts.from_text(" ".join(texts))
+        counts = [TextCounts.from_text(text) for text in texts]
+
+        assert joined_sentence_count(counts) == joined.sentences
+
+    def test_calculate_slide_readability_reports_each_slide(self):
+        """Test per-slide scores, deck score and complexity issues."""
+        slides = [
+            {"bullets": ["The cat sat.", "The dog ran."]},
+            {"bullets": []},
+            {
+                "bullets": [
+                    "Organizational interdependencies necessitate comprehensive "
+                    "institutional reconfiguration methodologies"
+                ],
+                "speaker_notes": "Interoperability considerations predominate.",
+            },
+        ]
+
+        result = self.analyzer.calculate_slide_readability(slides)
+
+        assert [s["slide_number"] for s in result["slides"]] == [1, 3]
+        assert result["slides"][0]["flesch_reading_ease"] > 80
+        assert [issue["slide_number"] for issue in result["issues"]] == [3]
+        deck_text = " ".join(
+            [*slides[0]["bullets"], *slides[2]["bullets"], slides[2]["speaker_notes"]]
+        )
+        assert result["flesch_reading_ease"] == round(
+            self.analyzer._approximate_flesch_score(deck_text), 1
+        )
+        assert result["total_words"] == len(deck_text.split())
+
+    def test_calculate_slide_readability_empty_deck(self):
+        """Test decks without text have no scores."""
+        result = self.analyzer.calculate_slide_readability([{"bullets": []}])
+
+        assert result["flesch_reading_ease"] is None
+        assert result["slides"] == []
+
+    def test_incremental_slide_readability_uses_cache(self):
+        """Test the incremental analyzer reuses cached per-slide counts."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client"):
+            incremental = IncrementalQualityAnalyzer()
+        slides = [{"bullets": ["The cat sat."]}, {"speaker_notes": "A dog ran."}]
+
+        expected = self.analyzer.calculate_slide_readability(slides)
+        assert incremental.calculate_slide_readability(slides) == expected
+        assert incremental.calculate_slide_readability(slides) == expected
+        assert incremental.get_stats()["slide_misses"] == 2
+
+
+@pytest.mark.performance
+class TestSlideReadabilityPerformance:
+    """Benchmark tests for large decks."""
+
+    def test_500_slide_deck(self):
+        """Test per-slide readability of a 500-slide deck stays fast."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client"):
+            analyzer = QualityAnalyzer()
+        slides = [
+            {
+                "bullets": [f"Improve kitchen workflow efficiency item {i}."] * 5,
+                "speaker_notes": "Explain the operational improvement. " * 20,
+            }
+            for i in range(500)
+        ]
+
+        start = time.perf_counter()
+        result = analyzer.calculate_slide_readability(slides)
+        elapsed = time.perf_counter() - start
+
+        assert len(result["slides"]) == 500
+        assert elapsed < 2.0
+
+
+class FakeAsyncClaudeClient:
+    """Async client stub returning a tone analysis per window."""
+
+    def __init__(self, delay: float = 0.0, tones: dict[int, str] | None = None):
+        self.delay = delay
+        self.tones = tones or {}
+        self.prompts: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+        first = int(re.search(r"Slide (\d+) -", prompt).group(1))
+        if self.tones.get(first) == "fail":
+            raise httpx.ConnectError("unreachable")
+        tone = self.tones.get(first, "professional")
+        return json.dumps(
+            {
+                "detected_tone": tone,
+                "matches_target": tone == "professional",
+                "consistency_rating": "high",
+                "tone_shifts": [{"slide": first, "issue": "Too casual"}],
+                "suggestions": ["Keep it formal"],
+            }
+        )
+
+
+class TestChunkedToneAnalysis:
+    """Tests for chunked, concurrent tone analysis."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client"):
+            self.analyzer = QualityAnalyzer()
+        self.slides = [
+            {"title": f"Slide title {i}", "bullets": ["A bullet about costs " * 5]}
+            for i in range(30)
+        ]
+
+    def test_windows_cover_every_slide(self):
+        """Test token-bounded windows cover the whole deck in order."""
+        windows = self.analyzer._tone_windows(self.slides, window_tokens=200)
+
+        assert len(windows) > 1
+        assert windows[0][0] == 1
+        assert windows[-1][1] == 30
+        for (_, last, _), (first, _, _) in pairwise(windows):
+            assert first == last + 1
+        assert all("Slide 30 -" not in text for _, _, text in windows[:-1])
+
+    @pytest.mark.asyncio
+    async def test_windows_are_analyzed_concurrently(self):
+        """Test full-deck coverage costs about one call of wall time."""
+        client = FakeAsyncClaudeClient(delay=0.2)
+
+        start = time.perf_counter()
+        result = await self.analyzer.check_tone_consistency_async(
+            self.slides, client=client, window_tokens=200, max_concurrent=10
+        )
+        elapsed = time.perf_counter() - start
+
+        assert result["windows_total"] == len(client.prompts) > 1
+        assert client.max_active > 1
+        assert elapsed < 0.2 * len(client.prompts) / 2
+
+    @pytest.mark.asyncio
+    async def test_merges_per_slide_findings(self):
+        """Test per-slide issues, cross-window shifts and merged score."""
+        windows = self.analyzer._tone_windows(self.slides, window_tokens=200)
+        second = windows[1][0]
+        client = FakeAsyncClaudeClient(tones={second: "casual"})
+
+        result = await self.analyzer.check_tone_consistency_async(
+            self.slides, client=client, window_tokens=200
+        )
+
+        slide_issues = [i for i in result["issues"] if "slide_number" in i]
+        assert [i["slide_number"] for i in slide_issues] == [w[0] for w in windows]
+        assert slide_issues[0]["message"] == "Slide 1: Too casual"
+        assert any(
+            "Tone shifts from professional" in i["message"] for i in result["issues"]
+        )
+        assert result["matches_target"] is False
+        assert result["consistency"] == "medium"
+        assert result["score"] == 55
+        assert result["detected_tone"] == "professional"
+
+    @pytest.mark.asyncio
+    async def test_failed_windows_are_skipped(self):
+        """Test failing windows are dropped, and all failing falls back."""
+        windows = self.analyzer._tone_windows(self.slides, window_tokens=200)
+        client = FakeAsyncClaudeClient(tones={windows[0][0]: "fail"})
+
+        result = await self.analyzer.check_tone_consistency_async(
+            self.slides, client=client, window_tokens=200
+        )
+        assert result["windows_analyzed"] == len(windows) - 1
+
+        client = FakeAsyncClaudeClient(tones={w[0]: "fail" for w in windows})
+        result = await self.analyzer.check_tone_consistency_async(
+            self.slides, client=client, window_tokens=200
+        )
+        assert result["score"] == 75
+        assert "error" in result
+
+    @pytest.mark.asyncio
+    async def test_empty_deck_needs_no_client(self):
+        """Test decks without slides are not sent to Claude."""
+        result = await self.analyzer.check_tone_consistency_async([])
+
+        assert result["score"] == 100
+
+    @pytest.mark.asyncio
+    async def test_analyze_presentation_async_combines_metrics(self):
+        """Test async analysis uses chunked tone and local metrics."""
+        client = FakeAsyncClaudeClient()
+        with patch.dict("sys.modules", {"textstat": None}):
+            result = await self.analyzer.analyze_presentation_async(
+                self.slides, client=client
+            )
+            readability = self.analyzer.calculate_readability(self.slides)
+
+        assert result["details"]["tone"]["windows_total"] == 1
+        assert result["details"]["readability"] == readability
+        assert result["tone_consistency_score"] == 100
+
+    def test_analyze_presentation_chunked_tone(self):
+        """Test the sync entry point runs the async analysis."""
+        sentinel = {"overall_score": 90}
+
+        async def fake_async(slides, style_guide):
+            return sentinel
+
+        with patch.object(
+            self.analyzer, "analyze_presentation_async", side_effect=fake_async
+        ):
+            assert (
+                self.analyzer.analyze_presentation(self.slides, chunked_tone=True)
+                is sentinel
+            )
+
+    @pytest.mark.asyncio
+    async def test_incremental_analyzer_reuses_unchanged_windows(self):
+        """Test only edited windows are re-sent to Claude."""
+        with patch("plugin.lib.quality_analyzer.get_claude_client"):
+            incremental = IncrementalQualityAnalyzer()
+        client = FakeAsyncClaudeClient()
+
+        await incremental.check_tone_consistency_async(
+            self.slides, client=client, window_tokens=200
+        )
+        calls = len(client.prompts)
+
+        edited = list(self.slides)
+        edited[-1] = {**edited[-1], "bullets": ["Changed"]}
+        await incremental.check_tone_consistency_async(
+            edited, client=client, window_tokens=200
+        )
+
+        assert len(client.prompts) == calls + 1
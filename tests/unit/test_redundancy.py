@@ -0,0 +1,118 @@
+"""
+Unit tests for redundancy module.
+
+Tests indexed similar-text grouping against the all-pairs reference.
+"""
+
+import random
+import time
+
+import pytest
+
+from plugin.lib.redundancy import find_similar_groups, jaccard
+
+
+def _all_pairs_groups(texts: list[str], threshold: float = 0.8) -> list[list[int]]:
+    """Reference quadratic grouping (the original detect_redundancy loop)."""
+
+    def similarity(text1: str, text2: str) -> float:
+        words1 = set(text1.lower().split())
+        words2 = set(text2.lower().split())
+        if not words1 or not words2:
+            return 0.0
+        return len(words1 & words2) / len(words1 | words2)
+
+    groups = []
+    checked = set()
+    for i in range(len(texts)):
+        if i in checked:
+            continue
+        group = [i]
+        for j in range(i + 1, len(texts)):
+            if j in checked:
+                continue
+            if texts[i] == texts[j] or similarity(texts[i], texts[j]) > threshold:
+                group.append(j)
+                checked.add(j)
+        if len(group) > 1:
+            groups.append(group)
+    return groups
+
+
+class TestFindSimilarGroups:
+    """Tests for find_similar_groups."""
+
+    def test_groups_exact_and_similar_texts(self):
+        """Test identical and near-identical texts are grouped."""
+        texts = [
+            "reduce food waste with daily inventory counts now",
+            "train staff on allergen procedures",
+            "reduce food waste with daily inventory counts today now",
+            "reduce food waste with daily inventory counts now",
+        ]
+
+        assert find_similar_groups(texts) == [[0, 2, 3]]
+
+    def test_no_groups_for_distinct_texts(self):
+        """Test distinct texts produce no groups."""
+        texts = ["menu pricing", "kitchen staffing", "guest loyalty"]
+
+        assert find_similar_groups(texts) == []
+
+    def test_empty_texts_group_only_when_identical(self):
+        """Test empty texts match each other exactly but nothing else."""
+        assert find_similar_groups(["", "word", ""]) == [[0, 2]]
+        assert find_similar_groups([]) == []
+
+    def test_similarity_is_relative_to_group_leader(self):
+        """Test a text joins the first group whose leader it matches."""
+        texts = ["a b c d e f g h i j"]
+        texts.append("a b c d e f g h i k")  # 9/11 with leader
+        texts.append("a b c d e f g h k l")  # 8/12 with leader, 9/11 with text 1
+
+        assert find_similar_groups(texts) == _all_pairs_groups(texts)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_all_pairs_reference(self, seed):
+        """Test results are identical to the quadratic comparison."""
+        rng = random.Random(seed)
+        vocabulary = [f"w{i}" for i in range(30)]
+        texts = []
+        for _ in range(300):
+            if texts and rng.random() < 0.4:
+                words = rng.choice(texts).split()
+                if words and rng.random() < 0.7:
+                    words[rng.randrange(len(words))] = rng.choice(vocabulary)
+                if rng.random() < 0.5:
+                    words.append(rng.choice(vocabulary))
+                texts.append(" ".join(words))
+            else:
+                texts.append(" ".join(rng.sample(vocabulary, rng.randint(0, 12))))
+
+        assert find_similar_groups(texts) == _all_pairs_groups(texts)
+
+    def test_jaccard(self):
+        """Test jaccard on integer word sets."""
+        assert jaccard(frozenset({1, 2}), frozenset({2, 3})) == pytest.approx(1 / 3)
+        assert jaccard(frozenset(), frozenset({1})) == 0.0
+
+
+@pytest.mark.performance
+class TestFindSimilarGroupsPerformance:
+    """Benchmark tests for large inputs."""
+
+    def test_large_deck_is_near_linear(self):
+        """Test 10,000 bullets are grouped quickly."""
+        rng = random.Random(0)
+        vocabulary = [f"term{i}" for i in range(5000)]
+        texts = [
+            " ".join(["the", "and", *rng.sample(vocabulary, 8)]) for _ in range(10000)
+        ]
+        texts.extend(texts[:100])
+
+        start = time.perf_counter()
+        groups = find_similar_groups(texts)
+        elapsed = time.perf_counter() - start
+
+        assert len(groups) == 100
+        assert elapsed < 5.0
@@ -4,6 +4,10 @@ Unit tests for plugin/lib/presentation/refinement_engine.py
 Tests the RefinementEngine class and RefinementStrategy dataclass.
 """
 
+from unittest.mock import AsyncMock
+
+import pytest
+
 from plugin.lib.presentation.parser import Slide
 from plugin.lib.presentation.refinement_engine import (
     RefinementEngine,
@@ -1361,3 +1365,57 @@ class TestRefinementEngineEdgeCases:
         )
         # Improvement is 0.80 - 1.5 = -0.70, which is < 0.05
         assert should_continue is False
+
+
+class TestRefinementEngineRefineAsync:
+    """Tests for the async refine_async() loop."""
+
+    @staticmethod
+    def _result(score, passed):
+        return ValidationResult(
+            passed=passed,
+            score=score,
+            issues=[] if passed else ["Image too small"],
+            suggestions=[],
+            raw_feedback="",
+            rubric_scores={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_refine_async_stops_on_excellent_score(self):
+        """Test an excellent first result needs no regeneration."""
+        engine = RefinementEngine()
+        slide = Slide(number=1, slide_type="CONTENT", title="Test")
+        regenerate = AsyncMock()
+
+        result, attempts = await engine.refine_async(
+            slide,
+            validate=AsyncMock(return_value=self._result(0.95, True)),
+            regenerate=regenerate,
+        )
+
+        assert attempts == 1
+        assert result.score == 0.95
+        regenerate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refine_async_regenerates_until_max_attempts(self):
+        """Test failing results regenerate with a refined strategy."""
+        engine = RefinementEngine()
+        slide = Slide(number=1, slide_type="CONTENT", title="Test", graphic="Chart")
+        regenerate = AsyncMock()
+
+        result, attempts = await engine.refine_async(
+            slide,
+            validate=AsyncMock(return_value=self._result(0.5, False)),
+            regenerate=regenerate,
+            max_attempts=3,
+        )
+
+        assert attempts == 3
+        assert result.passed is False
+        assert regenerate.await_count == 2
+        strategy, attempt = regenerate.await_args_list[1].args
+        assert isinstance(strategy, RefinementStrategy)
+        assert attempt == 2
+        assert strategy.parameter_adjustments["fast_mode"] is False
@@ -4,9 +4,20 @@ Unit tests for research libraries.
 Tests CitationManager, WebSearch, and ContentExtractor.
 """
 
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
-from plugin.lib.citation_manager import Citation, CitationManager
+from plugin.lib.citation_manager import (
+    Citation,
+    CitationManager,
+    CitationUsage,
+    extract_doi,
+    normalize_url,
+    same_source_url,
+)
 from plugin.lib.content_extractor import ContentExtractor, ExtractedContent
 from plugin.lib.web_search import MockSearchEngine, SearchResult, WebSearch
 
@@ -229,6 +240,321 @@ class TestCitationManager:
         assert "cite-001" in manager.citations
 
 
+class TestCitationManagerIndexes:
+    """Tests for indexed usage lookups and cached formatting."""
+
+    def test_slide_citations_unique_in_first_use_order(self):
+        """Test per-slide citations are de-duplicated in order of first use."""
+        manager = CitationManager()
+        cid1 = manager.add_citation("Article 1", "https://example.com/1")
+        cid2 = manager.add_citation("Article 2", "https://example.com/2")
+        manager.track_usage(cid2, 1, "context")
+        manager.track_usage(cid1, 1, "context")
+        manager.track_usage(cid2, 1, "context again")
+
+        assert manager.get_slide_citations(1) == [cid2, cid1]
+        assert manager.get_slide_citations(99) == []
+
+    def test_usage_appended_directly_is_indexed(self):
+        """Test usage records added to manager.usage are still found."""
+        manager = CitationManager()
+        cid = manager.add_citation("Article", "https://example.com")
+        manager.track_usage(cid, 1, "tracked")
+        manager.usage.append(CitationUsage(cid, 2, "appended"))
+
+        assert [u.context for u in manager.get_citation_usage(cid)] == [
+            "tracked",
+            "appended",
+        ]
+        assert manager.get_slide_citations(2) == [cid]
+
+        manager.usage.clear()
+        assert manager.get_citation_usage(cid) == []
+
+    def test_formatted_citations_are_cached(self, monkeypatch):
+        """Test each citation is formatted once per style."""
+        manager = CitationManager()
+        cid = manager.add_citation("Article", "https://example.com")
+        calls = []
+        original = manager._format_apa
+        monkeypatch.setattr(
+            manager, "_format_apa", lambda c: calls.append(c) or original(c)
+        )
+
+        first = manager.format_citation(cid)
+        manager.format_citation(cid, style="apa")
+        manager.generate_bibliography()
+
+        assert len(calls) == 1
+        assert first == original(manager.citations[cid])
+        assert manager.format_citation(cid, style="MLA") != first
+
+    def test_update_citation_invalidates_cache(self):
+        """Test edits through update_citation are reflected in formatting."""
+        manager = CitationManager()
+        cid = manager.add_citation("Old Title", "https://example.com")
+        manager.format_citation(cid)
+
+        manager.update_citation(cid, title="New Title", author="Smith")
+
+        assert "*New Title*" in manager.format_citation(cid)
+        assert manager.format_citation(cid).startswith("Smith.")
+
+    def test_update_citation_rejects_unknown_fields(self):
+        """Test update_citation validates its arguments."""
+        manager = CitationManager()
+        cid = manager.add_citation("Article", "https://example.com")
+
+        with pytest.raises(ValueError, match="Unknown citation fields: doi"):
+            manager.update_citation(cid, doi="10.1000/xyz")
+        with pytest.raises(ValueError, match="not found"):
+            manager.update_citation("invalid-id", title="x")
+
+    def test_import_invalidates_cache(self):
+        """Test re-importing a citation replaces its cached formatting."""
+        manager = CitationManager()
+        cid = manager.add_citation("Old Title", "https://example.com")
+        manager.format_citation(cid)
+
+        manager.import_citations(
+            [{"id": cid, "title": "New Title", "url": "https://example.com"}]
+        )
+
+        assert "*New Title*" in manager.format_citation(cid)
+
+    def test_format_all(self):
+        """Test bulk formatting keeps the requested order and skips unknown IDs."""
+        manager = CitationManager()
+        cid1 = manager.add_citation("Article 1", "https://example.com/1")
+        cid2 = manager.add_citation("Article 2", "https://example.com/2")
+
+        formatted = manager.format_all([cid2, "missing", cid1], style="Chicago")
+
+        assert list(formatted) == [cid2, cid1]
+        assert formatted[cid1] == manager.format_citation(cid1, style="Chicago")
+        assert list(manager.format_all()) == [cid1, cid2]
+        with pytest.raises(ValueError, match="Unknown citation style"):
+            manager.format_all(style="INVALID")
+
+    @pytest.mark.performance
+    def test_large_deck_lookups_are_fast(self):
+        """Test hundreds of sources across a long deck stay fast."""
+        manager = CitationManager()
+        ids = [
+            manager.add_citation(f"Article {i}", f"https://example.com/{i}")
+            for i in range(500)
+        ]
+        for slide_number in range(1, 201):
+            for cid in ids[slide_number : slide_number + 25]:
+                manager.track_usage(cid, slide_number, "context")
+
+        start = time.perf_counter()
+        for _ in range(20):
+            manager.generate_bibliography()
+            for slide_number in range(1, 201):
+                manager.get_slide_citations(slide_number)
+        elapsed = time.perf_counter() - start
+
+        assert manager.get_slide_citations(1) == ids[1:26]
+        assert elapsed < 1.0
+
+
+class TestCitationDeduplication:
+    """Tests for merging duplicate citation sources."""
+
+    def test_normalize_url(self):
+        """Test scheme, www, trailing slash, fragments and tracking are ignored."""
+        assert normalize_url(
+            "https://www.Example.com/report/?utm_source=x&b=2&a=1#top"
+        ) == normalize_url("http://example.com/report?a=1&b=2")
+        assert normalize_url("") == ""
+
+    def test_extract_doi(self):
+        """Test DOIs are found in doi.org and publisher URLs."""
+        assert extract_doi("https://doi.org/10.1000/XYZ123") == "10.1000/xyz123"
+        assert (
+            extract_doi("https://link.example.com/article/10.1007%2Fs10551-020-1/")
+            == "10.1007/s10551-020-1"
+        )
+        assert extract_doi("https://example.com/article") is None
+
+    def test_duplicate_url_returns_existing_id(self):
+        """Test re-adding the same source returns the first citation ID."""
+        manager = CitationManager()
+        cid = manager.add_citation("Industry Report", "https://example.com/report")
+
+        again = manager.add_citation(
+            "Industry Report", "http://www.example.com/report/?utm_medium=email"
+        )
+
+        assert again == cid
+        assert len(manager.citations) == 1
+
+    def test_duplicate_doi_matches_across_hosts(self):
+        """Test the same DOI on different sites is one citation."""
+        manager = CitationManager()
+        cid = manager.add_citation("Paper", "https://doi.org/10.1000/abc")
+
+        assert manager.add_citation("Paper", "https://journal.org/10.1000/ABC") == cid
+        assert manager.find_duplicate("", "https://journal.org/10.1000/abc") == cid
+
+    def test_duplicate_title_matches_same_author_on_same_site_only(self):
+        """Test a title fingerprint merges same-author pages on one host only."""
+        manager = CitationManager()
+        cid = manager.add_citation(
+            "State of the Restaurant Industry",
+            "https://example.com/a?id=1",
+            author="NRA Research",
+        )
+
+        same_site = manager.add_citation(
+            "State of the restaurant industry!",
+            "https://example.com/amp/a",
+            author="NRA research",
+        )
+        other_author = manager.add_citation(
+            "State of the Restaurant Industry",
+            "https://example.com/b",
+            author="Someone Else",
+        )
+        other_site = manager.add_citation(
+            "State of the Restaurant Industry",
+            "https://other.com/a",
+            author="NRA Research",
+        )
+        generic = manager.add_citation("Home", "https://example.com/home", author="A")
+        generic_again = manager.add_citation(
+            "Home", "https://example.com/other", author="A"
+        )
+
+        assert same_site == cid
+        assert other_author != cid
+        assert other_site != cid
+        assert generic != generic_again
+
+    def test_shared_title_alone_never_merges(self):
+        """Test distinct same-host pages sharing a generic title stay separate."""
+        manager = CitationManager()
+        ids = [
+            manager.add_citation("Blog | Acme Corp News", "https://acme.com/blog/1"),
+            manager.add_citation("Blog | Acme Corp News", "https://acme.com/blog/2"),
+            manager.add_citation("Annual Report 2023 | Acme", "https://acme.com/ar"),
+            manager.add_citation(
+                "Annual Report 2023 | Acme", "https://acme.com/ar?page=2"
+            ),
+        ]
+
+        assert len(set(ids)) == 4
+        assert (
+            manager.find_duplicate("Blog | Acme Corp News", "https://acme.com/x")
+            is None
+        )
+
+    def test_same_source_url(self):
+        """Test URLs match by normalized URL or DOI, not by host."""
+        assert same_source_url(
+            "https://www.example.com/a/?utm_source=x", "http://example.com/a"
+        )
+        assert same_source_url(
+            "https://doi.org/10.1000/abc", "https://journal.org/10.1000/ABC"
+        )
+        assert not same_source_url(
+            "https://example.com/a", "https://example.com/a?page=2"
+        )
+
+    def test_duplicate_fills_missing_fields(self):
+        """Test merging a duplicate fills fields the citation lacked."""
+        manager = CitationManager()
+        cid = manager.add_citation("Report", "https://example.com/report")
+        manager.format_citation(cid)
+
+        manager.add_citation(
+            "Report", "https://example.com/report", author="Smith", publisher="NRA"
+        )
+        manager.add_citation("Report", "https://example.com/report", author="Jones")
+
+        assert manager.citations[cid].author == "Smith"
+        assert manager.citations[cid].publisher == "NRA"
+        assert manager.format_citation(cid).startswith("Smith.")
+
+    def test_deduplicate_disabled(self):
+        """Test deduplicate=False keeps every added source."""
+        manager = CitationManager(deduplicate=False)
+        manager.add_citation("Report", "https://example.com/report")
+        manager.add_citation("Report", "https://example.com/report")
+
+        assert len(manager.citations) == 2
+
+    def test_update_citation_reindexes(self):
+        """Test changing a citation's URL moves its dedup keys."""
+        manager = CitationManager()
+        cid = manager.add_citation("Report", "https://example.com/old")
+
+        manager.update_citation(cid, url="https://example.com/new")
+
+        assert manager.find_duplicate("Report", "https://example.com/new") == cid
+        assert manager.find_duplicate("Report", "https://example.com/old") is None
+
+    def test_import_citations_merges_duplicates(self):
+        """Test bulk import merges duplicates and maps their IDs."""
+        manager = CitationManager()
+        cid = manager.add_citation("Report", "https://example.com/report")
+
+        id_map = manager.import_citations(
+            [
+                {
+                    "id": "cite-010",
+                    "title": "Report",
+                    "url": "https://www.example.com/report/",
+                    "author": "Smith",
+                },
+                {"id": "cite-011", "title": "Study", "url": "https://example.com/s"},
+                {"id": "cite-012", "title": "Study", "url": "https://example.com/s/"},
+            ]
+        )
+
+        assert id_map == {
+            "cite-010": cid,
+            "cite-011": "cite-011",
+            "cite-012": "cite-011",
+        }
+        assert sorted(manager.citations) == [cid, "cite-011"]
+        assert manager.citations[cid].author == "Smith"
+        assert manager.add_citation("Next", "https://example.com/next") == "cite-012"
+
+    def test_reimport_same_id_replaces_citation(self):
+        """Test importing an existing ID still replaces that citation."""
+        manager = CitationManager()
+        exported = [
+            {"id": "cite-001", "title": "Old", "url": "https://example.com/old"}
+        ]
+        manager.import_citations(exported)
+
+        id_map = manager.import_citations(
+            [{"id": "cite-001", "title": "New", "url": "https://example.com/new"}]
+        )
+
+        assert id_map == {"cite-001": "cite-001"}
+        assert manager.citations["cite-001"].title == "New"
+        assert manager.find_duplicate("", "https://example.com/old") is None
+
+    @pytest.mark.performance
+    def test_merging_large_source_lists_is_fast(self):
+        """Test merging thousands of overlapping sources stays fast."""
+        manager = CitationManager()
+        start = time.perf_counter()
+        for run in range(5):
+            for i in range(2000):
+                manager.add_citation(
+                    f"Source number {i}",
+                    f"https://example.com/{i}?utm_campaign=run{run}",
+                )
+        elapsed = time.perf_counter() - start
+
+        assert len(manager.citations) == 2000
+        assert elapsed < 2.0
+
+
 class TestSearchResult:
     """Tests for SearchResult dataclass."""
 
@@ -421,6 +747,84 @@ class TestWebSearch:
         assert stats["total_cached_results"] > 0
 
 
+class SlowSearchEngine(MockSearchEngine):
+    """Mock engine with fixed latency and per-query result URLs."""
+
+    def __init__(self, delay=0.2, urls=None, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.urls = urls or {}
+
+    def search(self, query, **kwargs):
+        time.sleep(self.delay)
+        if query not in self.urls:
+            return super().search(query, **kwargs)
+        return [
+            SearchResult(f"Title {url}", url, "snippet", "Slow", 1.0 - i * 0.1)
+            for i, url in enumerate(self.urls[query])
+        ]
+
+
+class TestWebSearchConcurrent:
+    """Tests for concurrent multi-query search."""
+
+    def test_search_multiple_queries_runs_concurrently(self):
+        """Test five queries cost about one round trip, in query order."""
+        search = WebSearch(search_engine=SlowSearchEngine(delay=0.2))
+        queries = [f"angle {i}" for i in range(5)]
+
+        start = time.perf_counter()
+        results = search.search_multiple_queries(queries, max_results_per_query=3)
+        elapsed = time.perf_counter() - start
+
+        assert list(results) == queries
+        assert all(len(r) == 3 for r in results.values())
+        assert elapsed < 0.6
+
+    def test_search_acquires_rate_limiter(self):
+        """Test each uncached engine call acquires the engine's provider."""
+        from unittest.mock import MagicMock
+
+        limiter = MagicMock()
+        engine = SlowSearchEngine(delay=0)
+        engine.rate_limit_provider = "web_search"
+        search = WebSearch(search_engine=engine, rate_limiter=limiter)
+
+        search.search_multiple_queries(["a", "b", "c"])
+        search.search("a", max_results=5)  # cached
+
+        assert limiter.acquire.call_count == 3
+        limiter.acquire.assert_called_with("web_search")
+
+    def test_search_merged_dedups_and_ranks(self):
+        """Test sources found by several queries rank first, once."""
+        engine = SlowSearchEngine(
+            delay=0,
+            urls={
+                "q1": ["https://a.com/x", "https://www.shared.com/page/"],
+                "q2": ["https://shared.com/page", "https://b.com/y"],
+                "q3": ["https://c.com/z", "https://shared.com/page"],
+            },
+        )
+        search = WebSearch(search_engine=engine)
+
+        merged = search.search_merged(["q1", "q2", "q3"])
+
+        urls = [r.url for r in merged]
+        assert len(urls) == 4
+        assert search._normalize_url(urls[0]) == "shared.com/page"
+        assert merged[0].metadata["matched_queries"] == ["q1", "q2", "q3"]
+        assert merged[0].metadata["fusion_score"] > merged[1].metadata["fusion_score"]
+
+    def test_search_merged_respects_max_results(self):
+        """Test merged output is capped."""
+        search = WebSearch(search_engine=SlowSearchEngine(delay=0))
+
+        merged = search.search_merged(["q1", "q2"], max_results=3)
+
+        assert len(merged) == 3
+
+
 class TestExtractedContent:
     """Tests for ExtractedContent dataclass."""
 
@@ -489,6 +893,28 @@ class TestContentExtractor:
 
         assert content.author == "John Doe"
 
+    def test_extract_skips_scripts_and_reads_meta(self):
+        """Test scripts are dropped and byline/date come from the same pass."""
+        extractor = ContentExtractor()
+
+        html = """
+        <html>
+            <head>
+                <title>Menu &amp; Pricing</title>
+                <meta property="article:published_time" content="2025-03-01">
+                <script>var s = "<p>not content</p>";</script>
+            </head>
+            <body><p>By Jane Roe</p><p>Prices rose 5&#37;.</p></body>
+        </html>
+        """
+
+        content = extractor.extract("https://example.com", html_content=html)
+
+        assert content.title == "Menu & Pricing"
+        assert content.content == "By Jane Roe Prices rose 5%."
+        assert content.author == "Jane Roe"
+        assert content.publication_date == "2025-03-01"
+
     def test_summarize(self):
         """Test content summarization."""
         extractor = ContentExtractor()
@@ -529,3 +955,116 @@ class TestContentExtractor:
         )
         issues = extractor.validate_content(invalid_content)
         assert len(issues) > 0
+
+
+@pytest.fixture
+def local_site():
+    """
+    Local HTTP server standing in for research sources.
+
+    /slow/<ms>/<title> returns an HTML page after a delay, /missing is a 404
+    and /data.json is non-HTML. Tracks peak concurrent requests.
+    """
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                parts = self.path.strip("/").split("/")
+                if parts[0] == "slow":
+                    time.sleep(int(parts[1]) / 1000)
+                    body = (
+                        f"<html><head><title>{parts[2]}</title></head>"
+                        f"<body><p>Body of {parts[2]}</p></body></html>"
+                    ).encode()
+                    content_type = "text/html; charset=utf-8"
+                elif parts[0] == "data.json":
+                    body, content_type = b"{}", "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", state
+    server.shutdown()
+    server.server_close()
+
+
+class TestContentExtractorConcurrent:
+    """Tests for concurrent extract_many()."""
+
+    def test_extract_many_offline_preserves_order(self):
+        """Test offline mode returns mock content in URL order."""
+        extractor = ContentExtractor()
+        urls = [f"https://site{i}.example.com/a" for i in range(5)]
+
+        results = extractor.extract_many(urls)
+
+        assert [r.url for r in results] == urls
+        assert all(r.metadata.get("mock") for r in results)
+
+    def test_extract_many_fetches_concurrently_in_order(self, local_site):
+        """Test slow pages overlap and results keep input order."""
+        base, _ = local_site
+        extractor = ContentExtractor(fetch_remote=True, per_host_limit=4)
+        urls = [f"{base}/slow/{ms}/Page{ms}" for ms in (400, 100, 300, 200)]
+
+        start = time.perf_counter()
+        results = extractor.extract_many(urls)
+        elapsed = time.perf_counter() - start
+
+        assert [r.title for r in results] == [
+            "Page400",
+            "Page100",
+            "Page300",
+            "Page200",
+        ]
+        assert "Body of Page400" in results[0].content
+        # Roughly the slowest fetch, well under the 1.0s serial sum
+        assert elapsed < 0.9
+
+    def test_extract_many_respects_per_host_limit(self, local_site):
+        """Test concurrent requests to one host are capped."""
+        base, state = local_site
+        extractor = ContentExtractor(fetch_remote=True, per_host_limit=2)
+
+        extractor.extract_many([f"{base}/slow/100/P{i}" for i in range(6)])
+
+        assert state["peak"] == 2
+
+    def test_extract_many_stops_reading_at_max_page_bytes(self, local_site):
+        """Test oversized pages are cut off and flagged as truncated."""
+        base, _ = local_site
+        extractor = ContentExtractor(fetch_remote=True, max_page_bytes=10)
+
+        results = extractor.extract_many([f"{base}/slow/0/Big"])
+
+        assert results[0].metadata["truncated"] is True
+
+    def test_extract_many_falls_back_on_errors(self, local_site):
+        """Test 404, non-HTML and timed-out pages fall back to extract()."""
+        base, _ = local_site
+        extractor = ContentExtractor(fetch_remote=True, timeout=0.2)
+        urls = [f"{base}/missing", f"{base}/data.json", f"{base}/slow/1000/Late"]
+
+        results = extractor.extract_many(urls)
+
+        assert [r.url for r in results] == urls
+        assert all(r.metadata.get("mock") for r in results)
@@ -4,9 +4,13 @@ Unit tests for research skills.
 Tests ResearchSkill, InsightExtractionSkill, OutlineSkill, and ResearchAssistantSkill.
 """
 
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from plugin.base_skill import SkillInput
+from plugin.lib.content_extractor import ExtractedContent
 from plugin.skills.content.outline_skill import OutlineSkill
 from plugin.skills.research.insight_extraction_skill import InsightExtractionSkill
 from plugin.skills.research.research_assistant_skill import ResearchAssistantSkill
@@ -73,6 +77,7 @@ class TestResearchSkill:
         assert "summary" in output.data
         assert "key_themes" in output.data
         assert "citations" in output.data
+        assert all("keywords" in source for source in output.data["sources"])
 
     def test_execute_with_context(self):
         """Test research with additional context."""
@@ -134,6 +139,127 @@ class TestResearchSkill:
         # Should not raise error
         skill.cleanup()
 
+    def test_persistent_search_cache_survives_cleanup(self, tmp_path):
+        """Test search_cache_path enables a cache reused by later runs."""
+        config = {"search_cache_path": str(tmp_path / "search.db")}
+        input_data = SkillInput(data={"topic": "test", "max_sources": 3})
+
+        first = ResearchSkill(config)
+        first.execute(input_data)
+        first.cleanup()
+
+        second = ResearchSkill(config)
+        second.execute(input_data)
+
+        stats = second.web_search.get_cache_stats()
+        assert stats["backend"] == "SQLiteSearchCache"
+        assert stats["hits"] == 1
+
+    def test_near_duplicate_sources_are_dropped(self):
+        """Test syndicated copies are removed and reported."""
+        article = " ".join(f"word{i % 97} item{i % 13}" for i in range(300))
+        pages = [
+            ExtractedContent(url="https://origin.com/a", title="A", content=article),
+            ExtractedContent(
+                url="https://other.com/b", title="B", content=article[::-1]
+            ),
+            ExtractedContent(
+                url="https://mirror.com/a",
+                title="A (mirror)",
+                content="Syndicated from Origin. " + article,
+            ),
+        ]
+        skill = ResearchSkill()
+        input_data = SkillInput(data={"topic": "test", "max_sources": 3})
+
+        with patch.object(skill.content_extractor, "extract_many", return_value=pages):
+            output = skill.execute(input_data)
+
+        assert [s["url"] for s in output.data["sources"]] == [
+            "https://origin.com/a",
+            "https://other.com/b",
+        ]
+        assert output.data["duplicate_sources"] == [
+            {"url": "https://mirror.com/a", "duplicate_of": "https://origin.com/a"}
+        ]
+        assert len(output.data["citations"]) == 2
+
+    def test_duplicate_citation_sources_are_dropped(self):
+        """Test a page resolving to an existing citation is not kept twice."""
+        pages = [
+            ExtractedContent(
+                url="https://origin.com/a", title="A", content="First article text."
+            ),
+            ExtractedContent(
+                url="https://www.origin.com/a?utm_source=feed",
+                title="A",
+                content="Different rendering of the article.",
+            ),
+        ]
+        skill = ResearchSkill()
+        input_data = SkillInput(data={"topic": "test", "max_sources": 2})
+
+        with patch.object(skill.content_extractor, "extract_many", return_value=pages):
+            output = skill.execute(input_data)
+
+        assert [s["url"] for s in output.data["sources"]] == ["https://origin.com/a"]
+        assert output.data["sources_count"] == 1
+        assert output.data["duplicate_sources"] == [
+            {
+                "url": "https://www.origin.com/a?utm_source=feed",
+                "duplicate_of": "https://origin.com/a",
+            }
+        ]
+        assert len(output.data["citations"]) == 1
+
+    def test_same_title_sources_keep_own_citations(self):
+        """Test distinct same-host pages sharing a generic title are all kept."""
+        pages = [
+            ExtractedContent(
+                url=f"https://acme.com/blog/{i}",
+                title="Blog | Acme Corp News",
+                content=f"Post {i} covers topic{i} in detail.",
+            )
+            for i in range(4)
+        ]
+        skill = ResearchSkill()
+        input_data = SkillInput(data={"topic": "test", "max_sources": 4})
+
+        with patch.object(skill.content_extractor, "extract_many", return_value=pages):
+            output = skill.execute(input_data)
+
+        sources = output.data["sources"]
+        assert [s["url"] for s in sources] == [page.url for page in pages]
+        assert len({s["citation_id"] for s in sources}) == 4
+        assert output.data["duplicate_sources"] == []
+
+    def test_mock_search_keeps_every_source(self):
+        """Test mock pages (shared "Article from" title) each get a citation."""
+        skill = ResearchSkill()
+        input_data = SkillInput(data={"topic": "test", "max_sources": 10})
+
+        output = skill.execute(input_data)
+
+        assert output.data["sources_count"] == 10
+        assert len({s["citation_id"] for s in output.data["sources"]}) == 10
+        assert len(output.data["citations"]) == 10
+
+    def test_near_duplicate_check_can_be_disabled(self):
+        """Test near_duplicate_threshold=None keeps every source."""
+        article = " ".join(f"word{i}" for i in range(300))
+        pages = [
+            ExtractedContent(url=f"https://site{i}.com/a", title="A", content=article)
+            for i in range(3)
+        ]
+        skill = ResearchSkill({"near_duplicate_threshold": None})
+        input_data = SkillInput(data={"topic": "test", "max_sources": 3})
+
+        with patch.object(skill.content_extractor, "extract_many", return_value=pages):
+            output = skill.execute(input_data)
+
+        assert len(output.data["sources"]) == 3
+        assert output.data["duplicate_sources"] == []
+
 
 class TestInsightExtractionSkill:
     """Tests for InsightExtractionSkill."""
@@ -246,6 +372,77 @@ class TestInsightExtractionSkill:
         assert "concepts" in concept_map
         assert "relationships" in concept_map
 
+    def test_insights_use_indicator_sentences(self):
+        """Test indicator sentences become insights, capped at ten."""
+        skill = InsightExtractionSkill()
+        content = "Plain filler. " + "Data shows growth. Sales notably rose. " * 10
+        sources = [{"content": content, "snippet": "s", "citation_id": "c1"}]
+
+        insights = skill._extract_insights(sources, [])
+
+        assert len(insights) == 10
+        assert insights[0]["statement"] == "Data shows growth"
+        assert insights[1]["statement"] == "Sales notably rose"
+        assert insights[0]["sources"] == ["c1"]
+
+    def test_arguments_split_claim_and_reasoning_per_sentence(self):
+        """Test connectors split one sentence, not the text before it."""
+        skill = InsightExtractionSkill()
+        content = (
+            "Intro sentence. Prices rose 3.5% because labor costs climbed. "
+            "Demand is strong, therefore operators expanded."
+        )
+        sources = [{"content": content, "snippet": "s"}]
+
+        arguments = skill._extract_arguments(sources)
+
+        assert [(a["claim"], a["reasoning"]) for a in arguments] == [
+            ("Prices rose 3.5%", "labor costs climbed"),
+            ("Demand is strong,", "operators expanded"),
+        ]
+
+
+@pytest.mark.performance
+class TestInsightExtractionPerformance:
+    """Benchmark insight/argument extraction on large synthetic sources."""
+
+    @staticmethod
+    def _corpus(sources: int, size: int) -> list[dict[str, str]]:
+        # Worst case: long sources without indicators or connectors, so
+        # every sentence is scanned and nothing stops the search early
+        sentence = (
+            "Operators reviewed menu pricing and staffing levels in each region. "
+        )
+        text = sentence * (size // len(sentence))
+        return [{"content": text, "snippet": ""} for _ in range(sources)]
+
+    def test_extraction_is_linear_on_large_sources(self):
+        """Test multi-hundred-KB sources extract quickly and scale linearly."""
+        skill = InsightExtractionSkill()
+
+        def run(corpus):
+            start = time.perf_counter()
+            skill._extract_insights(corpus, [])
+            skill._extract_arguments(corpus)
+            return time.perf_counter() - start
+
+        small = run(self._corpus(4, 250_000))
+        large = run(self._corpus(8, 250_000))
+
+        assert small < 2.0
+        assert large < small * 3 + 0.1
+
+    def test_unpunctuated_source_is_not_quadratic(self):
+        """Test one giant sentence (no terminators) stays linear."""
+        skill = InsightExtractionSkill()
+        content = "word " * 100_000 + "because reasons"
+
+        start = time.perf_counter()
+        arguments = skill._extract_arguments([{"content": content}])
+
+        assert arguments == []
+        assert time.perf_counter() - start < 1.0
+
 
 class TestOutlineSkill:
     """Tests for OutlineSkill."""
@@ -387,6 +584,34 @@ class TestOutlineSkill:
         assert "title" in slide
         assert "purpose" in slide
 
+    def test_detailed_prompt_packs_relevant_content_into_budget(self):
+        """Test the outline prompt is bounded by context_token_budget."""
+        skill = OutlineSkill({"context_token_budget": 400})
+        filler = "General operating conditions were reviewed this quarter. " * 200
+        sources = [
+            {"title": f"Source {i}", "content": filler, "citation_id": f"c{i}"}
+            for i in range(12)
+        ]
+        sources.append(
+            {
+                "title": "Pricing study",
+                "content": "Menu pricing climbed as food costs rose. " * 3,
+                "citation_id": "c-pricing",
+            }
+        )
+        research = {"search_query": "menu pricing", "sources": sources}
+        client = MagicMock()
+        client.generate_text.return_value = '{"title": "T", "slides": []}'
+
+        with patch("plugin.lib.claude_client.get_claude_client", return_value=client):
+            skill._generate_detailed_presentation(research, {}, ["explain pricing"])
+
+        prompt = client.generate_text.call_args.kwargs["prompt"]
+        assert "c-pricing" in prompt
+        content_start = prompt.index("Key source content:")
+        content_end = prompt.index("Generate a comprehensive")
+        assert (content_end - content_start) / 4 < 400 + 50
+
 
 class TestResearchAssistantSkill:
     """Tests for ResearchAssistantSkill."""
@@ -0,0 +1,166 @@
+"""
+Unit tests for plugin/lib/search_cache.py
+
+Tests the in-memory and SQLite search cache backends and their use by
+WebSearch.
+"""
+
+import itertools
+import time
+from unittest.mock import patch
+
+import pytest
+
+from plugin.lib.search_cache import SearchCache, SQLiteSearchCache, make_cache_key
+from plugin.lib.web_search import MockSearchEngine, WebSearch
+
+
+def _results(n=2, prefix="r"):
+    return [
+        {"title": f"{prefix}{i}", "url": f"https://{prefix}{i}.com"} for i in range(n)
+    ]
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key()."""
+
+    def test_normalizes_case_and_whitespace(self):
+        """Test trivially different queries share a key."""
+        assert make_cache_key("  AI   Trends ", "Mock", 5) == make_cache_key(
+            "ai trends", "Mock", 5
+        )
+
+    def test_engine_and_count_are_part_of_key(self):
+        """Test engine and max_results scope the key."""
+        key = make_cache_key("ai", "Mock", 5)
+        assert key != make_cache_key("ai", "Other", 5)
+        assert key != make_cache_key("ai", "Mock", 10)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    """Both cache backends with a small entry bound."""
+    if request.param == "memory":
+        yield SearchCache(ttl_seconds=60, max_entries=2)
+    else:
+        backend = SQLiteSearchCache(
+            tmp_path / "search.db", ttl_seconds=60, max_entries=2
+        )
+        yield backend
+        backend.close()
+
+
+class TestSearchCacheBackends:
+    """Behaviour shared by all backends."""
+
+    def test_round_trip_and_stats(self, cache):
+        """Test set/get and hit/miss/byte accounting."""
+        assert cache.get("k1") is None
+        cache.set("k1", _results(3))
+
+        assert cache.get("k1") == _results(3)
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["results"] == 3
+        assert stats["bytes"] > 0
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_ttl_expiry(self, cache):
+        """Test entries older than the TTL miss."""
+        with patch("plugin.lib.search_cache.time.time", return_value=1000.0):
+            cache.set("k1", _results())
+        with patch("plugin.lib.search_cache.time.time", return_value=1061.0):
+            assert cache.get("k1") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, cache):
+        """Test the least recently used entry is evicted first."""
+        # Strictly increasing clock so access order is unambiguous
+        with patch(
+            "plugin.lib.search_cache.time.time",
+            side_effect=itertools.count(time.time()),
+        ):
+            cache.set("k1", _results())
+            cache.set("k2", _results())
+            cache.get("k1")
+            cache.set("k3", _results())
+
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None
+        assert len(cache) == 2
+
+    def test_clear(self, cache):
+        """Test clear removes entries and resets statistics."""
+        cache.set("k1", _results())
+        cache.get("k1")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get_stats()["hits"] == 0
+
+
+class TestSQLiteSearchCache:
+    """Tests specific to the persistent backend."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the database."""
+        path = tmp_path / "nested" / "search.db"
+        first = SQLiteSearchCache(path)
+        first.set("k1", _results(), query="ai", engine="Mock")
+        first.close()
+
+        second = SQLiteSearchCache(path)
+        assert second.get("k1") == _results()
+        second.close()
+
+    def test_max_bytes_evicts_oldest(self, tmp_path):
+        """Test total payload size is bounded."""
+        cache = SQLiteSearchCache(tmp_path / "search.db", max_bytes=250)
+        with patch(
+            "plugin.lib.search_cache.time.time",
+            side_effect=itertools.count(time.time()),
+        ):
+            cache.set("k1", _results(2, "a"))
+            cache.set("k2", _results(2, "b"))
+            cache.set("k3", _results(2, "c"))
+
+        assert cache.get_stats()["bytes"] <= 250
+        assert cache.get("k1") is None
+        assert cache.get("k3") is not None
+        cache.close()
+
+
+class TestWebSearchCaching:
+    """Tests for WebSearch with a pluggable cache."""
+
+    def test_persistent_cache_skips_engine_across_runs(self, tmp_path):
+        """Test a second run reuses results without calling the engine."""
+        path = tmp_path / "search.db"
+        first_engine = MockSearchEngine()
+        WebSearch(search_engine=first_engine, cache=SQLiteSearchCache(path)).search(
+            "restaurant trends", max_results=5
+        )
+
+        second_engine = MockSearchEngine()
+        search = WebSearch(search_engine=second_engine, cache=SQLiteSearchCache(path))
+        results = search.search("Restaurant  Trends", max_results=5)
+
+        assert len(results) == 5
+        assert results[0].title == "Result 1: restaurant trends"
+        assert second_engine.search_history == []
+        stats = search.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["backend"] == "SQLiteSearchCache"
+
+    def test_concurrent_queries_share_sqlite_cache(self, tmp_path):
+        """Test multi-query search is safe with the SQLite backend."""
+        search = WebSearch(
+            search_engine=MockSearchEngine(),
+            cache=SQLiteSearchCache(tmp_path / "search.db"),
+        )
+        queries = [f"query {i}" for i in range(8)]
+
+        search.search_multiple_queries(queries, max_results_per_query=3)
+
+        assert search.get_cache_stats()["cached_queries"] == 8
@@ -0,0 +1,211 @@
+"""
+Unit tests for plugin/lib/presentation/slide_preview.py
+
+Tests the SlidePreviewRenderer approximate renderer and SlidePreview dataclass.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from plugin.lib.presentation.parser import Slide
+from plugin.lib.presentation.slide_preview import (
+    SlidePreview,
+    SlidePreviewRenderer,
+)
+
+
+@pytest.fixture
+def content_slide():
+    """A short content slide."""
+    return Slide(
+        number=3,
+        slide_type="CONTENT",
+        title="Quarterly Results",
+        subtitle="Overview",
+        content_bullets=[("Revenue up 12%", 0), ("Drive-thru up 15%", 1)],
+    )
+
+
+class TestSlidePreviewRendererForTemplate:
+    """Tests for building renderers from registered templates."""
+
+    def test_for_template_cfa_dimensions(self):
+        """Test CFA renderer uses 13.33 x 7.5 inch slides."""
+        renderer = SlidePreviewRenderer.for_template("cfa", pixels_per_inch=10)
+        assert renderer.slide_width == pytest.approx(13.33)
+        assert renderer.slide_height == pytest.approx(7.5)
+        assert "content_text_only" in renderer.layouts
+
+    def test_for_template_stratfield_dimensions(self):
+        """Test Stratfield renderer derives inches from EMU dimensions."""
+        renderer = SlidePreviewRenderer.for_template("stratfield")
+        assert renderer.slide_width == pytest.approx(10.0)
+        assert renderer.slide_height == pytest.approx(5.625)
+
+    def test_for_template_unknown_raises(self):
+        """Test unknown template raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown template"):
+            SlidePreviewRenderer.for_template("nonexistent")
+
+
+class TestSlidePreviewRender:
+    """Tests for render()."""
+
+    def test_render_content_slide(self, content_slide):
+        """Test rendering a content slide produces image at expected size."""
+        renderer = SlidePreviewRenderer.for_template("cfa", pixels_per_inch=48)
+        preview = renderer.render(content_slide, "add_content_slide")
+
+        assert isinstance(preview, SlidePreview)
+        assert preview.slide_number == 3
+        assert preview.layout == "content_text_only"
+        assert preview.image.size == (640, 360)
+        assert not preview.has_issues
+
+    def test_render_uses_background_color(self, content_slide):
+        """Test section break background color is applied."""
+        renderer = SlidePreviewRenderer.for_template("cfa", pixels_per_inch=20)
+        preview = renderer.render(content_slide, "add_section_break")
+
+        assert preview.image.getpixel((2, 2)) == (0x00, 0x4F, 0x71)
+
+    def test_render_draws_left_panel_fill(self, content_slide, tmp_path):
+        """Test text+image layout fills the left panel."""
+        image_path = tmp_path / "slide-3.jpg"
+        Image.new("RGB", (64, 48), "#3EB1C8").save(image_path)
+
+        renderer = SlidePreviewRenderer.for_template("stratfield", pixels_per_inch=20)
+        preview = renderer.render(
+            content_slide, "add_text_and_image_slide", str(image_path)
+        )
+
+        assert preview.layout == "content_text_and_image"
+        # Bottom of left panel, below any text
+        assert preview.image.getpixel((5, 100)) == (0x29, 0x60, 0x57)
+
+    def test_render_image_layout_without_image_falls_back(self, content_slide):
+        """Test image layouts fall back to content layout when no image exists."""
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        preview = renderer.render(content_slide, "add_image_slide")
+        assert preview.layout == "content_text_only"
+
+    def test_render_missing_image_file_reports_issue(self, content_slide):
+        """Test a referenced but missing image file is reported."""
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        preview = renderer.render(
+            content_slide, "add_image_slide", "/nonexistent/slide-3.jpg"
+        )
+        assert preview.has_issues
+        assert "Image file missing" in preview.issues[0]
+
+    def test_render_detects_body_overflow(self):
+        """Test very long bullet lists are reported as overflowing."""
+        slide = Slide(
+            number=7,
+            slide_type="CONTENT",
+            title="Too Much Text",
+            content_bullets=[(f"Bullet point number {i} " * 6, 0) for i in range(40)],
+        )
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        preview = renderer.render(slide, "add_content_slide")
+
+        assert preview.has_issues
+        assert preview.overflow_ratios["body"] > 1.25
+        assert "body" in preview.issues[0]
+
+    def test_render_unknown_method_uses_content_layout(self, content_slide):
+        """Test unknown template methods render as content slides."""
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        preview = renderer.render(content_slide, "add_unknown_slide")
+        assert preview.layout == "content_text_only"
+
+    def test_render_without_pillow_returns_empty_preview(self, content_slide):
+        """Test missing Pillow yields a preview with no image and no issues."""
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        with patch("plugin.lib.presentation.slide_preview.PIL_AVAILABLE", False):
+            preview = renderer.render(content_slide, "add_content_slide")
+
+        assert preview.image is None
+        assert not preview.has_issues
+
+
+class TestSlidePreviewRenderMany:
+    """Tests for render_many()."""
+
+    def test_render_many_preserves_order(self):
+        """Test parallel rendering returns previews in job order."""
+        slides = [
+            Slide(number=i, slide_type="CONTENT", title=f"Slide {i}")
+            for i in range(1, 9)
+        ]
+        renderer = SlidePreviewRenderer.for_template("stratfield")
+        previews = renderer.render_many(
+            [(slide, "add_content_slide", None) for slide in slides], max_workers=4
+        )
+
+        assert [p.slide_number for p in previews] == list(range(1, 9))
+
+
+class TestSlidePreviewSave:
+    """Tests for SlidePreview.save()."""
+
+    def test_save_writes_file(self, content_slide, tmp_path):
+        """Test preview can be saved to disk."""
+        renderer = SlidePreviewRenderer.for_template("cfa")
+        preview = renderer.render(content_slide, "add_content_slide")
+        output = tmp_path / "preview.png"
+
+        preview.save(str(output))
+
+        assert output.exists()
+
+    def test_save_without_image_is_noop(self, tmp_path):
+        """Test saving an empty preview does nothing."""
+        preview = SlidePreview(slide_number=1, layout="title_slide", image=None)
+        output = tmp_path / "preview.png"
+
+        preview.save(str(output))
+
+        assert not output.exists()
+
+
+class TestValidatePreview:
+    """Tests for VisualValidator.validate_preview()."""
+
+    def setup_method(self):
+        """Set up validator with mocked Gemini client."""
+        with (
+            patch("plugin.lib.presentation.visual_validator.GENAI_AVAILABLE", True),
+            patch("plugin.lib.presentation.visual_validator.genai") as mock_genai,
+        ):
+            mock_genai.Client.return_value = MagicMock()
+
+            from plugin.lib.presentation.visual_validator import VisualValidator
+
+            self.validator = VisualValidator(api_key="test-key")
+
+    def test_clean_preview_passes(self, content_slide):
+        """Test preview without issues passes at threshold."""
+        preview = SlidePreview(slide_number=3, layout="content_text_only", image=None)
+        result = self.validator.validate_preview(preview, content_slide)
+
+        assert result.passed is True
+        assert result.score == self.validator.VALIDATION_THRESHOLD
+
+    def test_overflow_preview_fails_with_suggestion(self, content_slide):
+        """Test overflowing preview fails without calling the API."""
+        preview = SlidePreview(
+            slide_number=3,
+            layout="content_text_only",
+            image=None,
+            issues=["Text in body overflows its box (~180% of available height)"],
+        )
+        result = self.validator.validate_preview(preview, content_slide)
+
+        assert result.passed is False
+        assert result.score < self.validator.VALIDATION_THRESHOLD
+        assert result.issues == preview.issues
+        assert result.suggestions
+        self.validator.client.models.generate_content.assert_not_called()
@@ -0,0 +1,248 @@
+"""
+Unit tests for plugin/lib/presentation/validation_cache.py
+
+Tests perceptual hashing and the ValidationCache used to skip redundant
+Gemini vision calls for near-identical slide renders.
+"""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+from PIL import Image, ImageDraw
+
+from plugin.lib.presentation.parser import Slide
+from plugin.lib.presentation.validation_cache import (
+    ValidationCache,
+    compute_dhash,
+    context_key,
+    hamming_distance,
+)
+
+
+def _slide_image(path, accent="#DD0033", dot=None):
+    """Write a simple slide-like JPEG with an optional small extra mark."""
+    img = Image.new("RGB", (320, 180), "#FFFFFF")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((0, 0, 120, 180), fill=accent)
+    draw.rectangle((150, 40, 300, 60), fill="#5B6770")
+    if dot:
+        draw.rectangle((dot, dot, dot + 1, dot + 1), fill="#000000")
+    img.save(path, "JPEG")
+    return str(path)
+
+
+class TestComputeDhash:
+    """Tests for compute_dhash()."""
+
+    def test_identical_images_same_hash(self, tmp_path):
+        """Test identical images produce identical hashes."""
+        a = _slide_image(tmp_path / "a.jpg")
+        b = _slide_image(tmp_path / "b.jpg")
+        assert compute_dhash(a) == compute_dhash(b)
+
+    def test_near_identical_images_close_hashes(self, tmp_path):
+        """Test a tiny change keeps hashes within a few bits."""
+        a = compute_dhash(_slide_image(tmp_path / "a.jpg"))
+        b = compute_dhash(_slide_image(tmp_path / "b.jpg", dot=250))
+        assert hamming_distance(a, b) <= 4
+
+    def test_different_images_distant_hashes(self, tmp_path):
+        """Test structurally different images are far apart."""
+        a = compute_dhash(_slide_image(tmp_path / "a.jpg"))
+        img = Image.new("RGB", (320, 180), "#FFFFFF")
+        ImageDraw.Draw(img).rectangle((200, 0, 320, 180), fill="#004F71")
+        img.save(tmp_path / "c.jpg")
+        c = compute_dhash(str(tmp_path / "c.jpg"))
+        assert hamming_distance(a, c) > 4
+
+    def test_accepts_bytes(self, tmp_path):
+        """Test hashing encoded bytes matches hashing the file."""
+        path = _slide_image(tmp_path / "a.jpg")
+        with open(path, "rb") as f:
+            data = f.read()
+        assert compute_dhash(data) == compute_dhash(path)
+
+    def test_undecodable_returns_none(self):
+        """Test non-image bytes return None."""
+        assert compute_dhash(b"not an image") is None
+
+    def test_missing_file_returns_none(self):
+        """Test missing file returns None."""
+        assert compute_dhash("/nonexistent/slide.jpg") is None
+
+
+class TestHelpers:
+    """Tests for hamming_distance() and context_key()."""
+
+    def test_hamming_distance(self):
+        """Test bit difference counting."""
+        assert hamming_distance(0b1010, 0b1010) == 0
+        assert hamming_distance(0b1010, 0b0101) == 4
+
+    def test_context_key_stable_and_distinct(self):
+        """Test context keys are deterministic and prompt-specific."""
+        assert context_key("prompt A") == context_key("prompt A")
+        assert context_key("prompt A") != context_key("prompt B")
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    def test_exact_hit(self):
+        """Test storing and retrieving an exact hash."""
+        cache = ValidationCache()
+        cache.store(0xABCD, "ctx", {"score": 0.8})
+        assert cache.lookup(0xABCD, "ctx") == {"score": 0.8}
+        assert cache.get_stats()["hits"] == 1
+
+    def test_near_duplicate_hit(self):
+        """Test a hash within max_distance hits."""
+        cache = ValidationCache(max_distance=2)
+        cache.store(0b1111, "ctx", {"score": 0.8})
+        assert cache.lookup(0b1100, "ctx") == {"score": 0.8}
+        assert cache.lookup(0b0000, "ctx") is None
+
+    def test_context_key_scopes_entries(self):
+        """Test entries never leak across context keys."""
+        cache = ValidationCache()
+        cache.store(0xABCD, "slide-1", {"score": 0.8})
+        assert cache.lookup(0xABCD, "slide-2") is None
+
+    def test_none_hash_misses_and_is_not_stored(self):
+        """Test undecodable images are never cached."""
+        cache = ValidationCache()
+        cache.store(None, "ctx", {"score": 0.8})
+        assert cache.lookup(None, "ctx") is None
+        assert cache.get_stats() == {
+            "entries": 0,
+            "hits": 0,
+            "misses": 1,
+            "hit_rate": 0.0,
+        }
+
+    def test_evicts_oldest(self):
+        """Test max_entries evicts least recently used entries."""
+        cache = ValidationCache(max_distance=0, max_entries=2)
+        cache.store(1, "ctx", {"n": 1})
+        cache.store(2, "ctx", {"n": 2})
+        cache.lookup(1, "ctx")
+        cache.store(3, "ctx", {"n": 3})
+
+        assert cache.lookup(2, "ctx") is None
+        assert cache.lookup(1, "ctx") == {"n": 1}
+
+    def test_persists_to_disk(self, tmp_path):
+        """Test results survive across cache instances."""
+        path = tmp_path / "cache.json"
+        ValidationCache(cache_path=str(path)).store(0xFF, "ctx", {"score": 0.9})
+
+        reloaded = ValidationCache(cache_path=str(path))
+        assert reloaded.lookup(0xFF, "ctx") == {"score": 0.9}
+
+    def test_corrupt_cache_file_ignored(self, tmp_path, capsys):
+        """Test unreadable cache files start an empty cache."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        cache = ValidationCache(cache_path=str(path))
+
+        assert cache.get_stats()["entries"] == 0
+        assert "WARN" in capsys.readouterr().out
+
+    def test_clear(self, tmp_path):
+        """Test clear empties cache and persisted file."""
+        path = tmp_path / "cache.json"
+        cache = ValidationCache(cache_path=str(path))
+        cache.store(1, "ctx", {"n": 1})
+        cache.clear()
+
+        assert cache.get_stats()["entries"] == 0
+        assert json.loads(path.read_text()) == {"entries": []}
+
+
+class TestVisualValidatorCaching:
+    """Tests for perceptual-hash caching in VisualValidator.validate_slide."""
+
+    def setup_method(self):
+        """Set up validator with mocked Gemini client."""
+        with (
+            patch("plugin.lib.presentation.visual_validator.GENAI_AVAILABLE", True),
+            patch("plugin.lib.presentation.visual_validator.genai") as mock_genai,
+        ):
+            self.mock_client = MagicMock()
+            mock_genai.Client.return_value = self.mock_client
+
+            from plugin.lib.presentation.visual_validator import VisualValidator
+
+            self.validator = VisualValidator(api_key="test-key")
+
+        response = MagicMock()
+        response.text = json.dumps(
+            {
+                "content_accuracy": 27,
+                "visual_hierarchy": 18,
+                "brand_alignment": 18,
+                "image_quality": 13,
+                "layout_effectiveness": 13,
+                "total_score": 89,
+                "issues": [],
+                "suggestions": [],
+            }
+        )
+        self.mock_client.models.generate_content.return_value = response
+        self.slide = Slide(number=2, slide_type="CONTENT", title="Cached")
+
+    def _validate(self, path, title=None):
+        slide = self.slide if title is None else Slide(2, "CONTENT", title)
+        return self.validator.validate_slide(
+            slide_image_path=path,
+            original_slide=slide,
+            style_config={},
+            slide_type="content",
+        )
+
+    def test_near_identical_render_skips_api_call(self, tmp_path, capsys):
+        """Test a near-identical re-render reuses the prior result."""
+        first = self._validate(_slide_image(tmp_path / "attempt-1.jpg"))
+        second = self._validate(_slide_image(tmp_path / "attempt-2.jpg", dot=250))
+
+        assert self.mock_client.models.generate_content.call_count == 1
+        assert second == first
+        assert "[CACHE]" in capsys.readouterr().out
+
+    def test_different_slide_intent_calls_api(self, tmp_path):
+        """Test same image with a different slide title is re-validated."""
+        path = _slide_image(tmp_path / "slide.jpg")
+        self._validate(path)
+        self._validate(path, title="Different Title")
+
+        assert self.mock_client.models.generate_content.call_count == 2
+
+    def test_fallback_results_not_cached(self, tmp_path):
+        """Test unparseable responses are not reused."""
+        self.mock_client.models.generate_content.return_value.text = "not json"
+        path = _slide_image(tmp_path / "slide.jpg")
+        self._validate(path)
+        self._validate(path)
+
+        assert self.mock_client.models.generate_content.call_count == 2
+
+    def test_encoded_bytes_image_round_trip(self):
+        """Test cache payloads rebuild ValidationResult objects."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 18), "#FFFFFF").save(buffer, "JPEG")
+        image_hash = compute_dhash(buffer.getvalue())
+        self.validator.cache.store(
+            image_hash,
+            "ctx",
+            {
+                "passed": True,
+                "score": 0.8,
+                "issues": [],
+                "suggestions": [],
+                "raw_feedback": "{}",
+                "rubric_scores": {"content_accuracy": 0.8},
+            },
+        )
+        assert self.validator.cache.lookup(image_hash, "ctx")["score"] == 0.8
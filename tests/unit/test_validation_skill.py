@@ -923,6 +923,121 @@ class TestMultipleSlides:
         assert result.data["summary"]["failed"] == 2
         assert result.data["pass_rate"] == 50.0
 
+    @patch("plugin.skills.images.validation_skill.SlideExporter")
+    @patch("plugin.skills.images.validation_skill.WorkflowAnalytics")
+    @patch("plugin.skills.images.validation_skill.VisualValidator")
+    @patch("plugin.skills.images.validation_skill.platform.system")
+    def test_execute_batched_validation(
+        self, mock_system, mock_validator_class, mock_analytics, mock_exporter, tmp_path
+    ):
+        """Test batch_size > 1 validates slides through validate_slides_batch."""
+        mock_system.return_value = "Windows"
+        mock_exporter.return_value = MagicMock()
+
+        mock_analytics_instance = MagicMock()
+        mock_analytics.return_value = mock_analytics_instance
+        mock_analytics_instance.generate_report.return_value = {"workflow_id": "test"}
+
+        results = []
+        for passed in (True, False, True):
+            result = MagicMock()
+            result.passed = passed
+            result.score = 90.0 if passed else 60.0
+            result.issues = []
+            results.append(result)
+
+        mock_validator_instance = MagicMock()
+        mock_validator_instance.validate_slides_batch.return_value = results
+        # One batch request plus one single-slide fallback
+        mock_validator_instance.last_batch_api_calls = 2
+        mock_validator_class.return_value = mock_validator_instance
+
+        pres_path = tmp_path / "presentation.pptx"
+        pres_path.touch()
+
+        validation_dir = tmp_path / "validation"
+        validation_dir.mkdir()
+        for i in range(1, 4):
+            (validation_dir / f"slide-{i}.jpg").write_bytes(b"fake image data")
+
+        skill = ValidationSkill()
+
+        slides = [{"title": f"Slide {i}", "type": "content"} for i in range(1, 4)]
+
+        input_data = SkillInput(
+            data={
+                "slides": slides,
+                "presentation_path": str(pres_path),
+                "output_dir": str(validation_dir),
+                "batch_size": 4,
+            }
+        )
+
+        result = skill.execute(input_data)
+
+        assert result.success is True
+        mock_validator_instance.validate_slide.assert_not_called()
+        items = mock_validator_instance.validate_slides_batch.call_args[0][0]
+        assert [item[0] for item in items] == [
+            str(validation_dir / f"slide-{i}.jpg") for i in range(1, 4)
+        ]
+        assert result.data["summary"]["passed"] == 2
+        assert result.data["summary"]["failed"] == 1
+        assert [r["validation"] for r in result.data["validation_results"]] == results
+        mock_analytics_instance.track_api_call.assert_called_once_with(
+            "gemini_vision", call_count=2
+        )
+
+    @patch("plugin.skills.images.validation_skill.SlideExporter")
+    @patch("plugin.skills.images.validation_skill.WorkflowAnalytics")
+    @patch("plugin.skills.images.validation_skill.VisualValidator")
+    @patch("plugin.skills.images.validation_skill.platform.system")
+    def test_execute_batched_validation_error_falls_back(
+        self, mock_system, mock_validator_class, mock_analytics, mock_exporter, tmp_path
+    ):
+        """Test a failing batch call falls back to per-slide validation."""
+        mock_system.return_value = "Windows"
+        mock_exporter.return_value = MagicMock()
+
+        mock_analytics_instance = MagicMock()
+        mock_analytics.return_value = mock_analytics_instance
+        mock_analytics_instance.generate_report.return_value = {"workflow_id": "test"}
+
+        mock_validation_result = MagicMock()
+        mock_validation_result.passed = True
+        mock_validation_result.score = 90.0
+        mock_validation_result.issues = []
+
+        mock_validator_instance = MagicMock()
+        mock_validator_instance.validate_slides_batch.side_effect = RuntimeError("boom")
+        mock_validator_instance.validate_slide.return_value = mock_validation_result
+        mock_validator_class.return_value = mock_validator_instance
+
+        pres_path = tmp_path / "presentation.pptx"
+        pres_path.touch()
+
+        validation_dir = tmp_path / "validation"
+        validation_dir.mkdir()
+        for i in range(1, 3):
+            (validation_dir / f"slide-{i}.jpg").write_bytes(b"fake image data")
+
+        skill = ValidationSkill()
+
+        input_data = SkillInput(
+            data={
+                "slides": [{"title": "A"}, {"title": "B"}],
+                "presentation_path": str(pres_path),
+                "output_dir": str(validation_dir),
+                "batch_size": 2,
+            }
+        )
+
+        result = skill.execute(input_data)
+
+        assert result.success is True
+        assert mock_validator_instance.validate_slide.call_count == 2
+        assert result.data["summary"]["passed"] == 2
+
 
 # ==============================================================================
 # Test Slide Type Handling
@@ -1399,3 +1399,459 @@ class TestSlideTypeVariations:
         )
         prompt = self.validator._build_validation_prompt(slide, {}, "text_image")
         assert "**Type:** text_image" in prompt
+
+
+class TestImageDownsampling:
+    """Tests for image preparation before Gemini upload."""
+
+    def setup_method(self):
+        """Set up validator with mocked Gemini client."""
+        with (
+            patch("plugin.lib.presentation.visual_validator.GENAI_AVAILABLE", True),
+            patch("plugin.lib.presentation.visual_validator.genai") as mock_genai,
+            patch("plugin.lib.presentation.visual_validator.types") as mock_types,
+        ):
+            self.mock_client = MagicMock()
+            mock_genai.Client.return_value = self.mock_client
+            self.mock_types = mock_types
+
+            from plugin.lib.presentation.visual_validator import VisualValidator
+
+            self.validator_class = VisualValidator
+            self.validator = VisualValidator(api_key="test-key")
+
+        self.slide = Slide(number=1, slide_type="CONTENT", title="Test")
+
+    def _write_large_slide(self, tmp_path):
+        """Write a 300 DPI-sized noisy slide image."""
+        from PIL import Image
+
+        path = tmp_path / "slide.jpg"
+        Image.effect_noise((3000, 1688), 64).convert("RGB").save(path, quality=95)
+        return path
+
+    def test_prepare_image_downscales_to_max_edge(self, tmp_path):
+        """Test large images are resized to the configured max edge."""
+        import io
+
+        from PIL import Image
+
+        path = self._write_large_slide(tmp_path)
+        prepared = self.validator._prepare_image(path)
+
+        with Image.open(io.BytesIO(prepared)) as img:
+            assert max(img.size) == self.validator.DEFAULT_MAX_IMAGE_EDGE
+        stats = self.validator.get_upload_stats()
+        assert stats["downscaled"] == 1
+        assert stats["prepared_bytes"] < stats["original_bytes"] / 5
+        assert stats["reduction"] > 0.8
+
+    def test_prepare_image_small_image_unchanged(self, tmp_path):
+        """Test images already under the max edge are sent as-is."""
+        from PIL import Image
+
+        path = tmp_path / "small.jpg"
+        Image.new("RGB", (640, 360), "#FFFFFF").save(path)
+
+        assert self.validator._prepare_image(path) == path.read_bytes()
+        assert self.validator.get_upload_stats()["downscaled"] == 0
+
+    def test_prepare_image_disabled(self, tmp_path):
+        """Test max_image_edge=None disables downsampling."""
+        with patch("plugin.lib.presentation.visual_validator.genai"):
+            validator = self.validator_class(api_key="test-key", max_image_edge=None)
+        path = self._write_large_slide(tmp_path)
+
+        assert validator._prepare_image(path) == path.read_bytes()
+
+    def test_prepare_image_undecodable_sent_as_is(self, tmp_path):
+        """Test bytes Pillow cannot decode are passed through."""
+        path = tmp_path / "slide.jpg"
+        path.write_bytes(b"not really a jpeg")
+
+        assert self.validator._prepare_image(path) == b"not really a jpeg"
+
+    def test_retries_reuse_prepared_bytes(self, tmp_path):
+        """Test the image is read once and the same bytes are sent on retry."""
+        path = self._write_large_slide(tmp_path)
+        response = MagicMock()
+        response.text = json.dumps(
+            {
+                "content_accuracy": 25,
+                "visual_hierarchy": 15,
+                "brand_alignment": 15,
+                "image_quality": 12,
+                "layout_effectiveness": 12,
+                "issues": [],
+                "suggestions": [],
+            }
+        )
+        self.mock_client.models.generate_content.side_effect = [
+            Exception("API Error"),
+            response,
+        ]
+
+        with (
+            patch("plugin.lib.presentation.visual_validator.types", self.mock_types),
+            patch("time.sleep"),
+            patch.object(
+                self.validator, "_prepare_image", wraps=self.validator._prepare_image
+            ) as mock_prepare,
+        ):
+            self.validator.validate_slide(
+                slide_image_path=str(path),
+                original_slide=self.slide,
+                style_config={},
+                slide_type="content",
+            )
+
+        mock_prepare.assert_called_once()
+        sent = [
+            c.kwargs["data"] for c in self.mock_types.Part.from_bytes.call_args_list
+        ]
+        assert len(sent) == 2
+        assert sent[0] is sent[1]
+        stats = self.validator.get_upload_stats()
+        assert stats["api_calls"] == 2
+        assert stats["bytes_sent"] == 2 * stats["prepared_bytes"]
+
+    def test_unreadable_image_returns_fallback(self, tmp_path):
+        """Test read errors degrade gracefully without an API call."""
+        with (
+            patch("pathlib.Path.exists", return_value=True),
+            patch("builtins.open", side_effect=PermissionError("denied")),
+        ):
+            result = self.validator.validate_slide(
+                slide_image_path="locked.jpg",
+                original_slide=self.slide,
+                style_config={},
+                slide_type="content",
+            )
+
+        assert result.passed is True
+        assert "image unreadable" in result.raw_feedback
+        self.mock_client.models.generate_content.assert_not_called()
+
+
+class TestBatchValidation:
+    """Tests for validate_slides_batch() multi-slide requests."""
+
+    def setup_method(self):
+        """Set up validator with mocked Gemini client."""
+        with (
+            patch("plugin.lib.presentation.visual_validator.GENAI_AVAILABLE", True),
+            patch("plugin.lib.presentation.visual_validator.genai") as mock_genai,
+        ):
+            self.mock_client = MagicMock()
+            mock_genai.Client.return_value = self.mock_client
+
+            from plugin.lib.presentation.visual_validator import VisualValidator
+
+            self.validator = VisualValidator(api_key="test-key")
+
+    @staticmethod
+    def _scores(total, index=None):
+        """Build a rubric response whose weighted score is total / 100."""
+        fraction = total / 100
+        data = {
+            "content_accuracy": 30 * fraction,
+            "visual_hierarchy": 20 * fraction,
+            "brand_alignment": 20 * fraction,
+            "image_quality": 15 * fraction,
+            "layout_effectiveness": 15 * fraction,
+            "total_score": total,
+            "issues": [],
+            "suggestions": [],
+        }
+        if index is not None:
+            data["slide_index"] = index
+        return data
+
+    def _items(self, tmp_path, count):
+        """Write distinct small slide images and build batch items."""
+        from PIL import Image, ImageDraw
+
+        items = []
+        for n in range(1, count + 1):
+            path = tmp_path / f"slide-{n}.jpg"
+            img = Image.new("RGB", (320, 180), "#FFFFFF")
+            ImageDraw.Draw(img).rectangle((n * 30, 0, n * 30 + 40, 180), fill="#000")
+            img.save(path)
+            slide = Slide(number=n, slide_type="CONTENT", title=f"Slide {n}")
+            items.append((str(path), slide, "content"))
+        return items
+
+    def _respond(self, *texts):
+        responses = [MagicMock(text=text) for text in texts]
+        self.mock_client.models.generate_content.side_effect = responses
+
+    def test_one_request_per_batch_in_order(self, tmp_path):
+        """Test four slides are scored by a single request, in item order."""
+        self._respond(json.dumps([self._scores(80 + i, i) for i in (4, 2, 3, 1)]))
+
+        results = self.validator.validate_slides_batch(
+            self._items(tmp_path, 4), {}, batch_size=4
+        )
+
+        assert self.mock_client.models.generate_content.call_count == 1
+        assert [r.score for r in results] == pytest.approx([0.81, 0.82, 0.83, 0.84])
+        assert self.validator.get_upload_stats()["api_calls"] == 1
+        assert self.validator.last_batch_api_calls == 1
+
+    def test_splits_into_batches(self, tmp_path):
+        """Test batch_size bounds slides per request."""
+        self._respond(
+            json.dumps([self._scores(90, i) for i in (1, 2)]),
+            json.dumps([self._scores(90, 1)]),
+        )
+
+        results = self.validator.validate_slides_batch(
+            self._items(tmp_path, 3), {}, batch_size=2
+        )
+
+        # Trailing single-slide batch uses the regular single-slide prompt
+        assert self.mock_client.models.generate_content.call_count == 2
+        assert len(results) == 3
+
+    def test_unparseable_batch_falls_back_to_single(self, tmp_path, capsys):
+        """Test invalid batch responses re-validate each slide individually."""
+        self._respond(
+            "not json",
+            json.dumps(self._scores(90)),
+            json.dumps(self._scores(70)),
+        )
+
+        results = self.validator.validate_slides_batch(
+            self._items(tmp_path, 2), {}, batch_size=2
+        )
+
+        assert self.mock_client.models.generate_content.call_count == 3
+        assert self.validator.last_batch_api_calls == 3
+        assert [r.passed for r in results] == [True, False]
+        assert "Falling back to single-slide validation" in capsys.readouterr().out
+
+    def test_missing_slide_validated_individually(self, tmp_path):
+        """Test slides absent from the batch response get their own request."""
+        self._respond(
+            json.dumps([self._scores(90, 1)]),
+            json.dumps(self._scores(60)),
+        )
+
+        results = self.validator.validate_slides_batch(
+            self._items(tmp_path, 2), {}, batch_size=2
+        )
+
+        assert self.mock_client.models.generate_content.call_count == 2
+        assert [r.score for r in results] == pytest.approx([0.9, 0.6])
+
+    def test_cached_slides_skip_batch(self, tmp_path):
+        """Test results cached by an earlier run are not re-sent."""
+        items = self._items(tmp_path, 2)
+        self._respond(json.dumps([self._scores(90, i) for i in (1, 2)]))
+        self.validator.validate_slides_batch(items, {}, batch_size=2)
+
+        results = self.validator.validate_slides_batch(items, {}, batch_size=2)
+
+        assert self.mock_client.models.generate_content.call_count == 1
+        assert self.validator.last_batch_api_calls == 0
+        assert all(r.passed for r in results)
+
+    def test_unreadable_image_degrades_without_retry(self, tmp_path, capsys):
+        """Test an unreadable image gets the unavailable result, read once."""
+        items = self._items(tmp_path, 2)
+        self._respond(json.dumps(self._scores(90)))
+        real_prepare = self.validator._prepare_image
+
+        def prepare(image_path):
+            if image_path.name == "slide-1.jpg":
+                raise OSError("corrupt")
+            return real_prepare(image_path)
+
+        with patch.object(
+            self.validator, "_prepare_image", side_effect=prepare
+        ) as mock_prepare:
+            results = self.validator.validate_slides_batch(items, {}, batch_size=2)
+
+        assert mock_prepare.call_count == 2
+        assert results[0].passed is True
+        assert results[0].rubric_scores == {}
+        assert "image unreadable" in results[0].raw_feedback
+        assert results[1].score == pytest.approx(0.9)
+        assert self.validator.get_upload_stats()["images"] == 1
+        assert "Failed to read image for slide 1" in capsys.readouterr().out
+
+    def test_missing_image_raises(self, tmp_path):
+        """Test a missing slide image raises FileNotFoundError."""
+        items = [("/nonexistent/slide.jpg", Slide(1, "CONTENT", "T"), "content")]
+        with pytest.raises(FileNotFoundError):
+            self.validator.validate_slides_batch(items, {})
+
+    def test_parse_batch_response_code_fence(self):
+        """Test batched responses wrapped in markdown code blocks parse."""
+        text = "```json\n" + json.dumps([self._scores(90, 2)]) + "\n```"
+        parsed = self.validator._parse_batch_response(text, 2)
+        assert list(parsed) == [2]
+
+    def test_parse_batch_response_invalid_raises(self):
+        """Test responses without a JSON array raise ValueError."""
+        with pytest.raises(ValueError):
+            self.validator._parse_batch_response('{"total_score": 90}', 2)
+
+
+class TestAsyncValidation:
+    """Tests for validate_slide_async() and validate_slides_async()."""
+
+    def setup_method(self):
+        """Set up validator with mocked Gemini client."""
+        with (
+            patch("plugin.lib.presentation.visual_validator.GENAI_AVAILABLE", True),
+            patch("plugin.lib.presentation.visual_validator.genai") as mock_genai,
+        ):
+            mock_genai.Client.return_value = MagicMock()
+
+            from plugin.lib.presentation.visual_validator import VisualValidator
+
+            self.validator = VisualValidator(api_key="test-key")
+
+        self.response = json.dumps(
+            {
+                "content_accuracy": 27,
+                "visual_hierarchy": 18,
+                "brand_alignment": 18,
+                "image_quality": 13,
+                "layout_effectiveness": 13,
+                "total_score": 89,
+                "issues": [],
+                "suggestions": [],
+            }
+        )
+
+    def _image(self, tmp_path, n=1):
+        from PIL import Image, ImageDraw
+
+        path = tmp_path / f"slide-{n}.jpg"
+        img = Image.new("RGB", (320, 180), "#FFFFFF")
+        ImageDraw.Draw(img).rectangle((n * 30, 0, n * 30 + 40, 180), fill="#000")
+        img.save(path)
+        return str(path)
+
+    @pytest.mark.asyncio
+    async def test_validate_slide_async_uses_client(self, tmp_path):
+        """Test async validation sends image and prompt through the client."""
+        from unittest.mock import AsyncMock
+
+        client = MagicMock()
+        client.generate_text = AsyncMock(return_value=self.response)
+        slide = Slide(number=1, slide_type="CONTENT", title="Async")
+
+        result = await self.validator.validate_slide_async(
+            self._image(tmp_path), slide, {}, "content", client
+        )
+
+        assert result.passed is True
+        assert result.rubric_scores
+        parts = client.generate_text.call_args[0][0]
+        assert parts[0]["inlineData"]["mimeType"] == "image/jpeg"
+        assert "Async" in parts[1]["text"]
+        assert client.generate_text.call_args.kwargs["model"] == (
+            self.validator.VISION_MODEL
+        )
+
+    @pytest.mark.asyncio
+    async def test_validate_slide_async_cache_hit(self, tmp_path):
+        """Test repeated async validation of the same render is cached."""
+        from unittest.mock import AsyncMock
+
+        client = MagicMock()
+        client.generate_text = AsyncMock(return_value=self.response)
+        slide = Slide(number=1, slide_type="CONTENT", title="Async")
+        path = self._image(tmp_path)
+
+        await self.validator.validate_slide_async(path, slide, {}, "content", client)
+        await self.validator.validate_slide_async(path, slide, {}, "content", client)
+
+        assert client.generate_text.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_validate_slide_async_error_degrades(self, tmp_path):
+        """Test client failures return the pass-by-default fallback."""
+        from unittest.mock import AsyncMock
+
+        client = MagicMock()
+        client.generate_text = AsyncMock(side_effect=RuntimeError("timeout"))
+        slide = Slide(number=1, slide_type="CONTENT", title="Async")
+
+        result = await self.validator.validate_slide_async(
+            self._image(tmp_path), slide, {}, "content", client
+        )
+
+        assert result.passed is True
+        assert result.rubric_scores == {}
+        assert "Validation unavailable" in result.raw_feedback
+
+    @pytest.mark.asyncio
+    async def test_validate_slide_async_missing_file(self):
+        """Test missing images raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await self.validator.validate_slide_async(
+                "/nonexistent.jpg", Slide(1, "CONTENT", "T"), {}, "content", None
+            )
+
+    @pytest.mark.asyncio
+    async def test_validate_slides_async_bounded_and_ordered(self, tmp_path):
+        """Test concurrent validation respects max_concurrent and keeps order."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def generate_text(parts, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self.response
+
+        client = MagicMock()
+        client.generate_text = generate_text
+        items = [
+            (self._image(tmp_path, n), Slide(n, "CONTENT", f"Slide {n}"), "content")
+            for n in range(1, 7)
+        ]
+
+        results = await self.validator.validate_slides_async(
+            items, {}, client, max_concurrent=2
+        )
+
+        assert len(results) == 6
+        assert all(r.rubric_scores for r in results)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_async_gemini_client_generate_text_payload(self):
+        """Test AsyncGeminiClient.generate_text builds a text request."""
+        from unittest.mock import AsyncMock
+
+        from plugin.lib.async_gemini_client import AsyncGeminiClient
+
+        client = AsyncGeminiClient(api_key="test-key")
+        response = MagicMock()
+        response.json.return_value = {
+            "candidates": [{"content": {"parts": [{"text": "ok"}]}}]
+        }
+
+        with patch.object(
+            client, "_retry_request", AsyncMock(return_value=response)
+        ) as mock_request:
+            text = await client.generate_text(
+                [{"text": "hi"}], model="vision-model", temperature=0.3
+            )
+
+        assert text == "ok"
+        args, kwargs = mock_request.call_args
+        assert args[1] == "models/vision-model:generateContent"
+        assert kwargs["json"]["generationConfig"] == {
+            "responseModalities": ["TEXT"],
+            "temperature": 0.3,
+        }